@@ -0,0 +1,1214 @@
+"""
+Motor de descarga de Centinela: características, información adicional, ficha PDF y JSON de cada SKU de CT.
+
+Procesa en una sola pasada los productos del catálogo general y los Toners sobre el mismo pool de
+trabajadores. Cada producto lleva una estrategia de resolución de URL: la URL construida con los datos
+del JSON (catálogo general) o la búsqueda por SKU en el sitio (Toners). Reemplaza a los antiguos
+Centinela_Descarga_Sin_Toners.py y Centinela_Descarga_Toners.py.
+"""
+
+import os
+import json
+import hashlib
+import unicodedata
+from abc import ABC, abstractmethod
+import pandas as pd
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import WebDriverException, SessionNotCreatedException, TimeoutException, NoSuchElementException
+import requests
+from lxml import html as lxml_html
+from urllib.parse import urljoin
+from datetime import datetime
+import mysql.connector
+from mysql.connector import Error
+import logging
+from dotenv import load_dotenv
+from sqlalchemy import create_engine
+import time
+import queue
+import threading
+
+# ============================================================
+# Cargar .env de configuración
+# ============================================================
+load_dotenv()
+
+from config import (
+    # Credenciales y conexión
+    DB_HOST, DB_USER, DB_PASSWORD, DB_NAME,
+    # Rutas dinámicas
+    DIRECTORIOS
+)
+from escritor_lotes import EscritorPorLotes
+from descarga_pdf import DescargadorPDF, encolar_pdf, completar_pdf
+from pagina_ct import leer_secciones_producto
+from sesion_ct import login, iniciar_sesion_navegador, obtener_chromedriver, obtener_sesion_http
+from indice_directorios import IndiceDirectorios, escribir_texto, tamano_kb
+
+# ============================================================
+# Verificar que no falte ninguna variable crítica
+# ============================================================
+required = ['DB_HOST','DB_USER','DB_PASSWORD','DB_NAME','CT_EMAIL_CENTINELA','CT_PASSWORD_CENTINELA']
+missing = [v for v in required if not os.getenv(v)]
+if missing:
+    print(f"Error: faltan variables de entorno: {', '.join(missing)}")
+    exit(1)
+
+# ============================================================
+# Definir rutas de entrada/salida usando DIRECTORIOS
+# ============================================================
+json_path        = DIRECTORIOS["BaseCompletaJSON"]
+json_toners_path = DIRECTORIOS["BasesTonersJSON"]
+
+base_save_path   = DIRECTORIOS["ArchivosOrganizados"]
+report_save_path = DIRECTORIOS["InformacionTablas"]
+
+# Timestamp para logs y reportes
+timestamp = datetime.now().strftime("%d-%m-%Y_%H-%M-%S")
+
+# Pool de navegadores: número de trabajadores, modo headless y reintentos por SKU ante caídas del navegador
+NUM_TRABAJADORES   = int(os.getenv("CENTINELA_TRABAJADORES", "3"))
+NAVEGADOR_HEADLESS = os.getenv("CENTINELA_HEADLESS", "1") == "1"
+MAX_INTENTOS_SKU   = 3
+
+# Perfil ligero: sólo interesa el DOM. Cada navegador se recicla tras N páginas para acotar su memoria.
+PAGINAS_POR_NAVEGADOR = int(os.getenv("CENTINELA_PAGINAS_POR_NAVEGADOR", "150"))
+URLS_BLOQUEADAS = [
+    # Imágenes y fuentes
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    # Dominios de terceros (analítica, anuncios, chat, fuentes)
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*googlesyndication.com*",
+    "*facebook.net*", "*facebook.com/tr*", "*hotjar.com*", "*clarity.ms*", "*tawk.to*",
+    "*fonts.googleapis.com*", "*fonts.gstatic.com*",
+]
+
+# Modo HTTP: las páginas se piden con requests (cookies de un login en Selenium) y se analizan con lxml.
+# Selenium sólo se usa como respaldo para páginas que no traen las secciones en el HTML del servidor.
+MODO_HTTP          = os.getenv("CENTINELA_MODO_HTTP", "1") == "1"
+TIMEOUT_HTTP       = 30
+
+# Los estados de InformacionTablas se escriben por lotes desde un hilo: cada N filas o cada T segundos
+TAMANO_LOTE_BD     = int(os.getenv("CENTINELA_LOTE_BD", "50"))
+INTERVALO_BD       = float(os.getenv("CENTINELA_INTERVALO_BD", "5"))
+
+# Refresco: además de los SKUs nuevos, cada corrida revisita los N SKUs con el scrapeo más antiguo,
+# durante REFRESCO_MINUTOS contados desde que se toma el primero (0 SKUs desactiva el refresco)
+REFRESCO_SKUS      = int(os.getenv("CENTINELA_REFRESCO_SKUS", "200"))
+REFRESCO_MINUTOS   = float(os.getenv("CENTINELA_REFRESCO_MINUTOS", "30"))
+
+# Resultados especiales de un trabajador además del status normal
+SKU_OMITIDO        = "omitido"        # refresco no iniciado porque se agotó su tiempo
+CLAVE_SIN_CAMBIOS  = "_sin_cambios"   # la página respondió 304: sólo se actualiza Ultimo_Scrapeo
+
+# ============================================================
+# Configurar logging
+# ============================================================
+logging.basicConfig(
+    filename=str(report_save_path / f"Script_Log_Descarga_{timestamp}.log"),
+    level=logging.DEBUG,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+# ============================================================
+# Funciones Utilitarias
+# ============================================================
+def sanitize_filename(name):
+    """Limpia cadenas para usarlas en nombres de archivo."""
+    name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii')
+    return ''.join(c for c in name if c.isalnum() or c in (' ', '-', '_')).rstrip()
+
+# ============================================================
+# Funciones de Login y Configuración de Selenium
+# ============================================================
+def setup_selenium(chromedriver_path=None, headless=False):
+    """
+    Configura Selenium con el chromedriver guardado en la ruta de Configuración, arranca Chrome
+    y deja la sesión iniciada (reutilizando las cookies guardadas si siguen vigentes).
+    El perfil es de scraping: carga "eager" (no espera imágenes ni hojas de estilo), sin imágenes
+    y con fuentes y dominios de terceros bloqueados por CDP.
+    """
+    try:
+        if not chromedriver_path:
+            chromedriver_path = obtener_chromedriver()
+
+        chrome_options = Options()
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        chrome_options.page_load_strategy = "eager"
+        if headless:
+            chrome_options.add_argument("--headless=new")
+            chrome_options.add_argument("--window-size=1920,1080")
+
+        try:
+            driver = webdriver.Chrome(service=Service(chromedriver_path), options=chrome_options)
+        except SessionNotCreatedException:
+            # El chromedriver guardado ya no corresponde a la versión de Chrome: se reinstala
+            logging.warning("El chromedriver guardado no es compatible con Chrome. Reinstalando.")
+            driver = webdriver.Chrome(service=Service(obtener_chromedriver(forzar=True)), options=chrome_options)
+        driver.set_page_load_timeout(60)
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": URLS_BLOQUEADAS})
+        except Exception as e:
+            logging.warning(f"No se pudo activar el bloqueo de recursos por CDP: {e}")
+
+        logging.info("Selenium configurado y navegador iniciado.")
+        iniciar_sesion_navegador(driver)
+        return driver
+
+    except Exception as e:
+        logging.error(f"Error al configurar Selenium: {e}")
+        print(f"Error al configurar Selenium: {e}")
+        return None
+
+# ============================================================
+# Funciones para Conexión y Manejo de MySQL
+# ============================================================
+def crear_conexion(host_name, user_name, user_password, db_name=None):
+    """Crea una conexión a MySQL y la retorna."""
+    conexion = None
+    try:
+        conexion = mysql.connector.connect(
+            host=host_name,
+            user=user_name,
+            passwd=user_password,
+            database=db_name
+        )
+        if db_name:
+            logging.info(f"Conexión exitosa a la base de datos '{db_name}'.")
+        else:
+            logging.info("Conexión exitosa a MySQL sin especificar base de datos.")
+    except Error as e:
+        logging.error(f"Error al conectar a MySQL: {e}")
+        print(f"Error al conectar a MySQL: {e}")
+    return conexion
+
+def crear_base_de_datos(conexion, db_name):
+    """Crea la base de datos si no existe."""
+    try:
+        cursor = conexion.cursor()
+        cursor.execute(f"CREATE DATABASE IF NOT EXISTS {db_name};")
+        conexion.commit()
+        cursor.close()
+        logging.info(f"Base de datos '{db_name}' verificada/creada correctamente.")
+    except Error as e:
+        logging.error(f"Error al crear la base de datos '{db_name}': {e}")
+        print(f"Error al crear la base de datos '{db_name}': {e}")
+
+def crear_tabla_informaciontablas(conexion):
+    """Crea la tabla 'InformacionTablas' con todos los atributos requeridos, si no existe."""
+    try:
+        cursor = conexion.cursor()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS InformacionTablas (
+                ID INT AUTO_INCREMENT PRIMARY KEY,
+                SKU VARCHAR(50) UNIQUE NOT NULL,
+                Fecha_Agregado DATETIME DEFAULT CURRENT_TIMESTAMP,
+                Caracteristicas_Encontradas TINYINT(1) DEFAULT 0,
+                Caracteristicas_Archivo_Leido TINYINT(1) DEFAULT 0,
+                Caracteristicas_Archivo_Tamano_KB FLOAT DEFAULT 0,
+                Caracteristicas_Convertidas_Archivo TINYINT(1),
+                Caracteristicas_Convertidas_Archivo_Leido TINYINT(1),
+                Caracteristicas_Convertidas_Archivo_Peso_KB FLOAT,
+                Caracteristicas_Convertidas_Archivo_Subido TINYINT(1),
+                Informacion_Adicional_Encontrada TINYINT(1) DEFAULT 0,
+                Informacion_Adicional_Archivo_Leido TINYINT(1) DEFAULT 0,
+                Informacion_Adicional_Tamano_KB FLOAT DEFAULT 0,
+                Informacion_Adicional_Convertidas_Archivo TINYINT(1),
+                Informacion_Adicional_Convertidas_Archivo_Leido TINYINT(1),
+                Informacion_Adicional_Convertidas_Archivo_Peso_KB FLOAT,
+                Informacion_Adicional_Convertidas_Archivo_Subido TINYINT(1),
+                PDF_Encontrado TINYINT(1) DEFAULT 0,
+                PDF_Archivo_Descargado TINYINT(1) DEFAULT 0,
+                PDF_Archivo_Tamano_KB FLOAT DEFAULT 0,
+                PDF_Archivo_Subido TINYINT(1),
+                JSON_Existente TINYINT(1) DEFAULT 0,
+                JSON_Archivo_Tamano_KB FLOAT DEFAULT 0,
+                Ultimo_Scrapeo DATETIME NULL,
+                Hash_Caracteristicas CHAR(64) NULL,
+                Hash_Info_Adicional CHAR(64) NULL,
+                ETag_Pagina VARCHAR(255) NULL
+            );
+        """)
+        conexion.commit()
+        cursor.close()
+        logging.info("Tabla 'InformacionTablas' creada/verificada correctamente.")
+    except Error as e:
+        logging.error(f"Error al crear la tabla 'InformacionTablas': {e}")
+        print(f"Error al crear la tabla 'InformacionTablas': {e}")
+
+# Columnas de frescura agregadas a tablas creadas antes de que existieran
+COLUMNAS_FRESCURA = {
+    'Ultimo_Scrapeo': 'DATETIME NULL',
+    'Hash_Caracteristicas': 'CHAR(64) NULL',
+    'Hash_Info_Adicional': 'CHAR(64) NULL',
+    'ETag_Pagina': 'VARCHAR(255) NULL'
+}
+
+def asegurar_columnas_frescura(conexion):
+    """Agrega a 'InformacionTablas' las columnas de frescura que falten."""
+    try:
+        cursor = conexion.cursor()
+        cursor.execute("""
+            SELECT COLUMN_NAME FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'InformacionTablas';
+        """)
+        existentes = {fila[0] for fila in cursor.fetchall()}
+        for columna, definicion in COLUMNAS_FRESCURA.items():
+            if columna not in existentes:
+                cursor.execute(f"ALTER TABLE InformacionTablas ADD COLUMN {columna} {definicion};")
+                logging.info(f"Columna '{columna}' agregada a 'InformacionTablas'.")
+        conexion.commit()
+        cursor.close()
+    except Error as e:
+        logging.error(f"Error al verificar las columnas de frescura: {e}")
+        print(f"Error al verificar las columnas de frescura: {e}")
+
+def get_existing_skus(conexion):
+    """Obtiene los SKUs ya registrados en la base de datos."""
+    skus = set()
+    try:
+        cursor = conexion.cursor()
+        cursor.execute("SELECT SKU FROM InformacionTablas;")
+        rows = cursor.fetchall()
+        cursor.close()
+        for row in rows:
+            skus.add(row[0])
+    except Exception as e:
+        logging.error(f"Error al obtener SKUs existentes: {e}")
+    return skus
+
+def obtener_skus_a_refrescar(conexion, catalogo, limite):
+    """
+    Devuelve [(SKU, ETag)] de los 'limite' SKUs registrados con el scrapeo más antiguo (los que nunca
+    tuvieron Ultimo_Scrapeo primero) que siguen en el catálogo.
+    """
+    seleccion = []
+    try:
+        cursor = conexion.cursor()
+        cursor.execute("""
+            SELECT SKU, ETag_Pagina FROM InformacionTablas
+            ORDER BY Ultimo_Scrapeo IS NOT NULL, Ultimo_Scrapeo ASC;
+        """)
+        for sku, etag in cursor.fetchall():
+            if sku in catalogo:
+                seleccion.append((sku, etag))
+                if len(seleccion) >= limite:
+                    break
+        cursor.close()
+    except Exception as e:
+        logging.error(f"Error al obtener SKUs a refrescar: {e}")
+    return seleccion
+
+def crear_tabla_urls_producto(conexion):
+    """Crea la tabla 'URLsProductoCT' (caché SKU -> URL real del producto), si no existe."""
+    try:
+        cursor = conexion.cursor()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS URLsProductoCT (
+                SKU VARCHAR(50) PRIMARY KEY,
+                URL VARCHAR(500) NOT NULL,
+                Fecha_Resuelta DATETIME DEFAULT CURRENT_TIMESTAMP
+            );
+        """)
+        conexion.commit()
+        cursor.close()
+        logging.info("Tabla 'URLsProductoCT' creada/verificada correctamente.")
+    except Error as e:
+        logging.error(f"Error al crear la tabla 'URLsProductoCT': {e}")
+        print(f"Error al crear la tabla 'URLsProductoCT': {e}")
+
+def cargar_urls_producto(conexion):
+    """Lee de una sola vez la caché de URLs resueltas: {SKU: URL}."""
+    urls = {}
+    try:
+        cursor = conexion.cursor()
+        cursor.execute("SELECT SKU, URL FROM URLsProductoCT;")
+        urls = dict(cursor.fetchall())
+        cursor.close()
+    except Exception as e:
+        logging.error(f"Error al leer la caché de URLs: {e}")
+    return urls
+
+def guardar_cambios_urls(conexion, estrategia):
+    """Persiste las URLs que la estrategia resolvió o invalidó desde la última llamada."""
+    nuevas, invalidadas = estrategia.cambios_pendientes()
+    if not nuevas and not invalidadas:
+        return
+    try:
+        cursor = conexion.cursor()
+        if nuevas:
+            cursor.executemany("""
+                INSERT INTO URLsProductoCT (SKU, URL, Fecha_Resuelta) VALUES (%s, %s, NOW())
+                ON DUPLICATE KEY UPDATE URL=VALUES(URL), Fecha_Resuelta=VALUES(Fecha_Resuelta);
+            """, list(nuevas.items()))
+        if invalidadas:
+            cursor.executemany("DELETE FROM URLsProductoCT WHERE SKU = %s;", [(sku,) for sku in invalidadas])
+        conexion.commit()
+        cursor.close()
+    except Exception as e:
+        logging.error(f"Error al guardar la caché de URLs: {e}")
+        print(f"Error al guardar la caché de URLs: {e}")
+
+# ============================================================
+# Funciones para Lectura y Filtrado de Archivos JSON
+# ============================================================
+def read_json_files(folder_path):
+    """Lee todos los archivos JSON en la carpeta indicada y retorna una lista de productos."""
+    products = []
+    if not os.path.exists(folder_path):
+        logging.error(f"La ruta {folder_path} no existe.")
+        print(f"La ruta {folder_path} no existe.")
+        return products
+    for file_name in os.listdir(folder_path):
+        if file_name.endswith(".json"):
+            file_full_path = os.path.join(folder_path, file_name)
+            try:
+                with open(file_full_path, "r", encoding="utf-8") as file:
+                    data = json.load(file)
+                    products.extend(data)
+            except Exception as e:
+                logging.error(f"Error al leer el archivo JSON {file_full_path}: {e}")
+                print(f"Error al leer el archivo JSON {file_full_path}: {e}")
+    return products
+
+def leer_catalogo(json_main_path, json_toners_path):
+    """
+    Lee los productos del JSON principal y de la carpeta de Toners y retorna {SKU: (producto, estrategia)}:
+    los Toners se resuelven con la búsqueda por SKU; el resto, con la URL construida.
+    """
+    main_products = read_json_files(json_main_path)
+    toners_products = read_json_files(json_toners_path)
+    toners_skus = set([p.get("clave") for p in toners_products if p.get("clave")])
+    catalogo = {}
+    for product in main_products:
+        sku = product.get("clave")
+        if not sku or sku in toners_skus:
+            continue
+        catalogo[sku] = (product, ESTRATEGIA_DIRECTA)
+    normales = len(catalogo)
+    for product in toners_products:
+        sku = product.get("clave")
+        if not sku or sku in catalogo:
+            continue
+        catalogo[sku] = (product, ESTRATEGIA_TONER)
+    logging.info(f"Catálogo: {normales} productos del flujo normal y {len(catalogo) - normales} Toners")
+    return catalogo
+
+# ============================================================
+# Funciones para Construcción de URLs y Creación de Directorios
+# ============================================================
+def build_product_url(product):
+    """
+    Construye la URL del producto usando los datos: categoría, subcategoría, marca, SKU e idProducto.
+    """
+    categoria = sanitize_filename(product['categoria']).replace(' ', '-')
+    subcategoria = sanitize_filename(product['subcategoria']).replace(' ', '-')
+    marca = sanitize_filename(product['marca'])
+    clave = sanitize_filename(product['clave'])
+    idProducto = product['idProducto']
+    url = f"https://ctonline.mx/{categoria}/{subcategoria}/{marca}/{clave}/{idProducto}"
+    logging.info(f"URL construida para SKU {clave}: {url}")
+    print(f"URL construida para SKU {clave}: {url}")
+    return url
+
+# ============================================================
+# Estrategias de Resolución de URL
+# ============================================================
+URL_BUSQUEDA = "https://ctonline.mx/buscar/productos?b={sku}"
+
+class PaginaNoEncontradaError(Exception):
+    """La URL del producto respondió 404."""
+
+class EstrategiaURL(ABC):
+    """
+    Resuelve la URL de la página de un producto. resolver_http lo intenta sin navegador y devuelve
+    None si no puede; resolver_navegador usa Selenium y devuelve None si el producto no se encontró.
+    """
+    nombre = "base"
+
+    def resolver_http(self, sesion, product):
+        return None
+
+    @abstractmethod
+    def resolver_navegador(self, driver, product):
+        """URL del producto resuelta con Selenium, o None si no se encontró."""
+
+    def invalidar(self, sku):
+        """
+        Descarta la URL del SKU si salió de la caché persistida. Devuelve True si se descartó (y conviene
+        resolver de nuevo); una URL recién resuelta nunca se descarta.
+        """
+        return False
+
+    def cambios_pendientes(self):
+        """({SKU: URL} nuevas, {SKU} invalidadas) desde la última llamada, para guardarlas en MySQL."""
+        return {}, set()
+
+class EstrategiaURLDirecta(EstrategiaURL):
+    """Catálogo general: la URL se construye con los datos del JSON del producto."""
+    nombre = "directa"
+
+    def resolver_http(self, sesion, product):
+        return build_product_url(product)
+
+    def resolver_navegador(self, driver, product):
+        return build_product_url(product)
+
+class EstrategiaBusquedaToner(EstrategiaURL):
+    """
+    Toners: la URL real se toma del primer resultado de la búsqueda por SKU. Las URLs resueltas se
+    guardan en la caché (tabla URLsProductoCT) y las siguientes corridas ya no abren la búsqueda.
+    Sólo las URLs cargadas de la caché al arrancar se pueden invalidar (404 o página sin secciones);
+    una URL recién encontrada se guarda aunque su página no tenga secciones, para no repetir la búsqueda.
+    """
+    nombre = "busqueda_toner"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._urls = {}
+        self._desde_cache = set()   # SKUs cuya URL viene de URLsProductoCT y no se ha vuelto a resolver
+        self._nuevas = {}
+        self._invalidadas = set()
+
+    def cargar_cache(self, urls):
+        with self._lock:
+            self._urls = dict(urls)
+            self._desde_cache = set(self._urls)
+
+    def _url_en_cache(self, sku):
+        with self._lock:
+            return self._urls.get(sku)
+
+    def _registrar(self, sku, product_url):
+        with self._lock:
+            self._urls[sku] = product_url
+            self._nuevas[sku] = product_url
+            self._invalidadas.discard(sku)
+
+    def invalidar(self, sku):
+        with self._lock:
+            if sku not in self._desde_cache:
+                return False
+            self._desde_cache.discard(sku)
+            self._urls.pop(sku, None)
+            self._invalidadas.add(sku)
+        logging.info(f"URL en caché del SKU {sku} invalidada.")
+        return True
+
+    def cambios_pendientes(self):
+        with self._lock:
+            nuevas, invalidadas = self._nuevas, self._invalidadas
+            self._nuevas, self._invalidadas = {}, set()
+        return nuevas, invalidadas
+
+    def resolver_http(self, sesion, product):
+        sku = product['clave']
+        product_url = self._url_en_cache(sku)
+        if product_url:
+            return product_url
+        respuesta = sesion.get(URL_BUSQUEDA.format(sku=sku), timeout=TIMEOUT_HTTP)
+        if respuesta.status_code != 200 or "/iniciar" in respuesta.url:
+            return None
+        enlaces = lxml_html.fromstring(respuesta.content).xpath(_xpath_clase("ct-description") + "//h6//a/@href")
+        if not enlaces:
+            return None
+        product_url = urljoin(respuesta.url, enlaces[0])
+        logging.info(f"URL extraída para SKU {sku} (búsqueda HTTP): {product_url}")
+        self._registrar(sku, product_url)
+        return product_url
+
+    def resolver_navegador(self, driver, product):
+        sku = product['clave']
+        product_url = self._url_en_cache(sku)
+        if product_url:
+            return product_url
+        driver.get(URL_BUSQUEDA.format(sku=sku))
+        logging.info(f"Buscando SKU {sku} en la URL de búsqueda.")
+        if sesion_expirada(driver):
+            raise SesionExpiradaError(f"Sesión expirada al buscar SKU {sku}")
+        try:
+            ct_description = WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.CLASS_NAME, "ct-description")))
+            product_url = ct_description.find_element(By.TAG_NAME, "h6").find_element(By.TAG_NAME, "a").get_attribute('href')
+        except (TimeoutException, NoSuchElementException) as e:
+            logging.error(f"Error al extraer URL para SKU {sku} en búsqueda: {e}")
+            print(f"Error al extraer URL para SKU {sku}: {e}")
+            return None
+        logging.info(f"URL extraída para SKU {sku} (alternativo): {product_url}")
+        print(f"URL extraída para SKU {sku}: {product_url}")
+        self._registrar(sku, product_url)
+        return product_url
+
+ESTRATEGIA_DIRECTA = EstrategiaURLDirecta()
+ESTRATEGIA_TONER   = EstrategiaBusquedaToner()
+
+def create_directories(indice, sku):
+    """
+    Crea la estructura de directorios para un SKU (sólo las carpetas que falten según el índice):
+      - Caracteristicas
+      - InformacionAdicional
+      - JSON
+      - PDF
+    """
+    subdirectories = ['Caracteristicas', 'InformacionAdicional', 'JSON', 'PDF']
+    try:
+        sku_path, creadas = indice.asegurar_carpetas(sku, subdirectories)
+        for subdir in creadas:
+            logging.info(f"Directorio creado: {os.path.join(sku_path, subdir)}")
+            print(f"Directorio creado: {os.path.join(sku_path, subdir)}")
+    except Exception as e:
+        sku_path = os.path.join(indice.base, sku)
+        logging.error(f"Error al crear los directorios de {sku_path}: {e}")
+        print(f"Error al crear los directorios de {sku_path}: {e}")
+    return sku_path
+
+# ============================================================
+# Funciones para Procesamiento de Productos (Flujo Normal)
+# ============================================================
+class SesionExpiradaError(Exception):
+    """El sitio redirigió a la página de inicio de sesión: hay que volver a hacer login."""
+
+def sesion_expirada(driver):
+    return "/iniciar" in driver.current_url
+
+def nuevo_status(sku):
+    """Diccionario de estado inicial de un SKU (todas las operaciones pendientes)."""
+    return {
+        "SKU": sku,
+        "Fecha_Agregado": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "Caracteristicas_Encontradas": False,
+        "Caracteristicas_Archivo_Leido": False,
+        "Caracteristicas_Archivo_Tamano_KB": 0,
+        "Informacion_Adicional_Encontrada": False,
+        "Informacion_Adicional_Archivo_Leido": False,
+        "Informacion_Adicional_Tamano_KB": 0,
+        "PDF_Encontrado": False,
+        "PDF_Archivo_Descargado": False,
+        "PDF_Archivo_Tamano_KB": 0,
+        "JSON_Existente": False,
+        "JSON_Archivo_Tamano_KB": 0,
+        "Ultimo_Scrapeo": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "Hash_Caracteristicas": None,
+        "Hash_Info_Adicional": None,
+        "ETag_Pagina": None
+    }
+
+def texto_seccion(contenido_html):
+    """
+    Texto de una sección con espacios normalizados. Los íconos de Sí/No cuentan por sus clases.
+    Es lo que se usa para la huella: el outerHTML de Selenium y el tostring de lxml del mismo contenido
+    difieren en el marcado (atributos, etiquetas vacías, entidades) pero no en este texto.
+    """
+    raiz = lxml_html.fragment_fromstring(contenido_html, create_parent="div")
+    for icono in raiz.iter("i"):
+        icono.text = f" [{' '.join(sorted(icono.get('class', '').split()))}] {icono.text or ''}"
+    return " ".join(raiz.text_content().split())
+
+def hash_seccion(contenido_html):
+    """Huella SHA-256 del texto normalizado de una sección."""
+    return hashlib.sha256(texto_seccion(contenido_html).encode("utf-8")).hexdigest()
+
+def guardar_caracteristicas(sku, sku_path, caracteristicas_html, status):
+    caracteristicas_file = os.path.join(sku_path, 'Caracteristicas', f"Caracteristicas_{sku}.html")
+    bytes_escritos = escribir_texto(caracteristicas_file, caracteristicas_html)
+    status["Caracteristicas_Encontradas"] = True
+    status["Caracteristicas_Archivo_Leido"] = True
+    status["Caracteristicas_Archivo_Tamano_KB"] = tamano_kb(bytes_escritos)
+    status["Hash_Caracteristicas"] = hash_seccion(caracteristicas_html)
+    logging.info(f"Características extraídas para SKU {sku} (Tamaño: {status['Caracteristicas_Archivo_Tamano_KB']} KB)")
+    print(f"Características extraídas para SKU {sku}.")
+
+def guardar_informacion_adicional(sku, sku_path, info_adicional_html, status):
+    info_adicional_file = os.path.join(sku_path, 'InformacionAdicional', f"InformacionAdicional_{sku}.html")
+    bytes_escritos = escribir_texto(info_adicional_file, info_adicional_html)
+    status["Informacion_Adicional_Encontrada"] = True
+    status["Informacion_Adicional_Archivo_Leido"] = True
+    status["Informacion_Adicional_Tamano_KB"] = tamano_kb(bytes_escritos)
+    status["Hash_Info_Adicional"] = hash_seccion(info_adicional_html)
+    logging.info(f"Información adicional extraída para SKU {sku} (Tamaño: {status['Informacion_Adicional_Tamano_KB']} KB)")
+    print(f"Información adicional extraída para SKU {sku}.")
+
+def guardar_json_producto(product, sku_path, status):
+    sku = product['clave']
+    try:
+        json_file_path = os.path.join(sku_path, 'JSON', f"{sku}.json")
+        bytes_escritos = escribir_texto(json_file_path, json.dumps(product, ensure_ascii=False, indent=4))
+        status["JSON_Existente"] = True
+        status["JSON_Archivo_Tamano_KB"] = tamano_kb(bytes_escritos)
+        logging.info(f"JSON guardado para SKU {sku} (Tamaño: {status['JSON_Archivo_Tamano_KB']} KB)")
+        print(f"JSON guardado para SKU {sku}.")
+    except Exception as e:
+        logging.warning(f"Error al guardar JSON para SKU {sku}: {e}")
+        print(f"Error al guardar JSON para SKU {sku}: {e}")
+
+def process_product(driver, product, sku_path, descargador, url):
+    """
+    Procesa un producto con Selenium:
+      - Navega a la URL resuelta por la estrategia del producto.
+      - Extrae las características (HTML del bloque "panel-body").
+      - Extrae la información adicional (elementos con la clase "ct-section").
+      - Encola la descarga del PDF (enlace que contenga "fichaTecnicaPDFDescargar") en el descargador.
+      - Guarda el JSON del producto.
+      - Retorna un diccionario con el estado de cada operación.
+    """
+    sku = product['clave']
+    status = nuevo_status(sku)
+    # Navegar a la URL del producto
+    try:
+        driver.get(url)
+        logging.info(f"Navegado a la URL para SKU {sku}.")
+        print(f"Navegado a la URL para SKU {sku}.")
+    except WebDriverException:
+        # Navegador caído o sin respuesta: lo maneja el trabajador (reinicia y reintenta)
+        raise
+    except Exception as e:
+        logging.error(f"Error al navegar a la URL para SKU {sku}: {e}")
+        print(f"Error al navegar a la URL para SKU {sku}: {e}")
+        return status
+
+    if sesion_expirada(driver):
+        raise SesionExpiradaError(f"Sesión expirada al abrir SKU {sku}")
+
+    # Una sola espera por página; las secciones ausentes no consumen tiempo adicional
+    secciones = leer_secciones_producto(driver, sku)
+
+    # Extraer Características
+    try:
+        if secciones["caracteristicas"]:
+            guardar_caracteristicas(sku, sku_path, secciones["caracteristicas"][0].get_attribute('outerHTML'), status)
+        else:
+            logging.info(f"SKU {sku} sin sección de características.")
+    except Exception as e:
+        logging.warning(f"Error al extraer características para SKU {sku}: {e}")
+        print(f"Error al extraer características para SKU {sku}: {e}")
+
+    # Extraer Información Adicional
+    try:
+        if secciones["informacion_adicional"]:
+            info_adicional_html = "".join([elem.get_attribute('outerHTML') for elem in secciones["informacion_adicional"]])
+            guardar_informacion_adicional(sku, sku_path, info_adicional_html, status)
+        else:
+            logging.info(f"SKU {sku} sin información adicional.")
+    except Exception as e:
+        logging.warning(f"Error al extraer información adicional para SKU {sku}: {e}")
+        print(f"Error al extraer información adicional para SKU {sku}: {e}")
+
+    # Descargar PDF
+    try:
+        if secciones["pdf"]:
+            encolar_pdf(descargador, sku, sku_path, secciones["pdf"][0].get_attribute('href'), status)
+        else:
+            logging.info(f"SKU {sku} sin ficha técnica PDF.")
+    except Exception as e:
+        logging.warning(f"Error al descargar PDF para SKU {sku}: {e}")
+        print(f"Error al descargar PDF para SKU {sku}: {e}")
+
+    # Guardar JSON del producto
+    guardar_json_producto(product, sku_path, status)
+
+    return status
+
+# ============================================================
+# Descarga por HTTP (sin navegador)
+# ============================================================
+def _xpath_clase(clase):
+    return f"//*[contains(concat(' ', normalize-space(@class), ' '), ' {clase} ')]"
+
+def clonar_sesion_http(sesion_base):
+    """Cada trabajador usa su propia sesión (requests.Session no es seguro entre hilos) con las mismas cookies."""
+    sesion = requests.Session()
+    sesion.headers.update(sesion_base.headers)
+    sesion.cookies.update(sesion_base.cookies)
+    return sesion
+
+def extraer_secciones_html(contenido, url_base):
+    """
+    Extrae del HTML del servidor el primer "panel-body", todos los "ct-section" (concatenados)
+    y el enlace absoluto al PDF, igual que el flujo con Selenium. Devuelve None en lo que no exista.
+    """
+    documento = lxml_html.fromstring(contenido)
+    paneles = documento.xpath(_xpath_clase("panel-body"))
+    secciones = documento.xpath(_xpath_clase("ct-section"))
+    enlaces_pdf = documento.xpath("//a[contains(@href, 'fichaTecnicaPDFDescargar')]/@href")
+    caracteristicas_html = lxml_html.tostring(paneles[0], encoding="unicode", with_tail=False) if paneles else None
+    info_adicional_html = "".join(lxml_html.tostring(seccion, encoding="unicode", with_tail=False) for seccion in secciones) if secciones else None
+    pdf_url = urljoin(url_base, enlaces_pdf[0]) if enlaces_pdf else None
+    return caracteristicas_html, info_adicional_html, pdf_url
+
+def process_product_http(sesion, product, sku_path, descargador, url, etag=None):
+    """
+    Procesa un producto pidiendo la página con requests. Devuelve el status, o None si la página
+    requiere el navegador (sesión redirigida al login, respuesta inesperada o sin secciones en el HTML).
+    Con el ETag del scrapeo anterior la petición es condicional: si la página no cambió (304) el status
+    sólo trae SKU y Ultimo_Scrapeo, marcado con CLAVE_SIN_CAMBIOS.
+    """
+    sku = product['clave']
+    encabezados = {"If-None-Match": etag} if etag else {}
+    respuesta = sesion.get(url, headers=encabezados, timeout=TIMEOUT_HTTP)
+    if respuesta.status_code == 304:
+        logging.info(f"Página de SKU {sku} sin cambios desde el último scrapeo.")
+        return {"SKU": sku, "Ultimo_Scrapeo": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), CLAVE_SIN_CAMBIOS: True}
+    if respuesta.status_code == 404:
+        raise PaginaNoEncontradaError(f"La URL del SKU {sku} respondió 404: {url}")
+    if respuesta.status_code != 200 or "/iniciar" in respuesta.url:
+        logging.info(f"HTTP no disponible para SKU {sku} (código {respuesta.status_code}, URL {respuesta.url}). Se usará Selenium.")
+        return None
+
+    caracteristicas_html, info_adicional_html, pdf_url = extraer_secciones_html(respuesta.content, respuesta.url)
+    if caracteristicas_html is None and info_adicional_html is None:
+        logging.info(f"La página de SKU {sku} no trae secciones en el HTML del servidor. Se usará Selenium.")
+        return None
+
+    status = nuevo_status(sku)
+    status["ETag_Pagina"] = respuesta.headers.get("ETag")
+    if caracteristicas_html is not None:
+        guardar_caracteristicas(sku, sku_path, caracteristicas_html, status)
+    else:
+        logging.warning(f"Error al extraer características para SKU {sku}: no se encontró 'panel-body'")
+    if info_adicional_html is not None:
+        guardar_informacion_adicional(sku, sku_path, info_adicional_html, status)
+    else:
+        logging.warning(f"Error al extraer información adicional para SKU {sku}: no se encontró 'ct-section'")
+    if pdf_url:
+        encolar_pdf(descargador, sku, sku_path, pdf_url, status)
+    guardar_json_producto(product, sku_path, status)
+    return status
+
+def procesar_por_http(sesion, estrategia, product, sku_path, descargador, etag=None):
+    """
+    Resuelve la URL y procesa el producto sin navegador. Si la URL de la caché ya no existe (404) se
+    invalida y se resuelve de nuevo una vez. Devuelve (url, status); status es None si hace falta Selenium.
+    """
+    url = None
+    for _ in range(2):
+        url = estrategia.resolver_http(sesion, product)
+        if not url:
+            return None, None
+        try:
+            return url, process_product_http(sesion, product, sku_path, descargador, url, etag)
+        except PaginaNoEncontradaError as e:
+            logging.warning(str(e))
+            if not estrategia.invalidar(product['clave']):
+                break
+    return url, None
+
+# ============================================================
+# Pool de Trabajadores Selenium
+# ============================================================
+class LimiteRefresco:
+    """
+    Plazo compartido de los SKUs a refrescar. Empieza a contar cuando un trabajador toma el primero,
+    así el tiempo que toman los SKUs nuevos (que van antes en la cola) no se descuenta del refresco.
+    """
+
+    def __init__(self, segundos):
+        self.segundos = segundos
+        self._fin = None
+        self._lock = threading.Lock()
+
+    def agotado(self):
+        """Inicia el plazo en la primera consulta y devuelve True si ya venció."""
+        with self._lock:
+            if self._fin is None:
+                self._fin = time.monotonic() + self.segundos
+                logging.info(f"Inicia el refresco de SKUs ({self.segundos / 60:.0f} minutos).")
+            return time.monotonic() > self._fin
+
+def cerrar_driver(driver):
+    try:
+        if driver:
+            driver.quit()
+    except Exception as e:
+        logging.warning(f"Error al cerrar un navegador del pool: {e}")
+
+def trabajador_selenium(id_trabajador, cola_skus, cola_resultados, chromedriver_path, descargador, sesion_base=None):
+    """
+    Toma productos de la cola compartida (cada uno con su estrategia de URL). Si hay sesión HTTP intenta
+    primero sin navegador; si la página lo requiere, la procesa con su propio navegador (con sesión iniciada),
+    que se arranca sólo cuando hace falta.
+    Si el navegador se cae se reinicia y el SKU se reintenta; si la sesión expiró se vuelve a hacer login.
+    Cada SKU produce exactamente un resultado (sku, status) en cola_resultados; status es None si falló.
+    Los PDF sólo se encolan en el descargador: el trabajador sigue con el siguiente SKU sin esperarlos.
+    """
+    driver = None
+    paginas_driver = 0
+    sesion = clonar_sesion_http(sesion_base) if sesion_base is not None else None
+    while True:
+        tarea = cola_skus.get()
+        if tarea is None:
+            break
+        product, sku_path, estrategia, etag_previo, limite = tarea
+        sku = product.get('clave')
+        if limite is not None and limite.agotado():
+            cola_resultados.put((sku, SKU_OMITIDO))
+            continue
+        product_status = None
+        url = None
+        if sesion is not None:
+            try:
+                print(f"[Trabajador {id_trabajador}] Procesando SKU por HTTP: {sku}")
+                url, product_status = procesar_por_http(sesion, estrategia, product, sku_path, descargador, etag_previo)
+            except Exception as e:
+                logging.warning(f"[Trabajador {id_trabajador}] Error HTTP con SKU {sku}: {e}. Se usará Selenium.")
+            if product_status is not None:
+                cola_resultados.put((sku, product_status))
+                continue
+        for intento in range(1, MAX_INTENTOS_SKU + 1):
+            if driver is None:
+                driver = setup_selenium(chromedriver_path, headless=NAVEGADOR_HEADLESS)
+                paginas_driver = 0
+                if driver is None:
+                    time.sleep(5)
+                    continue
+            paginas_driver += 1
+            try:
+                print(f"[Trabajador {id_trabajador}] Procesando SKU: {sku}")
+                logging.info(f"[Trabajador {id_trabajador}] Procesando SKU: {sku}")
+                url = url or estrategia.resolver_navegador(driver, product)
+                if not url:
+                    # Producto no encontrado en el sitio: se registra con todas las secciones en falso
+                    product_status = nuevo_status(sku)
+                    break
+                product_status = process_product(driver, product, sku_path, descargador, url)
+                sin_secciones = not (product_status["Caracteristicas_Encontradas"] or product_status["Informacion_Adicional_Encontrada"])
+                if sin_secciones and estrategia.invalidar(sku):
+                    # La URL de la caché ya no lleva a un producto con secciones: se vuelve a buscar una vez
+                    url = None
+                    continue
+                break
+            except SesionExpiradaError:
+                logging.warning(f"[Trabajador {id_trabajador}] Sesión expirada. Iniciando sesión de nuevo (intento {intento}).")
+                print(f"[Trabajador {id_trabajador}] Sesión expirada. Iniciando sesión de nuevo.")
+                login(driver)
+            except WebDriverException as e:
+                logging.error(f"[Trabajador {id_trabajador}] Navegador caído con SKU {sku} (intento {intento}): {e}")
+                print(f"[Trabajador {id_trabajador}] Navegador caído con SKU {sku}. Reiniciando navegador.")
+                cerrar_driver(driver)
+                driver = None
+            except Exception as e:
+                logging.error(f"[Trabajador {id_trabajador}] Error al procesar SKU {sku}: {e}")
+                print(f"[Trabajador {id_trabajador}] Error al procesar SKU {sku}: {e}")
+                break
+        cola_resultados.put((sku, product_status))
+        if driver is not None and paginas_driver >= PAGINAS_POR_NAVEGADOR:
+            # Reciclar el navegador acota la memoria que Chrome acumula con cada página
+            logging.info(f"[Trabajador {id_trabajador}] Reciclando navegador tras {paginas_driver} páginas.")
+            cerrar_driver(driver)
+            driver = None
+    cerrar_driver(driver)
+    logging.info(f"[Trabajador {id_trabajador}] Finalizado.")
+
+# ============================================================
+# Escritura de Estados en InformacionTablas
+# ============================================================
+CONSULTA_ESTADO_PRODUCTO = """
+    INSERT INTO InformacionTablas (
+        SKU, Fecha_Agregado, Caracteristicas_Encontradas, Caracteristicas_Archivo_Leido,
+        Caracteristicas_Archivo_Tamano_KB, Informacion_Adicional_Encontrada,
+        Informacion_Adicional_Archivo_Leido, Informacion_Adicional_Tamano_KB,
+        PDF_Encontrado, PDF_Archivo_Descargado, PDF_Archivo_Tamano_KB,
+        JSON_Existente, JSON_Archivo_Tamano_KB,
+        Ultimo_Scrapeo, Hash_Caracteristicas, Hash_Info_Adicional, ETag_Pagina
+    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        Caracteristicas_Convertidas_Archivo=IF(Hash_Caracteristicas IS NULL OR Hash_Caracteristicas <=> VALUES(Hash_Caracteristicas), Caracteristicas_Convertidas_Archivo, NULL),
+        Caracteristicas_Convertidas_Archivo_Leido=IF(Hash_Caracteristicas IS NULL OR Hash_Caracteristicas <=> VALUES(Hash_Caracteristicas), Caracteristicas_Convertidas_Archivo_Leido, NULL),
+        Caracteristicas_Convertidas_Archivo_Peso_KB=IF(Hash_Caracteristicas IS NULL OR Hash_Caracteristicas <=> VALUES(Hash_Caracteristicas), Caracteristicas_Convertidas_Archivo_Peso_KB, NULL),
+        Caracteristicas_Convertidas_Archivo_Subido=IF(Hash_Caracteristicas IS NULL OR Hash_Caracteristicas <=> VALUES(Hash_Caracteristicas), Caracteristicas_Convertidas_Archivo_Subido, NULL),
+        Informacion_Adicional_Convertidas_Archivo=IF(Hash_Info_Adicional IS NULL OR Hash_Info_Adicional <=> VALUES(Hash_Info_Adicional), Informacion_Adicional_Convertidas_Archivo, NULL),
+        Informacion_Adicional_Convertidas_Archivo_Leido=IF(Hash_Info_Adicional IS NULL OR Hash_Info_Adicional <=> VALUES(Hash_Info_Adicional), Informacion_Adicional_Convertidas_Archivo_Leido, NULL),
+        Informacion_Adicional_Convertidas_Archivo_Peso_KB=IF(Hash_Info_Adicional IS NULL OR Hash_Info_Adicional <=> VALUES(Hash_Info_Adicional), Informacion_Adicional_Convertidas_Archivo_Peso_KB, NULL),
+        Informacion_Adicional_Convertidas_Archivo_Subido=IF(Hash_Info_Adicional IS NULL OR Hash_Info_Adicional <=> VALUES(Hash_Info_Adicional), Informacion_Adicional_Convertidas_Archivo_Subido, NULL),
+        Caracteristicas_Encontradas=VALUES(Caracteristicas_Encontradas),
+        Caracteristicas_Archivo_Leido=VALUES(Caracteristicas_Archivo_Leido),
+        Caracteristicas_Archivo_Tamano_KB=VALUES(Caracteristicas_Archivo_Tamano_KB),
+        Informacion_Adicional_Encontrada=VALUES(Informacion_Adicional_Encontrada),
+        Informacion_Adicional_Archivo_Leido=VALUES(Informacion_Adicional_Archivo_Leido),
+        Informacion_Adicional_Tamano_KB=VALUES(Informacion_Adicional_Tamano_KB),
+        PDF_Encontrado=VALUES(PDF_Encontrado),
+        PDF_Archivo_Descargado=VALUES(PDF_Archivo_Descargado),
+        PDF_Archivo_Tamano_KB=VALUES(PDF_Archivo_Tamano_KB),
+        JSON_Existente=VALUES(JSON_Existente),
+        JSON_Archivo_Tamano_KB=VALUES(JSON_Archivo_Tamano_KB),
+        Ultimo_Scrapeo=VALUES(Ultimo_Scrapeo),
+        Hash_Caracteristicas=VALUES(Hash_Caracteristicas),
+        Hash_Info_Adicional=VALUES(Hash_Info_Adicional),
+        ETag_Pagina=VALUES(ETag_Pagina);
+"""
+
+# Página sin cambios (304): sólo se registra la visita
+CONSULTA_SIN_CAMBIOS = "UPDATE InformacionTablas SET Ultimo_Scrapeo = %s WHERE SKU = %s;"
+
+def tupla_estado_producto(product_status):
+    """Parámetros de CONSULTA_ESTADO_PRODUCTO para el estado de descarga de un SKU."""
+    return (
+        product_status["SKU"],
+        product_status["Fecha_Agregado"],
+        product_status["Caracteristicas_Encontradas"],
+        product_status["Caracteristicas_Archivo_Leido"],
+        product_status["Caracteristicas_Archivo_Tamano_KB"],
+        product_status["Informacion_Adicional_Encontrada"],
+        product_status["Informacion_Adicional_Archivo_Leido"],
+        product_status["Informacion_Adicional_Tamano_KB"],
+        product_status["PDF_Encontrado"],
+        product_status["PDF_Archivo_Descargado"],
+        product_status["PDF_Archivo_Tamano_KB"],
+        product_status["JSON_Existente"],
+        product_status["JSON_Archivo_Tamano_KB"],
+        product_status["Ultimo_Scrapeo"],
+        product_status["Hash_Caracteristicas"],
+        product_status["Hash_Info_Adicional"],
+        product_status["ETag_Pagina"]
+    )
+
+def tupla_sin_cambios(product_status):
+    return (product_status["Ultimo_Scrapeo"], product_status["SKU"])
+
+# ============================================================
+# Funciones para Reportes y Consultas a la Base de Datos
+# ============================================================
+def generate_csv_report(engine, report_save_path, timestamp):
+    """Genera un reporte CSV a partir de la tabla InformacionTablas."""
+    try:
+        query = """
+            SELECT 
+                SKU AS 'SKU',
+                Fecha_Agregado AS 'Fecha Agregado',
+                Caracteristicas_Encontradas AS 'Caracteristicas Encontradas',
+                Caracteristicas_Archivo_Leido AS 'Caracteristicas Archivo Leido',
+                Caracteristicas_Archivo_Tamano_KB AS 'Caracteristicas Archivo Tamano_KB',
+                Caracteristicas_Convertidas_Archivo AS 'Caracteristicas Convertidas Archivo',
+                Caracteristicas_Convertidas_Archivo_Leido AS 'Caracteristicas Convertidas Archivo Leido',
+                Caracteristicas_Convertidas_Archivo_Peso_KB AS 'Caracteristicas Convertidas Archivo Peso_KB',
+                Caracteristicas_Convertidas_Archivo_Subido AS 'Caracteristicas Convertidas Archivo Subido',
+                Informacion_Adicional_Encontrada AS 'Informacion Adicional Encontrada',
+                Informacion_Adicional_Archivo_Leido AS 'Informacion Adicional Archivo Leido',
+                Informacion_Adicional_Tamano_KB AS 'Informacion Adicional Tamano_KB',
+                Informacion_Adicional_Convertidas_Archivo AS 'Informacion Adicional Convertidas Archivo',
+                Informacion_Adicional_Convertidas_Archivo_Leido AS 'Informacion Adicional Convertidas Archivo Leido',
+                Informacion_Adicional_Convertidas_Archivo_Peso_KB AS 'Informacion Adicional Convertidas Archivo Peso_KB',
+                Informacion_Adicional_Convertidas_Archivo_Subido AS 'Informacion Adicional Convertidas Archivo Subido',
+                PDF_Encontrado AS 'PDF Encontrado',
+                PDF_Archivo_Descargado AS 'PDF Archivo Descargado',
+                PDF_Archivo_Tamano_KB AS 'PDF Archivo Tamano_KB',
+                PDF_Archivo_Subido AS 'PDF Archivo Subido',
+                JSON_Existente AS 'JSON Existente',
+                JSON_Archivo_Tamano_KB AS 'JSON Archivo Tamano_KB'
+            FROM InformacionTablas;
+        """
+        df = pd.read_sql(query, engine)
+        if df.empty:
+            logging.info("No hay datos para generar el reporte CSV.")
+            print("No hay datos para generar el reporte CSV.")
+            return
+        reporte_filename = f"ReporteDescargas_{timestamp}.csv"
+        reporte_path = os.path.join(report_save_path, reporte_filename)
+        df.to_csv(reporte_path, index=False, encoding='utf-8-sig')
+        logging.info(f"Reporte CSV generado en: {reporte_path}")
+        print(f"Reporte CSV generado en: {reporte_path}")
+    except Exception as e:
+        logging.error(f"Error al generar el reporte CSV: {e}")
+        print(f"Error al generar el reporte CSV: {e}")
+
+def mostrar_tabla(engine, limite=100):
+    """Muestra los primeros 'limite' registros de la tabla InformacionTablas."""
+    try:
+        query = f"SELECT * FROM InformacionTablas LIMIT {limite};"
+        df = pd.read_sql(query, engine)
+        if df.empty:
+            logging.info("La tabla 'InformacionTablas' está vacía.")
+            print("La tabla 'InformacionTablas' está vacía.")
+        else:
+            print(df)
+            logging.info(f"Mostrando los primeros {limite} registros de 'InformacionTablas'.")
+    except Exception as e:
+        logging.error(f"Error al consultar la tabla: {e}")
+        print(f"Error al consultar la tabla: {e}")
+
+def generar_reporte_resumen(conexion, report_save_path, timestamp, nuevos_skus):
+    """Genera un resumen del proceso basado en la información almacenada en la tabla."""
+    try:
+        total_skus = len(nuevos_skus) if nuevos_skus else 0
+        nuevos_count = len(nuevos_skus)
+        resumen = f"""
+===== Resumen del Proceso =====
+
+Total de SKUs Procesados: {total_skus}
+Total de SKUs Nuevos: {nuevos_count}
+
+==============================
+"""
+        resumen_path = os.path.join(report_save_path, f"Reporte_Descargas_{timestamp}.txt")
+        with open(resumen_path, "w", encoding="utf-8") as file:
+            file.write(resumen)
+        print(resumen)
+        logging.info(f"Resumen del proceso guardado en: {resumen_path}")
+    except Exception as e:
+        logging.error(f"Error al generar el reporte resumen: {e}")
+        print(f"Error al generar el reporte resumen: {e}")
+
+# ============================================================
+# Función Principal
+# ============================================================
+def main():
+    logging.info("Iniciando el proceso de descarga y procesamiento de SKUs.")
+    print("Iniciando el proceso de descarga y procesamiento de SKUs.")
+    
+    # Conexión general para crear la base de datos
+    conexion_general = crear_conexion(DB_HOST, DB_USER, DB_PASSWORD)
+    if not conexion_general:
+        logging.error("No se pudo establecer conexión a MySQL. Terminando el proceso.")
+        print("No se pudo establecer conexión a MySQL. Terminando el proceso.")
+        return
+    crear_base_de_datos(conexion_general, DB_NAME)
+    
+    # Crear el engine de SQLAlchemy
+    engine = create_engine(f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}/{DB_NAME}")
+    if not engine:
+        logging.error("No se pudo crear el engine de SQLAlchemy. Terminando el proceso.")
+        print("No se pudo crear el engine de SQLAlchemy. Terminando el proceso.")
+        return
+    
+    # Conexión específica a la base de datos
+    conexion = crear_conexion(DB_HOST, DB_USER, DB_PASSWORD, DB_NAME)
+    if not conexion:
+        logging.error("No se pudo conectar a la base de datos. Terminando el proceso.")
+        print("No se pudo conectar a la base de datos. Terminando el proceso.")
+        return
+    crear_tabla_informaciontablas(conexion)
+    asegurar_columnas_frescura(conexion)
+    crear_tabla_urls_producto(conexion)
+    
+    # Obtener SKUs ya procesados de la base de datos
+    existing_skus = get_existing_skus(conexion)
+    
+    try:
+        # Catálogo general y Toners, cada producto con su estrategia de URL
+        catalogo = leer_catalogo(json_path, json_toners_path)
+        ESTRATEGIA_TONER.cargar_cache(cargar_urls_producto(conexion))
+
+        # Primero los SKUs nuevos; después los más antiguos en refrescar, sólo mientras quede tiempo de refresco
+        limite_refresco = LimiteRefresco(REFRESCO_MINUTOS * 60)
+        tareas = [(product, estrategia, None, None)
+                  for sku, (product, estrategia) in catalogo.items() if sku not in existing_skus]
+        if REFRESCO_SKUS > 0:
+            for sku, etag in obtener_skus_a_refrescar(conexion, catalogo, REFRESCO_SKUS):
+                product, estrategia = catalogo[sku]
+                tareas.append((product, estrategia, etag, limite_refresco))
+        logging.info(f"SKUs nuevos: {sum(1 for t in tareas if t[3] is None)}; a refrescar: {sum(1 for t in tareas if t[3] is not None)}")
+
+        nuevos_skus = []
+        refrescados = 0
+        sin_cambios = 0
+        omitidos = 0
+
+        if tareas:
+            # chromedriver se resuelve una sola vez; cada trabajador arranca su navegador sólo si lo necesita
+            chromedriver_path = obtener_chromedriver()
+            # Las cookies guardadas alimentan las descargas de PDF y, en modo HTTP, las sesiones de todos
+            # los trabajadores; sólo se abre un navegador para hacer login si ya expiraron
+            sesion_http = obtener_sesion_http(lambda: setup_selenium(chromedriver_path, headless=NAVEGADOR_HEADLESS))
+            sesion_base = sesion_http if MODO_HTTP else None
+            descargador = DescargadorPDF(sesion_http)
+            cola_skus = queue.Queue()
+            cola_resultados = queue.Queue()
+            # ArchivosOrganizados se lista una vez; sólo se crean las carpetas que falten
+            indice = IndiceDirectorios(base_save_path)
+            for product, estrategia, etag_previo, limite in tareas:
+                # Crear directorios para el SKU
+                sku_path = create_directories(indice, product.get('clave'))
+                cola_skus.put((product, sku_path, estrategia, etag_previo, limite))
+
+            num_trabajadores = max(1, min(NUM_TRABAJADORES, len(tareas)))
+            for _ in range(num_trabajadores):
+                cola_skus.put(None)  # Una señal de fin por trabajador
+            trabajadores = [
+                threading.Thread(target=trabajador_selenium, args=(i, cola_skus, cola_resultados, chromedriver_path, descargador, sesion_base), daemon=True)
+                for i in range(1, num_trabajadores + 1)
+            ]
+            for trabajador in trabajadores:
+                trabajador.start()
+            logging.info(f"Pool iniciado con {num_trabajadores} navegadores para {len(tareas)} SKUs.")
+            print(f"Pool iniciado con {num_trabajadores} navegadores para {len(tareas)} SKUs.")
+
+            # Los estados se escriben por lotes desde un hilo con su propia conexión MySQL
+            escritor_estados = EscritorPorLotes(
+                lambda: crear_conexion(DB_HOST, DB_USER, DB_PASSWORD, DB_NAME),
+                CONSULTA_ESTADO_PRODUCTO, tupla_estado_producto,
+                tamano_lote=TAMANO_LOTE_BD, intervalo=INTERVALO_BD, nombre="InformacionTablas",
+                ruta_fallidas=os.path.join(report_save_path, f"Filas_No_Escritas_InformacionTablas_{timestamp}.jsonl")
+            )
+            escritor_visitas = EscritorPorLotes(
+                lambda: crear_conexion(DB_HOST, DB_USER, DB_PASSWORD, DB_NAME),
+                CONSULTA_SIN_CAMBIOS, tupla_sin_cambios,
+                tamano_lote=TAMANO_LOTE_BD, intervalo=INTERVALO_BD, nombre="Ultimo_Scrapeo",
+                ruta_fallidas=os.path.join(report_save_path, f"Filas_No_Escritas_Ultimo_Scrapeo_{timestamp}.jsonl")
+            )
+            try:
+                for _ in range(len(tareas)):
+                    sku, product_status = cola_resultados.get()
+                    guardar_cambios_urls(conexion, ESTRATEGIA_TONER)
+                    if product_status is SKU_OMITIDO:
+                        omitidos += 1
+                        continue
+                    if product_status is None:
+                        logging.warning(f"No se pudo procesar SKU {sku}")
+                        print(f"No se pudo procesar SKU {sku}")
+                        continue
+                    if product_status.get(CLAVE_SIN_CAMBIOS):
+                        escritor_visitas.agregar(product_status)
+                        sin_cambios += 1
+                        continue
+                    # La fila se encola cuando termina la descarga del PDF del SKU
+                    completar_pdf(product_status)
+                    try:
+                        escritor_estados.agregar(product_status)
+                        if sku in existing_skus:
+                            refrescados += 1
+                        else:
+                            nuevos_skus.append(sku)
+                    except Exception as e:
+                        logging.error(f"Error al insertar datos para SKU {sku}: {e}")
+                        print(f"Error al insertar datos para SKU {sku}: {e}")
+                        continue
+
+                for trabajador in trabajadores:
+                    trabajador.join()
+                descargador.cerrar()
+            finally:
+                # Escribe el último lote antes de generar los reportes
+                escritor_estados.cerrar()
+                escritor_visitas.cerrar()
+            logging.info(f"Refresco: {refrescados} SKUs actualizados, {sin_cambios} sin cambios, {omitidos} pendientes por tiempo.")
+            print(f"Refresco: {refrescados} SKUs actualizados, {sin_cambios} sin cambios, {omitidos} pendientes por tiempo.")
+            logging.info("Navegadores Selenium cerrados.")
+            print("Navegadores Selenium cerrados.")
+        
+        generate_csv_report(engine, report_save_path, timestamp)
+        mostrar_tabla(engine, limite=10)
+        generar_reporte_resumen(conexion, report_save_path, timestamp, nuevos_skus)
+    except Exception as e:
+        logging.error(f"Error durante la ejecución del proceso: {e}")
+        print(f"Error durante la ejecución del proceso: {e}")
+    finally:
+        try:
+            if conexion.is_connected():
+                conexion.close()
+                logging.info("Conexión a MySQL cerrada al finalizar el proceso.")
+                print("Conexión a MySQL cerrada al finalizar el proceso.")
+        except Exception as e:
+            logging.error(f"Error al cerrar la conexión a MySQL: {e}")
+            print(f"Error al cerrar la conexión a MySQL: {e}")
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,6 @@ from mysql.connector import pooling
 from pathlib import Path
 from dotenv import load_dotenv
 from datetime import datetime
-from bs4 import BeautifulSoup  # Para parsear HTML
 import time
 import concurrent.futures
 import threading
@@ -23,6 +22,8 @@ from config import (
     CT_EMAIL_CENTINELA, CT_PASSWORD_CENTINELA,
     DIRECTORIOS
 )
+from parser_html import leer_html
+from especificaciones_sku import fragmento_vigente
 
 # Si tu config.py no exporta estas dos, añádelas también allí:
 SHOPIFY_SHOP_NAME   = os.getenv("SHOPIFY_SHOP_NAME")
@@ -51,6 +52,7 @@ if missing:
 json_toners_path = DIRECTORIOS["BasesTonersJSON"]
 base_save_path   = DIRECTORIOS["ArchivosOrganizados"]
 report_save_path = DIRECTORIOS["InformacionTablas"]
+INPUT_BASE_DIR   = Path(DIRECTORIOS["Conversion"])
 
 # =========================
 # Configuración de Shopify
@@ -356,8 +358,7 @@ def extraer_contenido_html_completo(html_path, main_selector, content_selector):
     Extrae el contenido completo del acordeón, incluyendo el encabezado principal y el contenido de los subacordeones.
     """
     try:
-        with open(html_path, 'r', encoding='utf-8') as f:
-            soup = BeautifulSoup(f, 'html.parser')
+        soup = leer_html(html_path)
         main_element = soup.select_one(main_selector)
         content_element = soup.select_one(content_selector)
         if main_element and content_element:
@@ -371,6 +372,17 @@ def extraer_contenido_html_completo(html_path, main_selector, content_selector):
         logging.error(f"Error al extraer contenido completo de {html_path}: {e}")
         return ""
 
+def obtener_contenido_metafield(sku_code, seccion, html_path, main_selector, content_selector):
+    """
+    Devuelve el contenido del metafield guardado por la conversión en Especificaciones_{sku}.json.
+    Sólo se analiza el HTML si el JSON no existe o ya no corresponde al archivo convertido.
+    """
+    contenido = fragmento_vigente(INPUT_BASE_DIR, sku_code, seccion, html_path)
+    if contenido is not None:
+        logging.info(f"Contenido de '{seccion}' tomado de Especificaciones_{sku_code}.json.")
+        return contenido
+    return extraer_contenido_html_completo(html_path, main_selector, content_selector)
+
 # =========================
 # Funciones para Actualizar la Base de Datos
 # =========================
@@ -519,7 +531,9 @@ def procesar_sku(db_pool, sku, sku_to_product_id, writer_lock, skus_procesados,
         if necesita_subir_caracteristicas:
             if caracteristicas_path.is_file():
                 logging.info(f"Archivo de características encontrado para SKU {sku_code}.")
-                contenido_caracteristicas = extraer_contenido_html_completo(
+                contenido_caracteristicas = obtener_contenido_metafield(
+                    sku_code=sku_code,
+                    seccion="caracteristicas",
                     html_path=caracteristicas_path,
                     main_selector="div.caracter-main",
                     content_selector="div.caracter-main-content"
@@ -550,7 +564,9 @@ def procesar_sku(db_pool, sku, sku_to_product_id, writer_lock, skus_procesados,
         if necesita_subir_informacion:
             if informacion_path.is_file():
                 logging.info(f"Archivo de información adicional encontrado para SKU {sku_code}.")
-                contenido_informacion = extraer_contenido_html_completo(
+                contenido_informacion = obtener_contenido_metafield(
+                    sku_code=sku_code,
+                    seccion="info_adicional",
                     html_path=informacion_path,
                     main_selector="div.info-adicional-main",
                     content_selector="div.info-adicional-main-content"
@@ -29,10 +29,8 @@ while True:
 
     for prog in [
         "DescargaJSON_2.2.4.py",
-        "Centinela_Descarga_Sin_Toners.py",
-        "Centinela_Descarga_Toners.py",
-        "Conversion_InfoAdicional_1.1.py",
-        "Conversion_Caracteristicas_1.2.py",
+        "Centinela_Descarga.py",
+        "Conversion_HTML_1.0.py",
         "Centinela_SubirPDF.py",
         "ShopifyImagenesFinalCompleto_2.3.4.py",
         "ShopifyActualizarProductos_1.4.2.py",
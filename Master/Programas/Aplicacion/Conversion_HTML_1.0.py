@@ -0,0 +1,714 @@
+"""
+Conversión de Características e Información Adicional en una sola pasada.
+
+Reemplaza a Conversion_Caracteristicas_1.2.py y Conversion_InfoAdicional_1.1.py: el catálogo se
+lee una vez, se usa una sola sesión de base de datos y la carpeta de cada SKU en ArchivosOrganizados
+se visita una vez para generar ambas salidas en Conversion/{sku}.
+
+Importar este módulo no conecta a la base de datos ni configura logging: eso lo hace inicializar(),
+que main() llama al arrancar. Así los procesos del pool de conversión, que vuelven a importar el
+script principal, arrancan sin abrir conexiones. El análisis y renderizado están en los módulos
+nucleo_*, que se pueden importar y medir por separado.
+"""
+
+import os
+import csv
+import json
+from sqlalchemy import create_engine, Column, Integer, String, Float, Boolean, ForeignKey
+from sqlalchemy.orm import sessionmaker, declarative_base, relationship
+from datetime import datetime
+import logging
+from dotenv import load_dotenv
+from pathlib import Path
+from config import DIRECTORIOS
+from manifiesto_conversion import ManifiestoConversion, version_plantilla
+from conversion_paralela import convertir_en_paralelo
+from nucleo_conversion import convertir_sku
+from especificaciones_sku import actualizar_especificaciones
+from indice_directorios import IndiceDirectorios, estado_archivo, escribir_archivo, tamano_kb
+
+# =========================
+# Rutas dinámicas
+# =========================
+JSON_DIR                      = Path(DIRECTORIOS["BaseCompletaJSON"])
+ARCHIVOS_ORGANIZADOS          = Path(DIRECTORIOS["ArchivosOrganizados"])
+CONVERSION_DIR                = Path(DIRECTORIOS["Conversion"])
+TEMPLATE_CARACTERISTICAS_PATH = Path(DIRECTORIOS["Plantillas"]) / "PlantillaCaracteristicas.html"
+TEMPLATE_INFO_ADICIONAL_PATH  = Path(DIRECTORIOS["Plantillas"]) / "PlantillaInfoAdicional.html"
+OUTPUT_REPORT_PATH            = Path(DIRECTORIOS["InformacionTablas"])
+
+# =========================
+# Rutas de salida con timestamp
+# =========================
+timestamp                         = datetime.now().strftime("%d-%m-%Y_%H-%M-%S")
+CSV_CARACTERISTICAS_PATH          = OUTPUT_REPORT_PATH / f"Reporte_Caracteristicas_{timestamp}.csv"
+RESUMEN_CARACTERISTICAS_PATH      = OUTPUT_REPORT_PATH / f"Reporte_Caracteristicas_{timestamp}.txt"
+CSV_INFO_ADICIONAL_PATH           = OUTPUT_REPORT_PATH / f"Reporte_InfoAdicional_{timestamp}.csv"
+RESUMEN_INFO_ADICIONAL_PATH       = OUTPUT_REPORT_PATH / f"Reporte_InfoAdicional_{timestamp}.txt"
+LOG_FILE_PATH                     = OUTPUT_REPORT_PATH / f"Script_Log_Conversion_{timestamp}.log"
+
+# Subir estos valores si cambia la lógica de conversión, para que se reconviertan todos los SKUs
+# (1.3 / 1.2: se genera también Especificaciones_{sku}.json)
+VERSION_CARACTERISTICAS = "1.3"
+VERSION_INFO_ADICIONAL  = "1.2"
+# SKUs convertidos por cada commit en la base de datos
+TAMANO_LOTE_BD = int(os.getenv("CONVERSION_LOTE_BD", "100"))
+
+# =========================
+# Configuración de la Base de Datos
+# =========================
+
+# Definición de la Base Declarativa
+Base = declarative_base()
+
+class InformacionTabla(Base):
+    __tablename__ = 'informaciontablas'
+
+    ID = Column(Integer, primary_key=True, autoincrement=True)
+    SKU = Column(String(50), unique=True, nullable=False)
+    Caracteristicas_Encontradas = Column(Boolean, default=False, nullable=True)
+    Caracteristicas_Convertidas_Archivo = Column(Boolean, default=False, nullable=True)
+    Caracteristicas_Convertidas_Archivo_Leido = Column(Boolean, default=False, nullable=True)
+    Caracteristicas_Convertidas_Archivo_Peso_KB = Column(Float, default=0.0, nullable=True)
+    Informacion_Adicional_Archivo_Leido = Column(Boolean, default=False, nullable=True)
+    Informacion_Adicional_Convertidas_Archivo = Column(Boolean, default=False, nullable=True)
+    Informacion_Adicional_Convertidas_Archivo_Leido = Column(Boolean, default=False, nullable=True)
+    Informacion_Adicional_Convertidas_Archivo_Peso_KB = Column(Float, default=0.0, nullable=True)
+    # Añade otras columnas si es necesario
+
+    # Relaciones con las tablas de cada sección
+    caracteristicas = relationship("CaracteristicasTabla", back_populates="informacion", uselist=False)
+    informacion_adicional = relationship("InformacionAdicional", back_populates="informacion", uselist=False)
+
+class CaracteristicasTabla(Base):
+    __tablename__ = 'CaracteristicasTabla'
+
+    ID = Column(Integer, ForeignKey('informaciontablas.ID'), primary_key=True)  # Clave Foránea a InformacionTabla.ID
+    SKU = Column(String(50), nullable=False)
+    Caracteristicas_Convertidas_Archivo = Column(Integer, default=0, nullable=True)
+    Caracteristicas_Convertidas_Archivo_Leido = Column(Integer, default=0, nullable=True)
+    Caracteristicas_Convertidas_Archivo_Peso_KB = Column(Float, default=0.0, nullable=True)
+
+    # Relación con InformacionTabla
+    informacion = relationship("InformacionTabla", back_populates="caracteristicas")
+
+class InformacionAdicional(Base):
+    __tablename__ = 'informacionadicional'
+
+    ID = Column(Integer, ForeignKey('informaciontablas.ID'), primary_key=True)
+    SKU = Column(String(50), nullable=False)
+    Informacion_Adicional_Convertidas_Archivo = Column(Boolean, default=False, nullable=True)
+    Informacion_Adicional_Convertidas_Archivo_Leido = Column(Boolean, default=False, nullable=True)
+    Informacion_Adicional_Convertidas_Archivo_Peso_KB = Column(Float, default=0.0, nullable=True)
+
+    # Relación con InformacionTabla
+    informacion = relationship("InformacionTabla", back_populates="informacion_adicional")
+
+# =========================
+# Inicialización
+# =========================
+
+def inicializar():
+    """
+    Carga el .env, configura el logging en LOG_FILE_PATH y conecta a la base de datos.
+    Devuelve la sesión de SQLAlchemy, o None si faltan variables de entorno o falla la conexión.
+    """
+    env_path = Path(__file__).parent / '.env'
+    load_dotenv(dotenv_path=env_path)
+
+    required = ['DB_HOST','DB_USER','DB_PASSWORD','DB_NAME']
+    missing = [v for v in required if not os.getenv(v)]
+    if missing:
+        print(f"Error: faltan variables de entorno: {', '.join(missing)}")
+        return None
+    DB_HOST     = os.getenv('DB_HOST')
+    DB_USER     = os.getenv('DB_USER')
+    DB_PASSWORD = os.getenv('DB_PASSWORD')
+    DB_NAME     = os.getenv('DB_NAME')
+
+    OUTPUT_REPORT_PATH.mkdir(parents=True, exist_ok=True)
+    logging.basicConfig(
+        filename=str(LOG_FILE_PATH),
+        level=logging.DEBUG,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+    # Creación de la cadena de conexión
+    connection_string = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}/{DB_NAME}"
+
+    # Creación del engine y sesión de SQLAlchemy
+    try:
+        engine = create_engine(connection_string)
+        Session = sessionmaker(bind=engine)
+        session = Session()
+        Base.metadata.create_all(engine)
+        logging.info("Conexión a la base de datos MySQL establecida correctamente.")
+        print("Conexión a la base de datos MySQL establecida correctamente.")
+        return session
+    except Exception as e:
+        logging.error(f"Error al conectar con la base de datos o crear tablas: {e}")
+        print(f"Error al conectar con la base de datos o crear tablas: {e}")
+        return None
+
+# =========================
+# Funciones Auxiliares
+# =========================
+
+def cargar_jsons(ruta_directorio):
+    """Carga todos los archivos JSON en el directorio especificado y devuelve una lista de productos."""
+    productos = []
+    try:
+        archivos_json = [archivo for archivo in os.listdir(ruta_directorio) if archivo.lower().endswith('.json')]
+    except FileNotFoundError:
+        print(f"No se encontró el directorio: {ruta_directorio}")
+        logging.error(f"No se encontró el directorio: {ruta_directorio}")
+        return productos
+
+    if not archivos_json:
+        print(f"No se encontraron archivos JSON en el directorio: {ruta_directorio}")
+        logging.warning(f"No se encontraron archivos JSON en el directorio: {ruta_directorio}")
+        return productos
+
+    for archivo_json in archivos_json:
+        ruta_json = os.path.join(ruta_directorio, archivo_json)
+        try:
+            with open(ruta_json, 'r', encoding='utf-8') as file:
+                datos = json.load(file)
+                if isinstance(datos, list):
+                    productos.extend(datos)
+                elif isinstance(datos, dict):
+                    # Si el JSON contiene un solo producto
+                    productos.append(datos)
+                else:
+                    print(f"Formato desconocido en el archivo JSON: {ruta_json}")
+                    logging.warning(f"Formato desconocido en el archivo JSON: {ruta_json}")
+        except json.JSONDecodeError as e:
+            print(f"Error al decodificar el archivo JSON {ruta_json}: {e}")
+            logging.error(f"Error al decodificar el archivo JSON {ruta_json}: {e}")
+        except Exception as e:
+            print(f"Error al cargar el archivo JSON {ruta_json}: {e}")
+            logging.error(f"Error al cargar el archivo JSON {ruta_json}: {e}")
+
+    logging.info(f"Total de productos cargados desde JSONs: {len(productos)}")
+    return productos
+
+def obtener_tamano_kb(ruta_archivo):
+    """Devuelve el tamaño del archivo en kilobytes."""
+    estado = estado_archivo(ruta_archivo)
+    return tamano_kb(estado.st_size) if estado else 0
+
+def obtener_registros_informacion(session):
+    """
+    Obtiene {SKU: (ID, Informacion_Adicional_Archivo_Leido, Informacion_Adicional_Convertidas_Archivo)}
+    de 'informaciontablas' con una sola consulta.
+    """
+    try:
+        filas = session.query(
+            InformacionTabla.SKU,
+            InformacionTabla.ID,
+            InformacionTabla.Informacion_Adicional_Archivo_Leido,
+            InformacionTabla.Informacion_Adicional_Convertidas_Archivo
+        ).all()
+        registros = {fila.SKU: (fila.ID, fila.Informacion_Adicional_Archivo_Leido, fila.Informacion_Adicional_Convertidas_Archivo) for fila in filas}
+        logging.info(f"Total de SKUs existentes en la base de datos: {len(registros)}")
+        print(f"Total de SKUs existentes en la base de datos: {len(registros)}")
+        return registros
+    except Exception as e:
+        logging.error(f"Error al obtener SKUs existentes: {e}")
+        print(f"Error al obtener SKUs existentes: {e}")
+        return {}
+
+def obtener_ids_existentes(session, modelo):
+    """
+    Obtiene el conjunto de IDs que ya tienen registro en la tabla del modelo indicado.
+    """
+    try:
+        return {fila[0] for fila in session.query(modelo.ID).all()}
+    except Exception as e:
+        logging.error(f"Error al obtener los registros de '{modelo.__tablename__}': {e}")
+        return set()
+
+def escribir_caracteristicas(session, lote, ids_por_sku, ids_caracteristicas):
+    """
+    Agrega a la sesión, con operaciones masivas, un lote de conversiones [(sku, peso_kb)] en
+    'informaciontablas' y 'CaracteristicasTabla'. No hace commit. Devuelve los registros insertados
+    en 'informaciontablas' (con su ID) y los IDs nuevos en 'CaracteristicasTabla'.
+    """
+    principales_nuevos = []
+    principales_existentes = []
+    for sku, peso_kb in lote:
+        datos = {
+            'SKU': sku,
+            'Caracteristicas_Encontradas': True,
+            'Caracteristicas_Convertidas_Archivo': True,
+            'Caracteristicas_Convertidas_Archivo_Leido': True,
+            'Caracteristicas_Convertidas_Archivo_Peso_KB': peso_kb
+        }
+        if sku in ids_por_sku:
+            datos['ID'] = ids_por_sku[sku]
+            principales_existentes.append(datos)
+        else:
+            principales_nuevos.append(datos)
+
+    if principales_nuevos:
+        # return_defaults deja en cada diccionario el ID autoincremental asignado
+        session.bulk_insert_mappings(InformacionTabla, principales_nuevos, return_defaults=True)
+    if principales_existentes:
+        session.bulk_update_mappings(InformacionTabla, principales_existentes)
+
+    caracteristicas_nuevas = []
+    caracteristicas_existentes = []
+    for datos in principales_nuevos + principales_existentes:
+        fila = {
+            'ID': datos['ID'],
+            'SKU': datos['SKU'],
+            'Caracteristicas_Convertidas_Archivo': 1,
+            'Caracteristicas_Convertidas_Archivo_Leido': 1,
+            'Caracteristicas_Convertidas_Archivo_Peso_KB': datos['Caracteristicas_Convertidas_Archivo_Peso_KB']
+        }
+        (caracteristicas_existentes if datos['ID'] in ids_caracteristicas else caracteristicas_nuevas).append(fila)
+    if caracteristicas_nuevas:
+        session.bulk_insert_mappings(CaracteristicasTabla, caracteristicas_nuevas)
+    if caracteristicas_existentes:
+        session.bulk_update_mappings(CaracteristicasTabla, caracteristicas_existentes)
+    return principales_nuevos, [fila['ID'] for fila in caracteristicas_nuevas]
+
+def escribir_informacion_adicional(session, lote, ids_informacion_adicional):
+    """
+    Agrega a la sesión, con operaciones masivas, un lote de conversiones [(id_informacion, sku, peso_kb)]
+    en 'informacionadicional' e 'informaciontablas'. No hace commit. Devuelve los IDs nuevos en
+    'informacionadicional'.
+    """
+    nuevos = []
+    existentes = []
+    principales = []
+    for id_informacion, sku, peso_kb in lote:
+        fila = {
+            'ID': id_informacion,
+            'SKU': sku,
+            'Informacion_Adicional_Convertidas_Archivo': True,
+            'Informacion_Adicional_Convertidas_Archivo_Leido': True,
+            'Informacion_Adicional_Convertidas_Archivo_Peso_KB': peso_kb
+        }
+        (existentes if id_informacion in ids_informacion_adicional else nuevos).append(fila)
+        principales.append({
+            'ID': id_informacion,
+            'Informacion_Adicional_Convertidas_Archivo': True,
+            'Informacion_Adicional_Convertidas_Archivo_Leido': True,
+            'Informacion_Adicional_Convertidas_Archivo_Peso_KB': peso_kb
+        })
+    if nuevos:
+        session.bulk_insert_mappings(InformacionAdicional, nuevos)
+    if existentes:
+        session.bulk_update_mappings(InformacionAdicional, existentes)
+    if principales:
+        session.bulk_update_mappings(InformacionTabla, principales)
+    return [fila['ID'] for fila in nuevos]
+
+def guardar_lote(session, lote_caracteristicas, lote_info_adicional, ids_por_sku, ids_caracteristicas, ids_informacion_adicional):
+    """
+    Escribe ambos lotes con un solo commit. Si se confirma, agrega a los mapas de IDs los registros
+    nuevos. Lanza la excepción si falla (el lote completo se descarta).
+    """
+    try:
+        principales_nuevos, caracteristicas_nuevas = escribir_caracteristicas(session, lote_caracteristicas, ids_por_sku, ids_caracteristicas)
+        info_adicional_nuevas = escribir_informacion_adicional(session, lote_info_adicional, ids_informacion_adicional)
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+
+    for datos in principales_nuevos:
+        ids_por_sku[datos['SKU']] = datos['ID']
+    ids_caracteristicas.update(caracteristicas_nuevas)
+    ids_informacion_adicional.update(info_adicional_nuevas)
+    logging.info(f"Lote escrito: {len(lote_caracteristicas)} características ({len(principales_nuevos)} SKUs nuevos) "
+                 f"y {len(lote_info_adicional)} informaciones adicionales.")
+
+def buscar_html_info_adicional(indice, sku):
+    """
+    Devuelve (ruta, os.stat) del HTML de InformacionAdicional del SKU, o (None, None) si no hay.
+    La carpeta se lista con el índice de ArchivosOrganizados, que ya trae el estado de cada archivo.
+    """
+    if "InformacionAdicional" not in indice.contenido_sku(sku):
+        logging.warning(f"No se encontró la carpeta 'InformacionAdicional' para SKU: {sku}")
+        print(f"No se encontró la carpeta 'InformacionAdicional' para SKU: {sku}")
+        return None, None
+    html_files = [entrada for entrada in indice.entradas(sku, "InformacionAdicional") if entrada.name.lower().endswith('.html')]
+    if not html_files:
+        logging.warning(f"No se encontró ningún archivo HTML en 'InformacionAdicional' para SKU: {sku}")
+        print(f"No se encontró ningún archivo HTML en 'InformacionAdicional' para SKU: {sku}")
+        return None, None
+    # Asumimos que hay un solo archivo HTML por SKU
+    return html_files[0].path, html_files[0].stat()
+
+def guardar_salida(ruta_salida, contenido, sku):
+    """Escribe el HTML convertido (la carpeta se crea sólo si falta). Devuelve True si se guardó."""
+    try:
+        escribir_archivo(ruta_salida, contenido)
+        logging.info(f"Archivo convertido guardado en: {ruta_salida}")
+        print(f"Archivo convertido guardado en: {ruta_salida}")
+        return True
+    except Exception as e:
+        logging.error(f"Error al guardar el archivo convertido para SKU {sku}: {e}")
+        print(f"Error al guardar el archivo convertido para SKU {sku}: {e}")
+        return False
+
+def process_all_products(session, productos, base_save_path):
+    """
+    Convierte en una sola pasada las Características y la Información Adicional de los productos
+    del catálogo que lo requieren. Retorna un diccionario con los contadores de ambas secciones.
+    """
+    contadores = {
+        'skus_procesados': 0,
+        'caracteristicas_procesadas': 0,
+        'caracteristicas_convertidas': 0,
+        'caracteristicas_sin_cambios': 0,
+        'info_adicional_procesada': 0,
+        'info_adicional_convertida': 0,
+        'info_adicional_sin_cambios': 0,
+    }
+
+    # Mapas de la base de datos, con una consulta cada uno
+    registros_informacion = obtener_registros_informacion(session)
+    ids_por_sku = {sku: registro[0] for sku, registro in registros_informacion.items()}
+    ids_caracteristicas = obtener_ids_existentes(session, CaracteristicasTabla)
+    ids_informacion_adicional = obtener_ids_existentes(session, InformacionAdicional)
+
+    # ArchivosOrganizados se lista una vez: los SKUs sin carpeta se descartan sin consultar el disco
+    indice = IndiceDirectorios(ARCHIVOS_ORGANIZADOS)
+
+    # Manifiestos con la huella de cada HTML ya convertido
+    manifiesto_caracteristicas = ManifiestoConversion("caracteristicas", version_plantilla(TEMPLATE_CARACTERISTICAS_PATH, VERSION_CARACTERISTICAS))
+    manifiesto_info_adicional = ManifiestoConversion("info_adicional", version_plantilla(TEMPLATE_INFO_ADICIONAL_PATH, VERSION_INFO_ADICIONAL))
+
+    # Lotes abiertos. Los SKUs sólo pasan a los manifiestos cuando el commit del lote se confirma
+    lote_caracteristicas = []   # (sku, peso_kb, ruta_entrada)
+    lote_info_adicional = []    # (id_informacion, sku, peso_kb, ruta_entrada)
+
+    def confirmar_lote():
+        if not lote_caracteristicas and not lote_info_adicional:
+            return
+        try:
+            guardar_lote(
+                session,
+                [(sku_lote, peso) for sku_lote, peso, _ in lote_caracteristicas],
+                [fila[:3] for fila in lote_info_adicional],
+                ids_por_sku, ids_caracteristicas, ids_informacion_adicional
+            )
+            for sku_lote, _, ruta_lote in lote_caracteristicas:
+                manifiesto_caracteristicas.registrar(sku_lote, ruta_lote)
+            for _, sku_lote, _, ruta_lote in lote_info_adicional:
+                if ruta_lote:
+                    manifiesto_info_adicional.registrar(sku_lote, ruta_lote)
+        except Exception as e:
+            logging.error(f"Error al escribir un lote de {len(lote_caracteristicas) + len(lote_info_adicional)} conversiones: {e}")
+            print(f"Error al escribir un lote de {len(lote_caracteristicas) + len(lote_info_adicional)} conversiones: {e}")
+        lote_caracteristicas.clear()
+        lote_info_adicional.clear()
+
+    def lote_lleno():
+        return len(lote_caracteristicas) + len(lote_info_adicional) >= TAMANO_LOTE_BD
+
+    # Primera pasada (sin parsear): decidir qué secciones de cada SKU requieren conversión
+    tareas = []
+    ids_informacion = {}
+    vistos = set()
+    for producto in productos:
+        sku = producto.get("clave")
+        if not sku:
+            print("Producto sin SKU encontrado, omitiendo...")
+            logging.warning("Producto sin SKU encontrado, omitiendo...")
+            continue
+        if sku in vistos:
+            continue  # El mismo SKU aparece en más de un JSON
+        vistos.add(sku)
+
+        # Características: todos los SKUs del catálogo con HTML descargado
+        ruta_caracteristicas = os.path.join(ARCHIVOS_ORGANIZADOS, sku, "Caracteristicas", f"Caracteristicas_{sku}.html")
+        salida_caracteristicas = os.path.join(base_save_path, sku, "Caracteristicas", f"Caracteristicas_{sku}.html")
+        estado_caracteristicas = estado_archivo(ruta_caracteristicas) if indice.tiene_sku(sku) else None
+        if estado_caracteristicas is None:
+            logging.warning(f"No se encontró el archivo HTML de características para SKU: {sku}")
+            ruta_caracteristicas = None
+        elif sku in ids_por_sku and not manifiesto_caracteristicas.requiere_conversion(sku, ruta_caracteristicas, salida_caracteristicas, estado_caracteristicas):
+            logging.debug(f"Características del SKU {sku} sin cambios desde la última conversión, omitiendo...")
+            contadores['caracteristicas_sin_cambios'] += 1
+            ruta_caracteristicas = None
+
+        # Información Adicional: sólo SKUs registrados con el archivo leído y aún sin convertir
+        ruta_info_adicional = None
+        registro_informacion = registros_informacion.get(sku)
+        if registro_informacion:
+            id_informacion, archivo_leido, archivo_convertido = registro_informacion
+            if archivo_leido and not archivo_convertido:
+                ruta_info_adicional, estado_info_adicional = buscar_html_info_adicional(indice, sku)
+                salida_info_adicional = os.path.join(base_save_path, sku, "InformacionAdicional", f"InformacionAdicional_{sku}.html")
+                # Si el HTML de origen y la plantilla no cambiaron, se reutiliza la salida existente
+                # (p. ej. las banderas se reiniciaron pero el HTML de origen es el mismo)
+                if ruta_info_adicional and not manifiesto_info_adicional.requiere_conversion(sku, ruta_info_adicional, salida_info_adicional, estado_info_adicional):
+                    lote_info_adicional.append((id_informacion, sku, obtener_tamano_kb(salida_info_adicional), None))
+                    logging.info(f"Información adicional del SKU {sku} sin cambios; se reutiliza {salida_info_adicional}")
+                    contadores['info_adicional_sin_cambios'] += 1
+                    ruta_info_adicional = None
+                    if lote_lleno():
+                        confirmar_lote()
+                elif ruta_info_adicional:
+                    ids_informacion[sku] = id_informacion
+
+        if ruta_caracteristicas or ruta_info_adicional:
+            tareas.append((sku, ruta_caracteristicas, ruta_info_adicional,
+                           str(TEMPLATE_CARACTERISTICAS_PATH), str(TEMPLATE_INFO_ADICIONAL_PATH)))
+
+    logging.info(f"SKUs que requieren conversión: {len(tareas)}")
+    print(f"SKUs que requieren conversión: {len(tareas)}")
+
+    # Segunda pasada: el análisis y renderizado se reparten entre procesos; aquí se escriben
+    # los archivos y la base de datos a medida que llegan los resultados
+    for resultado in convertir_en_paralelo(convertir_sku, tareas):
+        sku = resultado['sku']
+        print(f"Procesando SKU: {sku}")
+        logging.info(f"Procesando SKU: {sku}")
+        sku_convertido = False
+
+        caracteristicas = resultado['caracteristicas']
+        if caracteristicas:
+            if caracteristicas['error']:
+                print(caracteristicas['error'])
+                logging.error(caracteristicas['error'])
+            elif caracteristicas['contenido'] is None:
+                print(f"No se generaron subacordeones para {caracteristicas['ruta_entrada']}")
+                logging.warning(f"No se generaron subacordeones para {caracteristicas['ruta_entrada']}")
+                contadores['caracteristicas_procesadas'] += 1  # Se intentó procesar, pero no se pudo convertir
+            elif guardar_salida(os.path.join(base_save_path, sku, "Caracteristicas", f"Caracteristicas_{sku}.html"), caracteristicas['contenido'], sku):
+                # Secciones extraídas y fragmento del metafield, para que Centinela y Shopify no vuelvan a analizar el HTML
+                actualizar_especificaciones(base_save_path, sku, "caracteristicas", caracteristicas['especificaciones'])
+                # El tamaño sale del contenido escrito
+                lote_caracteristicas.append((sku, caracteristicas['tamano_kb'], caracteristicas['ruta_entrada']))
+                contadores['caracteristicas_procesadas'] += 1
+                contadores['caracteristicas_convertidas'] += 1
+                sku_convertido = True
+
+        info_adicional = resultado['info_adicional']
+        if info_adicional:
+            if info_adicional['error']:
+                print(info_adicional['error'])
+                logging.error(info_adicional['error'])
+            elif info_adicional['contenido'] is None:
+                print(f"No se generaron subacordeones para {info_adicional['ruta_entrada']}")
+                logging.warning(f"No se generaron subacordeones para {info_adicional['ruta_entrada']}")
+                # Aún así, si el archivo fue leído pero no convertido, incrementamos el contador de procesados
+                contadores['info_adicional_procesada'] += 1
+            elif guardar_salida(os.path.join(base_save_path, sku, "InformacionAdicional", f"InformacionAdicional_{sku}.html"), info_adicional['contenido'], sku):
+                actualizar_especificaciones(base_save_path, sku, "info_adicional", info_adicional['especificaciones'])
+                lote_info_adicional.append((ids_informacion[sku], sku, info_adicional['tamano_kb'], info_adicional['ruta_entrada']))
+                contadores['info_adicional_procesada'] += 1
+                contadores['info_adicional_convertida'] += 1
+                sku_convertido = True
+
+        if sku_convertido:
+            contadores['skus_procesados'] += 1
+            print(f"Procesado y convertido correctamente SKU: {sku}")
+            logging.info(f"Procesado y convertido correctamente SKU: {sku}")
+        if lote_lleno():
+            confirmar_lote()
+
+    confirmar_lote()
+    manifiesto_caracteristicas.guardar()
+    manifiesto_info_adicional.guardar()
+    logging.info(f"Sin cambios: {contadores['caracteristicas_sin_cambios']} características omitidas, "
+                 f"{contadores['info_adicional_sin_cambios']} informaciones adicionales reutilizadas.")
+    print(f"Sin cambios: {contadores['caracteristicas_sin_cambios']} características omitidas, "
+          f"{contadores['info_adicional_sin_cambios']} informaciones adicionales reutilizadas.")
+    return contadores
+
+def generate_csv_report_caracteristicas(session, report_save_path, timestamp):
+    """
+    Genera un reporte en formato CSV desde la tabla 'CaracteristicasTabla'.
+    Incluye solo los datos de la tabla de características.
+    """
+    try:
+        # Realizar una consulta para obtener todos los registros de CaracteristicasTabla
+        resultados = session.query(
+            InformacionTabla.SKU,
+            CaracteristicasTabla.Caracteristicas_Convertidas_Archivo,
+            CaracteristicasTabla.Caracteristicas_Convertidas_Archivo_Leido,
+            CaracteristicasTabla.Caracteristicas_Convertidas_Archivo_Peso_KB
+        ).join(CaracteristicasTabla, InformacionTabla.ID == CaracteristicasTabla.ID).all()
+
+        total_resultados = len(resultados)
+        logging.info(f"Total de registros a escribir en el CSV: {total_resultados}")
+        print(f"Total de registros a escribir en el CSV: {total_resultados}")
+
+        if not resultados:
+            print("No se encontraron datos en 'CaracteristicasTabla' para generar el reporte CSV.")
+            logging.warning("No se encontraron datos en 'CaracteristicasTabla' para generar el reporte CSV.")
+            return
+
+        with open(report_save_path, 'w', newline='', encoding='utf-8') as csvfile:
+            fieldnames = [
+                'SKU',
+                'Caracteristicas_Convertidas_Archivo',
+                'Caracteristicas_Convertidas_Archivo_Leido',
+                'Caracteristicas_Convertidas_Archivo_Peso_KB'
+            ]
+            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer.writeheader()
+
+            count_written = 0
+            for row in resultados:
+                writer.writerow({
+                    'SKU': row.SKU,
+                    'Caracteristicas_Convertidas_Archivo': row.Caracteristicas_Convertidas_Archivo if row.Caracteristicas_Convertidas_Archivo is not None else 0,
+                    'Caracteristicas_Convertidas_Archivo_Leido': row.Caracteristicas_Convertidas_Archivo_Leido if row.Caracteristicas_Convertidas_Archivo_Leido is not None else 0,
+                    'Caracteristicas_Convertidas_Archivo_Peso_KB': row.Caracteristicas_Convertidas_Archivo_Peso_KB if row.Caracteristicas_Convertidas_Archivo_Peso_KB is not None else 0.0
+                })
+                count_written += 1
+
+        logging.info(f"Total de registros escritos en el CSV: {count_written}")
+        print(f"Total de registros escritos en el CSV: {count_written}")
+        logging.info(f"Reporte CSV de Características generado en: {report_save_path}")
+        print(f"Reporte CSV de Características generado en: {report_save_path}")
+    except Exception as e:
+        logging.error(f"Error al generar el reporte CSV de Características: {e}")
+        print(f"Error al generar el reporte CSV de Características: {e}")
+
+def generate_txt_report_caracteristicas(total_skus, caracteristicas_convertidas, caracteristicas_procesadas, report_save_path):
+    """
+    Genera un reporte en formato TXT con el resumen del proceso.
+    
+    :param total_skus: Total de SKUs procesados.
+    :param caracteristicas_convertidas: Número de archivos de características convertidos.
+    :param caracteristicas_procesadas: Número de archivos de características procesados.
+    :param report_save_path: Ruta completa donde se guardará el reporte TXT.
+    """
+    try:
+        resumen = f"""
+===== Resumen del Proceso =====
+
+Total de SKUs Procesados: {total_skus}
+
+Características Procesadas: {caracteristicas_procesadas}
+Características Convertidas: {caracteristicas_convertidas}
+
+==============================
+"""
+        with open(report_save_path, 'w', encoding='utf-8') as resumen_file:
+            resumen_file.write(resumen.strip())  # Eliminar espacios en blanco al inicio y final
+
+        logging.info(f"Reporte TXT generado en: {report_save_path}")
+        print(f"Reporte TXT generado en: {report_save_path}")
+    except Exception as e:
+        logging.error(f"Error al generar el reporte TXT: {e}")
+        print(f"Error al generar el reporte TXT: {e}")
+
+def generate_csv_report_informacion_adicional(session, report_save_path):
+    """
+    Genera un reporte en formato CSV desde la tabla 'informacionadicional'.
+    """
+    try:
+        resultados = session.query(InformacionAdicional).all()
+        total_resultados = len(resultados)
+        logging.info(f"Total de registros a escribir en el CSV: {total_resultados}")
+
+        with open(report_save_path, 'w', newline='', encoding='utf-8') as csvfile:
+            fieldnames = [
+                'ID',
+                'SKU',
+                'Informacion_Adicional_Convertidas_Archivo',
+                'Informacion_Adicional_Convertidas_Archivo_Leido',
+                'Informacion_Adicional_Convertidas_Archivo_Peso_KB'
+            ]
+            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer.writeheader()
+
+            for row in resultados:
+                writer.writerow({
+                    'ID': row.ID,
+                    'SKU': row.SKU,
+                    'Informacion_Adicional_Convertidas_Archivo': row.Informacion_Adicional_Convertidas_Archivo,
+                    'Informacion_Adicional_Convertidas_Archivo_Leido': row.Informacion_Adicional_Convertidas_Archivo_Leido,
+                    'Informacion_Adicional_Convertidas_Archivo_Peso_KB': row.Informacion_Adicional_Convertidas_Archivo_Peso_KB
+                })
+
+        logging.info(f"Reporte CSV generado en: {report_save_path}")
+        print(f"Reporte CSV generado en: {report_save_path}")
+    except Exception as e:
+        logging.error(f"Error al generar el reporte CSV: {e}")
+
+def generate_txt_report_informacion_adicional(total_skus, informacion_adicional_procesada, informacion_adicional_convertida, report_save_path):
+    """
+    Genera un reporte en formato TXT con el resumen del proceso.
+    """
+    try:
+        resumen = f"""===== Resumen del Proceso =====
+
+Total de SKUs Procesados: {total_skus}
+
+Información Adicional Procesada: {informacion_adicional_procesada}
+Información Adicional Convertida: {informacion_adicional_convertida}
+
+==============================="""
+        with open(report_save_path, 'w', encoding='utf-8') as resumen_file:
+            resumen_file.write(resumen)
+        logging.info(f"Reporte TXT generado en: {report_save_path}")
+        print(f"Reporte TXT generado en: {report_save_path}")
+    except Exception as e:
+        logging.error(f"Error al generar el reporte TXT: {e}")
+
+# =========================
+# Función Principal
+# =========================
+
+def main():
+    session = inicializar()
+    if session is None:
+        exit(1)
+
+    logging.info("Iniciando la conversión de Características e Información Adicional.")
+    print("Iniciando la conversión de Características e Información Adicional.")
+
+    # Leer el catálogo una sola vez para ambas secciones
+    productos = cargar_jsons(JSON_DIR)
+    if not productos:
+        logging.warning("No se encontraron productos en los archivos JSON.")
+        print("No se encontraron productos en los archivos JSON.")
+        return
+
+    contadores = process_all_products(session, productos, CONVERSION_DIR)
+
+    print(f"Total de SKUs Procesados: {contadores['skus_procesados']}")
+    logging.info(f"Total de SKUs Procesados: {contadores['skus_procesados']}")
+    print(f"Características Procesadas: {contadores['caracteristicas_procesadas']}, Convertidas: {contadores['caracteristicas_convertidas']}")
+    logging.info(f"Características Procesadas: {contadores['caracteristicas_procesadas']}, Convertidas: {contadores['caracteristicas_convertidas']}")
+    print(f"Información Adicional Procesada: {contadores['info_adicional_procesada']}, Convertida: {contadores['info_adicional_convertida']}")
+    logging.info(f"Información Adicional Procesada: {contadores['info_adicional_procesada']}, Convertida: {contadores['info_adicional_convertida']}")
+
+    # Reportes de Características
+    generate_csv_report_caracteristicas(session, CSV_CARACTERISTICAS_PATH, timestamp)
+    generate_txt_report_caracteristicas(contadores['skus_procesados'], contadores['caracteristicas_convertidas'],
+                                        contadores['caracteristicas_procesadas'], RESUMEN_CARACTERISTICAS_PATH)
+
+    # Reportes de Información Adicional
+    generate_csv_report_informacion_adicional(session, CSV_INFO_ADICIONAL_PATH)
+    generate_txt_report_informacion_adicional(
+        total_skus=contadores['skus_procesados'],
+        informacion_adicional_procesada=contadores['info_adicional_procesada'],
+        informacion_adicional_convertida=contadores['info_adicional_convertida'],
+        report_save_path=RESUMEN_INFO_ADICIONAL_PATH
+    )
+
+    print(f"\nProceso completado. Reportes guardados en: {OUTPUT_REPORT_PATH}")
+    logging.info(f"Proceso completado. Reportes guardados en: {OUTPUT_REPORT_PATH}")
+
+    # Cerrar la sesión de SQLAlchemy
+    try:
+        session.close()
+        logging.info("Sesión de SQLAlchemy cerrada.")
+        print("Sesión de SQLAlchemy cerrada.")
+    except Exception as e:
+        logging.error(f"Error al cerrar la sesión de SQLAlchemy: {e}")
+        print(f"Error al cerrar la sesión de SQLAlchemy: {e}")
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,11 @@ import os
 import requests
 import json
 import logging
-import base64
 import pandas as pd
 import time
 from datetime import datetime, timezone
-from jinja2 import Template
+from concurrent.futures import ThreadPoolExecutor
+from jinja2 import TemplateNotFound
 from dotenv import load_dotenv
 from tenacity import retry, wait_exponential, stop_after_attempt, retry_if_exception_type
 import re
@@ -14,6 +14,9 @@ import mysql.connector
 from mysql.connector import Error
 from pathlib import Path
 from Aplicacion.config import DIRECTORIOS
+from Aplicacion.plantillas import obtener_plantilla
+from Aplicacion.especificaciones_sku import cargar_especificaciones, filas_especificaciones
+from Aplicacion.shopify_medios import SubidorMediosShopify, listar_imagenes_producto, resolver_subidas_pendientes, SUBIDAS_EN_PARALELO
 
 # ============================================================
 # Cargar variables de entorno
@@ -43,6 +46,10 @@ headers_graphql = {
     "Content-Type": "application/json"
 }
 
+# Las imágenes se suben en segundo plano (varios productos a la vez) mientras se crean los siguientes productos;
+# el pool de hilos de las subidas se abre y se cierra en main()
+subidor_medios = SubidorMediosShopify(GRAPHQL_URL, SHOPIFY_ACCESS_TOKEN)
+
 # ============================================================
 # Credenciales de la Base de Datos MySQL (para 'informacionproductos')
 # ============================================================
@@ -58,6 +65,7 @@ ruta_nuevos              = DIRECTORIOS['Nuevo']                     # JSON para
 ruta_ficha_sin_boton     = DIRECTORIOS['Plantillas'] / 'index.html'
 ruta_ficha_con_boton     = DIRECTORIOS['Plantillas'] / 'index2.html'
 ruta_imagenes_procesadas = DIRECTORIOS['ImagenesProcesadasCT']      # Imágenes ya procesadas
+ruta_conversion          = DIRECTORIOS['Conversion']                # Especificaciones_{sku}.json
 ruta_guardado_csv        = DIRECTORIOS['Nuevo']                     # CSV de resultados
 ruta_log                 = DIRECTORIOS['Nuevo']                     # Logs
 
@@ -192,22 +200,32 @@ def crear_metafield(product_id, metafield):
         return False
 
 def cargar_plantilla(ruta_plantilla):
+    """Devuelve la plantilla compilada; se lee y compila una sola vez por ejecución."""
     try:
-        with open(ruta_plantilla, 'r', encoding='utf-8') as file:
-            plantilla = file.read()
-            print_message(f"Plantilla cargada desde {ruta_plantilla}", 'debug')
-            return plantilla
-    except FileNotFoundError:
+        plantilla = obtener_plantilla(ruta_plantilla)
+        print_message(f"Plantilla cargada desde {ruta_plantilla}", 'debug')
+        return plantilla
+    except (FileNotFoundError, TemplateNotFound):
         print_message(f"Archivo de plantilla no encontrado en {ruta_plantilla}", 'error')
         raise
     except Exception as e:
         print_message(f"Error al cargar la plantilla: {str(e)}", 'error')
         raise
 
-def generar_html(template_str, product_data, pdf_url=None):
+def especificaciones_de_conversion(sku):
+    """Pares tipo/valor de las características que la conversión ya extrajo del HTML de CT."""
+    if not sku:
+        return []
+    return filas_especificaciones(cargar_especificaciones(ruta_conversion, sku), "caracteristicas")
+
+def generar_html(template, product_data, pdf_url=None):
     try:
-        template = Template(template_str)
         especificaciones = product_data.get("especificaciones", "")
+        if not especificaciones:
+            # El JSON de CT no trae especificaciones: se usan las de Especificaciones_{sku}.json
+            especificaciones = especificaciones_de_conversion(product_data.get("clave"))
+            if especificaciones:
+                print_message(f"Especificaciones tomadas de la conversión para el producto '{product_data.get('clave')}'.", 'debug')
         if isinstance(especificaciones, list):
             especificaciones_html = "".join(f"<strong>{spec.get('tipo', '')}:</strong> {spec.get('valor', '')}<br>" for spec in especificaciones)
         else:
@@ -279,86 +297,20 @@ def obtener_id_producto_por_sku(sku, sku_to_id):
     print_message(f"Buscando ID de producto para SKU: {sku}", 'debug')
     return sku_to_id.get(sku)
 
-def subir_imagenes_al_producto(product_id, sku):
+def subir_imagenes_al_producto(executor, product_id, sku, nombre=''):
+    """
+    Programa en el executor la subida de las imágenes procesadas del SKU (staged upload + productCreateMedia).
+    Devuelve un Future con la cantidad de imágenes adjuntadas, o None si no hay imágenes.
+    """
     print_message(f"Subiendo imágenes para producto ID: {product_id} | SKU: {sku}", 'debug')
     ruta_imagenes = os.path.join(ruta_imagenes_procesadas, sku)
-
-    if not os.path.exists(ruta_imagenes):
-        print_message(f"No se encontraron imágenes para el SKU '{sku}' en {ruta_imagenes}.", 'warning')
-        return 0
-
-    imagenes = [os.path.join(ruta_imagenes, img) for img in os.listdir(ruta_imagenes)
-                if img.lower().endswith(('.png', '.jpg', '.jpeg', '.gif'))]
+    imagenes = listar_imagenes_producto(ruta_imagenes)
 
     if not imagenes:
-        print_message(f"No se encontraron imágenes en {ruta_imagenes}.", 'warning')
-        return 0
-
-    imagen_principal = None
-    imagenes_restantes = []
-    for imagen in imagenes:
-        if "_full" in os.path.basename(imagen).lower() or not imagen_principal:
-            imagen_principal = imagen
-        else:
-            imagenes_restantes.append(imagen)
-
-    imagenes_subidas = 0
-    total_imagenes = len(imagenes)
-
-    if imagen_principal:
-        try:
-            with open(imagen_principal, 'rb') as img_file:
-                encoded_image = base64.b64encode(img_file.read()).decode('utf-8')
-                image_data = {
-                    "image": {
-                        "attachment": encoded_image,
-                        "position": 1
-                    }
-                }
-            response = requests.post(f'{base_url}/products/{product_id}/images.json',
-                                     json=image_data, headers=headers_rest, timeout=30)
-            if response.status_code in [200, 201]:
-                print_message(f"Imagen principal '{os.path.basename(imagen_principal)}' subida con éxito", 'info')
-                imagenes_subidas += 1
-            elif response.status_code == 429:
-                print_message("Límite de tasa en imagen principal. Esperando...", 'warning')
-                time.sleep(10)
-                return subir_imagenes_al_producto(product_id, sku)
-            else:
-                print_message(f"Fallo al subir imagen principal '{os.path.basename(imagen_principal)}': {response.status_code}, {response.text}", 'error')
-        except Exception as e:
-            print_message(f"Error al subir imagen principal '{os.path.basename(imagen_principal)}': {str(e)}", 'error')
-
-    for idx, imagen in enumerate(imagenes_restantes, start=2):
-        try:
-            with open(imagen, 'rb') as img_file:
-                encoded_image = base64.b64encode(img_file.read()).decode('utf-8')
-                image_data = {
-                    "image": {
-                        "attachment": encoded_image,
-                        "position": idx
-                    }
-                }
-            response = requests.post(f'{base_url}/products/{product_id}/images.json',
-                                     json=image_data, headers=headers_rest, timeout=30)
-            if response.status_code in [200, 201]:
-                print_message(f"Imagen {idx}: '{os.path.basename(imagen)}' subida con éxito", 'info')
-                imagenes_subidas += 1
-            elif response.status_code == 429:
-                print_message("Límite de tasa en imágenes restantes. Esperando...", 'warning')
-                time.sleep(10)
-                return subir_imagenes_al_producto(product_id, sku)
-            else:
-                print_message(f"Fallo al subir imagen '{os.path.basename(imagen)}': {response.status_code}, {response.text}", 'error')
-        except Exception as e:
-            print_message(f"Error al subir imagen '{os.path.basename(imagen)}': {str(e)}", 'error')
-
-    if imagenes_subidas == total_imagenes:
-        print_message(f"--- Se subieron correctamente las {imagenes_subidas} imágenes ---", 'info')
-    else:
-        print_message(f"--- Se esperaba subir {total_imagenes} imágenes, pero se subieron {imagenes_subidas}. ---", 'warning')
+        print_message(f"No se encontraron imágenes para el SKU '{sku}' en {ruta_imagenes}.", 'warning')
+        return None
 
-    return imagenes_subidas
+    return executor.submit(subidor_medios.subir_imagenes, product_id, imagenes, nombre)
 
 def read_products_from_directory(directory):
     print_message(f"Leyendo productos desde: {directory}", 'debug')
@@ -394,7 +346,7 @@ def guardar_en_archivo(productos, nombre_archivo):
 
 @retry(wait=wait_exponential(multiplier=1, min=4, max=10), stop=stop_after_attempt(5),
        retry=retry_if_exception_type(requests.exceptions.RequestException))
-def crear_producto_sin_variantes(product_data, index, productos_creados, productos_fallidos, location_id, skus_existentes, sku_to_id):
+def crear_producto_sin_variantes(product_data, index, productos_creados, productos_fallidos, location_id, skus_existentes, sku_to_id, executor, subidas):
     print_message(f"Iniciando creación del producto {index}: SKU {product_data.get('clave', 'Sin SKU')}", 'debug')
     sku = product_data.get('clave', 'Sin SKU')
     nombre = product_data.get('nombre', 'Sin nombre')
@@ -461,10 +413,10 @@ def crear_producto_sin_variantes(product_data, index, productos_creados, product
 
         # Cargar la plantilla adecuada
         if plantilla_usada == 'Con boton':
-            plantilla_str = cargar_plantilla(ruta_ficha_con_boton)
+            plantilla = cargar_plantilla(ruta_ficha_con_boton)
         else:
-            plantilla_str = cargar_plantilla(ruta_ficha_sin_boton)
-        html_description = generar_html(template_str=plantilla_str, product_data=product_data, pdf_url=pdf_url)
+            plantilla = cargar_plantilla(ruta_ficha_sin_boton)
+        html_description = generar_html(template=plantilla, product_data=product_data, pdf_url=pdf_url)
 
         required_keys = ['nombre', 'descripcion_corta', 'marca', 'modelo', 'numParte', 'especificaciones', 'clave']
         for key in required_keys:
@@ -535,7 +487,7 @@ def crear_producto_sin_variantes(product_data, index, productos_creados, product
             if hasattr(e, 'response') and e.response.status_code == 429:
                 print_message("Límite de tasa alcanzado al crear el producto. Esperando...", 'warning')
                 time.sleep(10)
-                return crear_producto_sin_variantes(product_data, index, productos_creados, productos_fallidos, location_id, skus_existentes, sku_to_id)
+                return crear_producto_sin_variantes(product_data, index, productos_creados, productos_fallidos, location_id, skus_existentes, sku_to_id, executor, subidas)
             else:
                 error_response = ""
                 try:
@@ -601,16 +553,17 @@ def crear_producto_sin_variantes(product_data, index, productos_creados, product
             return False
 
         ruta_imagenes_producto = os.path.join(ruta_imagenes_procesadas, sku)
-        cantidad_imagenes_subidas = 0
 
         print_message(f"{index}.- Producto '{sku}' creado exitosamente!", 'info')
         print_message(f"Nombre: {nombre} | Stock: {existencia_total} | Precio: {precio_venta:.2f} MXN | Promoción: {'Sí' if promocion_activa else 'No'}", 'info')
 
         if os.path.exists(ruta_imagenes_producto):
             imagenes_encontradas = len([img for img in os.listdir(ruta_imagenes_producto)
-                                        if img.lower().endswith(('.png', '.jpg', '.jpeg', '.gif'))])
+                                        if img.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.webp'))])
             print_message(f"--- {imagenes_encontradas} imágenes encontradas en {ruta_imagenes_producto} ---", 'info')
-            cantidad_imagenes_subidas = subir_imagenes_al_producto(product_id, sku)
+            futuro = subir_imagenes_al_producto(executor, product_id, sku, nombre)
+            if futuro:
+                subidas[sku] = futuro
         else:
             print_message(f"No se encontraron imágenes para el SKU '{sku}' en {ruta_imagenes_producto}.", 'warning')
 
@@ -657,7 +610,7 @@ def crear_producto_sin_variantes(product_data, index, productos_creados, product
             'Promoción': 'Sí' if promocion_activa else 'No',
             'Vigencia': fecha_fin_promocion.date().isoformat() if promocion_activa else 'Sin Vigencia',
             'Status': 'Creado',
-            'Cantidad de Imágenes Subidas': cantidad_imagenes_subidas,
+            'Cantidad de Imágenes Subidas': 0,  # Se completa al resolver las subidas pendientes
             'Enlace': enlace_producto,
             'Plantilla_Usada': plantilla_usada
         })
@@ -666,7 +619,7 @@ def crear_producto_sin_variantes(product_data, index, productos_creados, product
     finally:
         print_message("-----------------------------------------------------", 'debug')
 
-def procesar_nuevos(location_id, skus_existentes, sku_to_id):
+def procesar_nuevos(location_id, skus_existentes, sku_to_id, executor):
     print_message("\n---- Procesando productos nuevos ----\n", 'info')
     json_products = read_products_from_directory(ruta_nuevos)
     print_message(f"Total de productos leídos: {len(json_products)}", 'info')
@@ -674,10 +627,13 @@ def procesar_nuevos(location_id, skus_existentes, sku_to_id):
     print_message(f"Total de productos a crear: {len(products_to_create)}", 'info')
     productos_creados = []
     productos_fallidos = []
+    subidas = {}
     for index, product in enumerate(products_to_create, start=1):
         sku = product.get('clave', 'Sin SKU')
         print_message(f"Procesando producto {index}/{len(products_to_create)}: SKU {sku}", 'debug')
-        crear_producto_sin_variantes(product, index, productos_creados, productos_fallidos, location_id, skus_existentes, sku_to_id)
+        crear_producto_sin_variantes(product, index, productos_creados, productos_fallidos, location_id, skus_existentes, sku_to_id, executor, subidas)
+    # Esperar las subidas de imágenes pendientes antes de escribir los reportes
+    resolver_subidas_pendientes(subidas, productos_creados)
     guardar_en_archivo(productos_creados, nombre_archivo_csv_nuevos)
     guardar_en_archivo(productos_fallidos, nombre_archivo_csv_fallos)
     print_message("Procesamiento de productos nuevos completado.", 'info')
@@ -738,7 +694,9 @@ def main():
         skus_existentes, sku_to_id = obtener_productos_existentes()
         print_message(f"Cantidad de SKUs existentes: {len(skus_existentes)}", 'info')
 
-        productos_creados, productos_fallidos, total_processed = procesar_nuevos(location_id, skus_existentes, sku_to_id)
+        # Al salir del bloque se esperan las subidas que sigan en curso, aunque el proceso falle
+        with ThreadPoolExecutor(max_workers=SUBIDAS_EN_PARALELO) as executor:
+            productos_creados, productos_fallidos, total_processed = procesar_nuevos(location_id, skus_existentes, sku_to_id, executor)
 
         end_time = time.time()
         execution_time = end_time - start_time
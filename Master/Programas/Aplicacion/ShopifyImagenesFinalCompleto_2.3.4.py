@@ -12,6 +12,11 @@ Además, se ha agregado una nueva columna llamada Imagen_Logotipo en la tabla Ca
 Si para un SKU no se descarga ninguna imagen (es decir, Cantidad_Imagenes_Procesadas = 0), se usará la imagen del logotipo ubicada en:
     C:\Users\Usuario\Documents\BitAndByte\DesarrolloWebBitAndByte\Master\Proceso\IconoBitAndByte1000x1000.png
 y se actualizará la columna Imagen_Logotipo a 1; además, en este caso se dejarán en 0 las columnas Imagen_Principal_Foto e Imagen_Por_Defecto.
+
+Las imágenes procesadas se codifican según el perfil de salida seleccionado con la variable de entorno PERFIL_IMAGENES
+(png_optimizado, jpeg_alta o webp). Los perfiles JPEG y WEBP tienen un peso objetivo en KB; PNG es sin pérdida y no
+tiene peso objetivo. El peso real de cada archivo se registra en Imagen_Procesada.Peso_KB y el formato en
+Imagen_Procesada.Formato.
     
 Fecha de Creación: 28/02/2025
 Versión: 2.3.5
@@ -25,8 +30,13 @@ import cv2
 import numpy as np
 import requests
 import json
+import csv
 import logging
 import datetime
+import sys
+import time
+from collections import namedtuple, defaultdict
+from contextlib import contextmanager
 from io import BytesIO
 from PIL import Image
 import mysql.connector
@@ -34,6 +44,7 @@ from dotenv import load_dotenv
 import shutil
 from pathlib import Path
 from Aplicacion.config import DIRECTORIOS
+from Aplicacion.indice_directorios import IndiceDirectorios
 
 load_dotenv()
 
@@ -68,6 +79,78 @@ def registrar_en_log(mensaje, nivel='info'):
         logging.error(mensaje)
     print(mensaje)
 
+#############################################
+# MÉTRICAS DE LA ETAPA DE IMÁGENES
+#############################################
+
+class MetricasImagenes:
+    """
+    Tiempos acumulados por fase (descarga, decodificacion, transformacion, codificacion, escritura_disco,
+    escritura_bd) y contadores (imágenes, bytes de entrada y salida, aciertos de caché, fallos HTTP).
+    Al final de cada ejecución se exportan a CSV y JSON junto a los logs de ProcesoDeImagenes.
+    """
+
+    def __init__(self):
+        self.inicio = time.perf_counter()
+        self.segundos_por_fase = defaultdict(float)
+        self.llamadas_por_fase = defaultdict(int)
+        self.contadores = defaultdict(int)
+
+    @contextmanager
+    def medir(self, fase):
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.segundos_por_fase[fase] += time.perf_counter() - inicio
+            self.llamadas_por_fase[fase] += 1
+
+    def sumar(self, contador, valor=1):
+        self.contadores[contador] += valor
+
+    def resumen(self):
+        duracion = time.perf_counter() - self.inicio
+        imagenes = self.contadores['imagenes_procesadas']
+        fases = {}
+        for fase, segundos in self.segundos_por_fase.items():
+            llamadas = self.llamadas_por_fase[fase]
+            fases[fase] = {
+                'llamadas': llamadas,
+                'segundos_totales': round(segundos, 3),
+                'ms_promedio': round(segundos * 1000 / llamadas, 3) if llamadas else 0,
+                'porcentaje_del_total': round(segundos * 100 / duracion, 2) if duracion else 0,
+            }
+        return {
+            'fecha': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'perfil_salida': PERFIL_IMAGENES,
+            'duracion_segundos': round(duracion, 3),
+            'imagenes_por_segundo': round(imagenes / duracion, 3) if duracion else 0,
+            'contadores': dict(self.contadores),
+            'fases': fases,
+        }
+
+    def exportar(self, carpeta):
+        """Escribe metricas_imagenes_<fecha>.json y .csv en la carpeta indicada y devuelve el resumen."""
+        resumen = self.resumen()
+        marca = datetime.datetime.now().strftime('%d-%m-%Y_%H-%M-%S')
+        ruta_json_metricas = Path(carpeta) / f'metricas_imagenes_{marca}.json'
+        ruta_csv_metricas = Path(carpeta) / f'metricas_imagenes_{marca}.csv'
+        with open(ruta_json_metricas, 'w', encoding='utf-8') as f:
+            json.dump(resumen, f, ensure_ascii=False, indent=4)
+        with open(ruta_csv_metricas, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Tipo', 'Nombre', 'Valor', 'Llamadas', 'MS_Promedio', 'Porcentaje_Del_Total'])
+            writer.writerow(['general', 'duracion_segundos', resumen['duracion_segundos'], '', '', ''])
+            writer.writerow(['general', 'imagenes_por_segundo', resumen['imagenes_por_segundo'], '', '', ''])
+            for nombre, valor in resumen['contadores'].items():
+                writer.writerow(['contador', nombre, valor, '', '', ''])
+            for fase, datos in resumen['fases'].items():
+                writer.writerow(['fase', fase, datos['segundos_totales'], datos['llamadas'], datos['ms_promedio'], datos['porcentaje_del_total']])
+        registrar_en_log(f"Métricas de la etapa de imágenes exportadas en: {ruta_json_metricas} y {ruta_csv_metricas}")
+        return resumen
+
+metricas = MetricasImagenes()
+
 #############################################
 # CONFIGURACIÓN DE MYSQL (variables de entorno)
 #############################################
@@ -145,21 +228,205 @@ def create_database_and_tables():
     cursor.close()
     conn.close()
 
+#############################################
+# ESCRITURA POR LOTES EN MYSQL
+#############################################
+
+# Número de SKUs cuyas filas se acumulan antes de escribirlas en una sola transacción
+TAMANO_LOTE_BD = int(os.getenv('TAMANO_LOTE_IMAGENES_BD', '50'))
+
+def obtener_skus_procesados(cursor):
+    """Devuelve en un set todos los SKU ya registrados en Cantidad_Imagenes_Procesadas (una sola consulta)."""
+    cursor.execute("SELECT SKU FROM Cantidad_Imagenes_Procesadas")
+    return {fila[0] for fila in cursor.fetchall()}
+
+class BufferRegistrosImagenes:
+    """
+    Acumula en memoria las filas de Cantidad_Imagenes_Procesadas e Imagen_Procesada de cada SKU terminado
+    y las escribe por lotes: una transacción con un executemany por tabla. Si un lote falla se revierte
+    completo y esos SKUs se reprocesan en la siguiente ejecución.
+
+    Los ID_Proceso se reservan una vez por lote, al vaciarlo: SELECT ... FOR UPDATE lee el mayor ID y
+    bloquea el final de la tabla hasta el commit, y cada SKU del lote toma el siguiente. Otra ejecución
+    simultánea espera ese bloqueo, así dos ejecuciones nunca comparten un ID. Las imágenes del SKU que
+    aún no termina sólo están en memoria: si el proceso se interrumpe a mitad del SKU, no se escriben.
+    """
+
+    SELECT_ULTIMO_ID = "SELECT COALESCE(MAX(ID_Proceso), 0) FROM Cantidad_Imagenes_Procesadas FOR UPDATE"
+    INSERT_CANTIDAD = """
+        INSERT INTO Cantidad_Imagenes_Procesadas (ID_Proceso, SKU, Fecha, Cantidad_Imagenes_Procesadas, Imagen_Principal_Foto, Imagen_Por_Defecto, Imagen_Logotipo)
+        VALUES (%s, %s, %s, %s, %s, %s, %s)
+    """
+    INSERT_IMAGEN = """
+        INSERT INTO Imagen_Procesada (ID, SKU, Fecha, Largo_Pixel, Ancho_Pixel, Peso_KB, Formato, Fondo_Blanco, Margen, Escalado, Reduccion)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    """
+
+    def __init__(self, db_conn, cursor, tamano_lote=TAMANO_LOTE_BD):
+        self.db_conn = db_conn
+        self.cursor = cursor
+        self.tamano_lote = max(1, tamano_lote)
+        self.skus_lote = []            # (sku, fecha, datos de Cantidad_Imagenes_Procesadas, imágenes) por SKU terminado
+        self.imagenes_en_curso = []    # (secuencia, fila sin ID) del SKU que aún no termina
+
+    def agregar_imagen(self, image_seq, fila):
+        """Guarda la fila de Imagen_Procesada del SKU en curso; su ID se arma al vaciar el lote."""
+        self.imagenes_en_curso.append((image_seq, fila))
+
+    def agregar_cantidad(self, sku, fecha, fila):
+        """
+        Cierra el SKU en curso con sus datos finales (cantidad, principal, por defecto, logotipo); al
+        completar el lote se escribe todo lo acumulado.
+        """
+        self.skus_lote.append((sku, fecha, fila, self.imagenes_en_curso))
+        self.imagenes_en_curso = []
+        if len(self.skus_lote) >= self.tamano_lote:
+            self.vaciar()
+
+    def vaciar(self):
+        if not self.skus_lote:
+            return
+        filas_cantidad = []
+        filas_imagen = []
+        try:
+            with metricas.medir('escritura_bd'):
+                self.cursor.execute(self.SELECT_ULTIMO_ID)
+                ultimo_id = self.cursor.fetchone()[0]
+                for id_proceso, (sku, fecha, datos, imagenes) in enumerate(self.skus_lote, start=ultimo_id + 1):
+                    filas_cantidad.append((id_proceso, sku, fecha) + datos)
+                    for image_seq, fila in imagenes:
+                        # Con separadores, distintos pares ID_Proceso/SKU/secuencia no pueden formar el mismo ID
+                        filas_imagen.append((f"P-{id_proceso}-{sku}-{image_seq}",) + fila)
+                self.cursor.executemany(self.INSERT_CANTIDAD, filas_cantidad)
+                if filas_imagen:
+                    self.cursor.executemany(self.INSERT_IMAGEN, filas_imagen)
+                self.db_conn.commit()
+            registrar_en_log(f"Lote escrito en la base de datos: {len(filas_cantidad)} SKUs y {len(filas_imagen)} imágenes.")
+        except Exception as e:
+            self.db_conn.rollback()
+            skus = ', '.join(str(registro[0]) for registro in self.skus_lote)
+            registrar_en_log(f"Error al escribir el lote en la base de datos ({skus}): {e}", nivel='error')
+        finally:
+            self.skus_lote = []
+
+#############################################
+# PERFILES DE SALIDA DE IMÁGENES
+#############################################
+
+# Cada perfil define el formato y la extensión. En los formatos con pérdida la calidad se reduce por
+# pasos hasta quedar bajo 'peso_objetivo_kb' (sin bajar de 'calidad_minima'). PNG no tiene peso
+# objetivo: es sin pérdida y sólo usa la compresión máxima; reducirlo a paleta degradaría las fotos.
+PERFILES_SALIDA = {
+    'png_optimizado': {
+        'formato': 'PNG',
+        'extension': '.png',
+    },
+    'jpeg_alta': {
+        'formato': 'JPEG',
+        'extension': '.jpg',
+        'calidad': 90,
+        'calidad_minima': 75,
+        'peso_objetivo_kb': 350,
+    },
+    'webp': {
+        'formato': 'WEBP',
+        'extension': '.webp',
+        'calidad': 85,
+        'calidad_minima': 65,
+        'peso_objetivo_kb': 250,
+    },
+}
+
+PERFIL_IMAGENES = os.getenv('PERFIL_IMAGENES', 'png_optimizado').strip().lower()
+if PERFIL_IMAGENES not in PERFILES_SALIDA:
+    print(f"Perfil de imágenes '{PERFIL_IMAGENES}' no reconocido. Se usará 'png_optimizado'.")
+    PERFIL_IMAGENES = 'png_optimizado'
+PERFIL_ACTIVO = PERFILES_SALIDA[PERFIL_IMAGENES]
+
+def ruta_salida_imagen(carpeta, nombre_base):
+    """Construye la ruta del archivo procesado con la extensión del perfil activo."""
+    return os.path.join(carpeta, f"{nombre_base}{PERFIL_ACTIVO['extension']}")
+
+def codificar_imagen(img, perfil=None):
+    """Codifica la imagen en memoria según el perfil de salida y devuelve los bytes resultantes."""
+    perfil = perfil or PERFIL_ACTIVO
+
+    if perfil['formato'] == 'PNG':
+        ok, buffer = cv2.imencode('.png', img, [cv2.IMWRITE_PNG_COMPRESSION, 9])
+        if not ok:
+            raise ValueError("No se pudo codificar la imagen en PNG.")
+        return buffer.tobytes()
+
+    peso_objetivo = perfil['peso_objetivo_kb'] * 1024
+
+    if perfil['formato'] == 'JPEG':
+        parametros_base = [cv2.IMWRITE_JPEG_OPTIMIZE, 1, cv2.IMWRITE_JPEG_PROGRESSIVE, 1]
+        bandera_calidad = cv2.IMWRITE_JPEG_QUALITY
+    else:
+        parametros_base = []
+        bandera_calidad = cv2.IMWRITE_WEBP_QUALITY
+
+    calidad = perfil['calidad']
+    while True:
+        ok, buffer = cv2.imencode(perfil['extension'], img, [bandera_calidad, calidad] + parametros_base)
+        if not ok:
+            raise ValueError(f"No se pudo codificar la imagen en {perfil['formato']}.")
+        if len(buffer) <= peso_objetivo or calidad <= perfil['calidad_minima']:
+            return buffer.tobytes()
+        calidad = max(perfil['calidad_minima'], calidad - 5)
+
+def eliminar_otras_extensiones(output_path):
+    """Borra las salidas del mismo nombre base con la extensión de otro perfil (de corridas con otro PERFIL_IMAGENES)."""
+    base, extension = os.path.splitext(output_path)
+    for perfil in PERFILES_SALIDA.values():
+        if perfil['extension'] == extension:
+            continue
+        try:
+            os.remove(base + perfil['extension'])
+            registrar_en_log(f"Se eliminó la salida anterior {base + perfil['extension']} generada con otro perfil.")
+        except FileNotFoundError:
+            pass
+
+def guardar_imagen_procesada(img, output_path):
+    """
+    Codifica y guarda la imagen procesada, quitando la versión del mismo nombre en otro formato.
+    Devuelve el peso en bytes del archivo escrito.
+    """
+    with metricas.medir('codificacion'):
+        datos = codificar_imagen(img)
+    with metricas.medir('escritura_disco'):
+        with open(output_path, 'wb') as f:
+            f.write(datos)
+        eliminar_otras_extensiones(output_path)
+    metricas.sumar('bytes_salida', len(datos))
+    return len(datos)
+
 #############################################
 # FUNCIONES DE DESCARGA
 #############################################
 
-def descargar_imagen(url):
+def descargar_imagen(url, cache=None):
+    """Descarga la imagen. Si se pasa un dict como caché, las URL repetidas (p. ej. la imagen por defecto
+    del producto) no se vuelven a pedir."""
+    if cache is not None and url in cache:
+        metricas.sumar('cache_hits')
+        return cache[url]
+    contenido = None
     try:
-        respuesta = requests.get(url, timeout=30)
+        with metricas.medir('descarga'):
+            respuesta = requests.get(url, timeout=30)
         if respuesta.status_code == 200:
-            return respuesta.content
+            contenido = respuesta.content
+            metricas.sumar('bytes_entrada', len(contenido))
         else:
+            metricas.sumar('http_misses')
             registrar_en_log(f'Error al descargar la imagen {url}: Código {respuesta.status_code}', nivel='warning')
-            return None
     except Exception as e:
+        metricas.sumar('http_misses')
         registrar_en_log(f'Error al descargar la imagen {url}: {e}', nivel='error')
-        return None
+    if cache is not None:
+        cache[url] = contenido
+    return contenido
 
 #############################################
 # FUNCIONES DE PROCESAMIENTO DE IMÁGENES
@@ -170,22 +437,112 @@ def convert_transparency_to_white(img_pil):
     image_no_transparency = Image.alpha_composite(background, img_pil)
     return image_no_transparency.convert("RGB")
 
-def encontrar_puntos_extremos(img):
-    gris = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-    mask = gris < 240
+#############################################
+# ANÁLISIS DE IMÁGENES (BBOX, FONDO Y PROPORCIÓN)
+#############################################
+
+# Resultado del análisis de una imagen. 'bbox' es (top, bottom, left, right) o None si no hay contenido.
+AnalisisImagen = namedtuple('AnalisisImagen', ['bbox', 'fondo_blanco', 'cuadrada'])
+
+def _bbox_desde_gris(gris, umbral=240):
+    mask = gris < umbral
     filas = np.any(mask, axis=1)
     columnas = np.any(mask, axis=0)
     if not np.any(filas) or not np.any(columnas):
-        return None, None, None, None
-    top = np.argmax(filas)
-    bottom = len(filas) - np.argmax(filas[::-1]) - 1
-    left = np.argmax(columnas)
-    right = len(columnas) - np.argmax(columnas[::-1]) - 1
+        return None
+    top = int(np.argmax(filas))
+    bottom = int(len(filas) - np.argmax(filas[::-1]) - 1)
+    left = int(np.argmax(columnas))
+    right = int(len(columnas) - np.argmax(columnas[::-1]) - 1)
     return top, bottom, left, right
 
+def _esquinas_de(matriz, patch_size):
+    """Devuelve las cuatro esquinas (patch_size x patch_size) de la matriz apiladas."""
+    alto, ancho = matriz.shape[-2:]
+    return np.stack([
+        matriz[..., 0:patch_size, 0:patch_size],
+        matriz[..., 0:patch_size, ancho-patch_size:ancho],
+        matriz[..., alto-patch_size:alto, 0:patch_size],
+        matriz[..., alto-patch_size:alto, ancho-patch_size:ancho]
+    ], axis=-3)
+
+def _dimensiones_cuadradas(alto, ancho, tol=0.01):
+    mayor = max(alto, ancho)
+    return mayor > 0 and abs(alto - ancho) / mayor <= tol
+
+def _analisis_desde_gris(gris, patch_size=10, umbral=240):
+    bbox = _bbox_desde_gris(gris, umbral)
+    medias_esquinas = _esquinas_de(gris, patch_size).reshape(4, -1).mean(axis=1)
+    fondo_blanco = bool(np.all(medias_esquinas >= umbral))
+    cuadrada = False
+    if bbox is not None:
+        top, bottom, left, right = bbox
+        # El recorte se hace con img[top:bottom, left:right], por eso las dimensiones son bottom-top y right-left
+        cuadrada = _dimensiones_cuadradas(bottom - top, right - left)
+    return AnalisisImagen(bbox, fondo_blanco, cuadrada)
+
+def analizar_imagen(img, patch_size=10, umbral=240):
+    """Calcula en una sola pasada (un único cvtColor) el bbox del contenido, si las esquinas son blancas
+    y si el recorte resultante es cuadrado."""
+    if img.shape[2] == 4:
+        img = img[:, :, :3]
+    gris = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    return _analisis_desde_gris(gris, patch_size, umbral)
+
+def encontrar_puntos_extremos(img):
+    bbox = analizar_imagen(img).bbox
+    if bbox is None:
+        return None, None, None, None
+    return bbox
+
 def es_cuadrada(img, tol=0.01):
     alto, ancho = img.shape[:2]
-    return abs(alto - ancho) / max(alto, ancho) <= tol
+    return _dimensiones_cuadradas(alto, ancho, tol)
+
+def _analisis_original(img, patch_size=10, umbral=240):
+    """Análisis como lo hacía la versión anterior (un cvtColor para el bbox, otro por cada esquina y el
+    recorte medido aparte); se conserva sólo como referencia del benchmark."""
+    gris = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    bbox = _bbox_desde_gris(gris, umbral)
+    alto, ancho = img.shape[:2]
+    fondo_blanco = True
+    for patch in (img[0:patch_size, 0:patch_size], img[0:patch_size, ancho-patch_size:ancho],
+                  img[alto-patch_size:alto, 0:patch_size], img[alto-patch_size:alto, ancho-patch_size:ancho]):
+        if np.mean(cv2.cvtColor(patch, cv2.COLOR_BGR2GRAY)) < umbral:
+            fondo_blanco = False
+            break
+    cuadrada = False
+    if bbox is not None:
+        recortada = img[bbox[0]:bbox[1], bbox[2]:bbox[3]]
+        cuadrada = _dimensiones_cuadradas(recortada.shape[0], recortada.shape[1])
+    return AnalisisImagen(bbox, fondo_blanco, cuadrada)
+
+def benchmark_analisis(carpeta, repeticiones=5):
+    """Mide el costo del análisis por imagen (ms) sobre las imágenes de una carpeta: la versión anterior
+    frente a la pasada única que usa el flujo, y verifica que ambas den el mismo resultado."""
+    imagenes = []
+    for nombre in sorted(os.listdir(carpeta)):
+        if nombre.lower().endswith(('.png', '.jpg', '.jpeg', '.webp')):
+            img = cv2.imread(os.path.join(carpeta, nombre), cv2.IMREAD_COLOR)
+            if img is not None:
+                imagenes.append(img)
+    if not imagenes:
+        registrar_en_log(f"No se encontraron imágenes para el benchmark en {carpeta}", nivel='warning')
+        return None
+
+    diferencias = sum(1 for img in imagenes if _analisis_original(img) != analizar_imagen(img))
+    if diferencias:
+        registrar_en_log(f"Benchmark de análisis: {diferencias} imágenes con resultado distinto entre versiones", nivel='warning')
+
+    resultados = {}
+    for nombre, funcion in (('original', _analisis_original), ('pasada_unica', analizar_imagen)):
+        inicio = time.perf_counter()
+        for _ in range(repeticiones):
+            for img in imagenes:
+                funcion(img)
+        resultados[nombre] = (time.perf_counter() - inicio) * 1000 / (repeticiones * len(imagenes))
+        registrar_en_log(f"Benchmark de análisis '{nombre}': {resultados[nombre]:.3f} ms por imagen ({len(imagenes)} imágenes)")
+    return resultados
 
 def determinar_tamano_escalado(alto, ancho):
     max_dim = max(alto, ancho)
@@ -248,79 +605,85 @@ def agregar_margen(img, porcentaje=0.05, color=(255, 255, 255)):
     )
 
 def tiene_fondo_blanco(img, patch_size=10, umbral=240):
+    # Sólo se convierten a gris las cuatro esquinas, apiladas en un único cvtColor
     alto, ancho = img.shape[:2]
-    esquinas = [
-        img[0:patch_size, 0:patch_size],
-        img[0:patch_size, ancho-patch_size:ancho],
-        img[alto-patch_size:alto, 0:patch_size],
-        img[alto-patch_size:alto, ancho-patch_size:ancho]
-    ]
-    for patch in esquinas:
-        gris_patch = cv2.cvtColor(patch, cv2.COLOR_BGR2GRAY)
-        if np.mean(gris_patch) < umbral:
-            return False
-    return True
+    esquinas = np.concatenate([
+        img[0:patch_size, 0:patch_size, :3],
+        img[0:patch_size, ancho-patch_size:ancho, :3],
+        img[alto-patch_size:alto, 0:patch_size, :3],
+        img[alto-patch_size:alto, ancho-patch_size:ancho, :3]
+    ], axis=0)
+    gris = cv2.cvtColor(esquinas, cv2.COLOR_BGR2GRAY)
+    return bool(np.all(gris.reshape(4, -1).mean(axis=1) >= umbral))
 
 def procesar_imagen(img, margen_porcentaje=0.05):
+    """Recorta, escala y agrega margen. Devuelve la imagen procesada y el análisis de la original, que
+    también se usa para el registro en Imagen_Procesada."""
     if img.shape[2] == 4:
         img = img[:, :, :3]
-    top, bottom, left, right = encontrar_puntos_extremos(img)
-    if None in (top, bottom, left, right):
+    analisis = analizar_imagen(img)
+    if analisis.bbox is None:
         raise ValueError("No se pudieron encontrar los bordes para recortar.")
+    top, bottom, left, right = analisis.bbox
     recortada = img[top:bottom, left:right]
-    cuadrada = es_cuadrada(recortada)
     size = determinar_tamano_escalado(recortada.shape[0], recortada.shape[1])
-    if cuadrada:
+    if analisis.cuadrada:
         img_procesada = escalar_a_cuadrado_sin_margen(recortada, size=size)
     else:
         img_procesada = escalar_a_cuadrado_con_margen(recortada, size=size)
-    if tiene_fondo_blanco(img):
+    if analisis.fondo_blanco:
         img_procesada = agregar_margen(img_procesada, porcentaje=margen_porcentaje, color=(255, 255, 255))
-    return img_procesada
+    return img_procesada, analisis
 
 def procesar_imagen_bytes(imagen_bytes, margen_porcentaje=0.05):
-    image_pil = Image.open(BytesIO(imagen_bytes)).convert("RGBA")
-    image_no_transparency = convert_transparency_to_white(image_pil)
-    bbox = image_no_transparency.getbbox()
-    cropped_image = image_no_transparency.crop(bbox)
-    final_image = cropped_image.convert("RGB")
-    cv_image = cv2.cvtColor(np.array(final_image), cv2.COLOR_RGB2BGR)
-    return procesar_imagen(cv_image, margen_porcentaje=margen_porcentaje)
+    with metricas.medir('decodificacion'):
+        image_pil = Image.open(BytesIO(imagen_bytes)).convert("RGBA")
+        image_no_transparency = convert_transparency_to_white(image_pil)
+        # getbbox recorta los bordes negros puros; los casi blancos los recorta después analizar_imagen
+        image_no_transparency = image_no_transparency.crop(image_no_transparency.getbbox())
+        cv_image = cv2.cvtColor(np.asarray(image_no_transparency), cv2.COLOR_RGB2BGR)
+    with metricas.medir('transformacion'):
+        return procesar_imagen(cv_image, margen_porcentaje=margen_porcentaje)
 
 def process_and_save_image(imagen_bytes, output_path, margen_porcentaje=0.05):
-    processed_image = procesar_imagen_bytes(imagen_bytes, margen_porcentaje)
-    cv2.imwrite(output_path, processed_image)
-    registrar_en_log(f"Imagen procesada guardada en: {output_path}")
+    processed_image, analisis = procesar_imagen_bytes(imagen_bytes, margen_porcentaje)
+    peso_bytes = guardar_imagen_procesada(processed_image, output_path)
+    metricas.sumar('imagenes_procesadas')
+    registrar_en_log(f"Imagen procesada guardada en: {output_path} ({round(peso_bytes / 1024)} KB, {PERFIL_ACTIVO['formato']})")
+    return processed_image, peso_bytes, analisis
 
 #############################################
 # FUNCIONES PARA INSERTAR REGISTROS EN LA TABLA IMAGEN_PROCESADA
 #############################################
 
-def insert_imagen_procesada_record(ruta_imagen, sku, fecha, process_id, image_seq, cursor, db_conn):
+def insert_imagen_procesada_record(ruta_imagen, sku, fecha, image_seq, buffer_bd, img=None, peso_bytes=None, analisis=None):
+    """
+    Arma la fila de Imagen_Procesada y la deja en el buffer; se escribe junto con el resto del lote.
+    Fondo_Blanco y Margen salen del análisis de la imagen original hecho en procesar_imagen (el margen
+    blanco se agrega justamente cuando el fondo es blanco); sólo se analiza de nuevo si no se recibe.
+    """
     try:
-        img = cv2.imread(ruta_imagen)
+        if img is None:
+            img = cv2.imread(str(ruta_imagen))
         if img is None:
             registrar_en_log(f"No se pudo leer la imagen para insertar en Imagen_Procesada para SKU {sku}", nivel='error')
             return
         alto, ancho = img.shape[:2]
-        peso_bytes = os.path.getsize(ruta_imagen)
+        if peso_bytes is None:
+            peso_bytes = os.path.getsize(ruta_imagen)
         peso_kb = round(peso_bytes / 1024)
-        formato = "PNG"
-        fondo_blanco = 1 if tiene_fondo_blanco(img) else 0
+        formato = PERFIL_ACTIVO['formato']
+        if analisis is None:
+            analisis = analizar_imagen(img)
+        fondo_blanco = 1 if analisis.fondo_blanco else 0
         margen = 1 if fondo_blanco == 1 else 0
         escalado = 1
         reduccion = 0
-        custom_id = "P-" + str(process_id) + sku + str(image_seq)
-        insert_query = """
-            INSERT INTO Imagen_Procesada (ID, SKU, Fecha, Largo_Pixel, Ancho_Pixel, Peso_KB, Formato, Fondo_Blanco, Margen, Escalado, Reduccion)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
-        values = (custom_id, sku, fecha, alto, ancho, peso_kb, formato, fondo_blanco, margen, escalado, reduccion)
-        cursor.execute(insert_query, values)
-        db_conn.commit()
-        registrar_en_log(f"Registro insertado en Imagen_Procesada con ID {custom_id} para SKU \"{sku}\" en {ruta_imagen}")
+        values = (sku, fecha, alto, ancho, peso_kb, formato, fondo_blanco, margen, escalado, reduccion)
+        buffer_bd.agregar_imagen(image_seq, values)
+        registrar_en_log(f"Registro preparado para Imagen_Procesada (imagen {image_seq}) para SKU \"{sku}\" en {ruta_imagen}")
     except Exception as e:
-        registrar_en_log(f"Error al insertar registro en Imagen_Procesada para SKU \"{sku}\": {e}", nivel='error')
+        registrar_en_log(f"Error al preparar el registro de Imagen_Procesada para SKU \"{sku}\": {e}", nivel='error')
 
 #############################################
 # GESTIÓN DEL ARCHIVO JSON
@@ -344,6 +707,8 @@ def eliminar_json_antiguos():
 #############################################
 
 def procesar_imagenes():
+    global metricas
+    metricas = MetricasImagenes()
     total_imagenes = 0
     db_conn = get_db_connection()
     cursor = db_conn.cursor()
@@ -361,143 +726,147 @@ def procesar_imagenes():
             datos_producto = json.load(archivo_json)
     except Exception as e:
         registrar_en_log(f"Error al cargar el JSON {latest_json}: {e}", nivel='error')
+        cursor.close()
+        db_conn.close()
         return
     if not isinstance(datos_producto, list):
         registrar_en_log(f"Formato de JSON no esperado en {latest_json}", nivel='warning')
+        cursor.close()
+        db_conn.close()
         return
+
+    # Una sola consulta para conocer los SKU ya procesados
+    skus_procesados = obtener_skus_procesados(cursor)
+    buffer_bd = BufferRegistrosImagenes(db_conn, cursor)
+    # Carpetas de SKU ya existentes en ImagenesProcesadasCT, listadas una sola vez
+    indice_procesadas = IndiceDirectorios(ruta_imagenes_procesadas)
     
-    for contador, producto in enumerate(datos_producto, start=1):
-        sku = producto.get('clave')
-        nombre = producto.get('nombre')
-        registrar_en_log(f"{contador}: Producto \"{nombre}\" con SKU \"{sku}\"")
+    try:
+        for contador, producto in enumerate(datos_producto, start=1):
+            sku = producto.get('clave')
+            nombre = producto.get('nombre')
+            registrar_en_log(f"{contador}: Producto \"{nombre}\" con SKU \"{sku}\"")
         
-        # Verificar si el SKU ya existe en la tabla
-        query = "SELECT COUNT(*) FROM Cantidad_Imagenes_Procesadas WHERE SKU = %s"
-        cursor.execute(query, (sku,))
-        (count,) = cursor.fetchone()
-        if count > 0:
-            registrar_en_log(f"El SKU \"{sku}\" ya está registrado en Cantidad_Imagenes_Procesadas. Se salta este producto.", nivel='info')
-            continue
+            # Verificar si el SKU ya existe en la tabla
+            if sku in skus_procesados:
+                registrar_en_log(f"El SKU \"{sku}\" ya está registrado en Cantidad_Imagenes_Procesadas. Se salta este producto.", nivel='info')
+                continue
+            skus_procesados.add(sku)
         
-        # Crear o usar carpeta para este SKU
-        carpeta_procesada = os.path.join(ruta_imagenes_procesadas, sku)
-        if not os.path.exists(carpeta_procesada):
-            os.makedirs(carpeta_procesada)
-        else:
-            registrar_en_log(f"Carpeta para SKU \"{sku}\" ya existe, se continuará el proceso.")
+            # Crear o usar carpeta para este SKU
+            carpeta_procesada = os.path.join(ruta_imagenes_procesadas, sku)
+            if not indice_procesadas.tiene_sku(sku):
+                os.makedirs(carpeta_procesada, exist_ok=True)
+            else:
+                registrar_en_log(f"Carpeta para SKU \"{sku}\" ya existe, se continuará el proceso.")
         
-        # Insertar registro inicial en Cantidad_Imagenes_Procesadas (Imagen_Logotipo inicial en 0)
-        fecha_actual = datetime.datetime.now().strftime("%d/%m/%Y")
-        insert_query = "INSERT INTO Cantidad_Imagenes_Procesadas (SKU, Fecha, Cantidad_Imagenes_Procesadas, Imagen_Principal_Foto, Imagen_Por_Defecto, Imagen_Logotipo) VALUES (%s, %s, %s, %s, %s, %s)"
-        initial_values = (sku, fecha_actual, 0, 0, 0, 0)
-        cursor.execute(insert_query, initial_values)
-        db_conn.commit()
-        process_id = cursor.lastrowid
-        image_seq = 1
+            # El ID_Proceso se asigna al escribir el lote; mientras tanto las filas del SKU quedan en memoria
+            fecha_actual = datetime.datetime.now().strftime("%d/%m/%Y")
+            image_seq = 1
         
-        product_image_count = 0
-        main_processed = 0
-        default_used = 0
+            product_image_count = 0
+            main_processed = 0
+            default_used = 0
+            descargas_sku = {}  # Caché de descargas del SKU: la imagen por defecto se usa hasta dos veces
         
-        # Procesar imagen principal
-        url_imagen_principal = f'https://static.ctonline.mx/imagenes/{sku}/{sku}_full.jpg'
-        imagen_principal = descargar_imagen(url_imagen_principal)
-        if not imagen_principal:
-            default_url = producto.get("imagen")
-            if default_url:
-                registrar_en_log(f"No se encontró imagen principal para SKU \"{sku}\" en la URL: {url_imagen_principal}. Se intentará con imagen por defecto.", nivel='warning')
-                imagen_principal = descargar_imagen(default_url)
-                if imagen_principal:
-                    default_used = 1
-        if imagen_principal:
-            ruta_imagen_final_procesada = os.path.join(carpeta_procesada, f'{sku}_mejor_procesada.png')
-            try:
-                process_and_save_image(imagen_principal, ruta_imagen_final_procesada)
-                main_img = cv2.imread(ruta_imagen_final_procesada)
-                if main_img is None:
-                    raise Exception("No se pudo leer la imagen principal procesada")
-                main_area = main_img.shape[0] * main_img.shape[1]
+            # Procesar imagen principal
+            url_imagen_principal = f'https://static.ctonline.mx/imagenes/{sku}/{sku}_full.jpg'
+            imagen_principal = descargar_imagen(url_imagen_principal, descargas_sku)
+            if not imagen_principal:
                 default_url = producto.get("imagen")
-                default_area = 0
-                default_processed = None
                 if default_url:
-                    imagen_default = descargar_imagen(default_url)
-                    if imagen_default:
-                        default_processed = procesar_imagen_bytes(imagen_default)
-                        default_area = default_processed.shape[0] * default_processed.shape[1]
-                if default_processed is not None and default_area > main_area:
-                    cv2.imwrite(ruta_imagen_final_procesada, default_processed)
-                    registrar_en_log(f"Se usó la imagen por defecto como _mejor_procesada para SKU \"{sku}\" por mayor resolución.")
-                    default_used = 1
-                main_processed = 1
-                product_image_count += 1
-                total_imagenes += 1
-                insert_imagen_procesada_record(ruta_imagen_final_procesada, sku, fecha_actual, process_id, image_seq, cursor, db_conn)
-                image_seq += 1
-            except Exception as e:
-                registrar_en_log(f"Error procesando la imagen principal para SKU \"{sku}\": {e}", nivel='error')
-        else:
-            registrar_en_log(f"No se encontró imagen principal para SKU \"{sku}\" en la URL: {url_imagen_principal}", nivel='error')
-        
-        # Procesar imágenes secundarias
-        for i in range(1, 20):
-            url_imagen_secundaria = f'https://static.ctonline.mx/imagenes/{sku}/{sku}_{i}_full.jpg'
-            imagen_secundaria = descargar_imagen(url_imagen_secundaria)
-            if imagen_secundaria:
-                ruta_imagen_secundaria_procesada = os.path.join(carpeta_procesada, f'{sku}_secundaria_{i}_procesada.png')
+                    registrar_en_log(f"No se encontró imagen principal para SKU \"{sku}\" en la URL: {url_imagen_principal}. Se intentará con imagen por defecto.", nivel='warning')
+                    imagen_principal = descargar_imagen(default_url, descargas_sku)
+                    if imagen_principal:
+                        default_used = 1
+            if imagen_principal:
+                ruta_imagen_final_procesada = ruta_salida_imagen(carpeta_procesada, f'{sku}_mejor_procesada')
                 try:
-                    process_and_save_image(imagen_secundaria, ruta_imagen_secundaria_procesada)
-                    registrar_en_log(f"Imagen secundaria {i} para SKU \"{sku}\" procesada.")
+                    main_img, main_peso, main_analisis = process_and_save_image(imagen_principal, ruta_imagen_final_procesada)
+                    main_area = main_img.shape[0] * main_img.shape[1]
+                    default_url = producto.get("imagen")
+                    default_area = 0
+                    default_processed = None
+                    default_analisis = None
+                    if default_url and default_used:
+                        # La principal ya es la imagen por defecto; no hace falta procesarla otra vez
+                        metricas.sumar('cache_hits')
+                    elif default_url:
+                        imagen_default = descargar_imagen(default_url, descargas_sku)
+                        if imagen_default:
+                            default_processed, default_analisis = procesar_imagen_bytes(imagen_default)
+                            default_area = default_processed.shape[0] * default_processed.shape[1]
+                    if default_processed is not None and default_area > main_area:
+                        main_peso = guardar_imagen_procesada(default_processed, ruta_imagen_final_procesada)
+                        main_img = default_processed
+                        main_analisis = default_analisis
+                        registrar_en_log(f"Se usó la imagen por defecto como _mejor_procesada para SKU \"{sku}\" por mayor resolución.")
+                        default_used = 1
+                    main_processed = 1
                     product_image_count += 1
                     total_imagenes += 1
-                    insert_imagen_procesada_record(ruta_imagen_secundaria_procesada, sku, fecha_actual, process_id, image_seq, cursor, db_conn)
+                    insert_imagen_procesada_record(ruta_imagen_final_procesada, sku, fecha_actual, image_seq, buffer_bd,
+                                                   img=main_img, peso_bytes=main_peso, analisis=main_analisis)
                     image_seq += 1
                 except Exception as e:
-                    registrar_en_log(f"Error procesando imagen secundaria {i} para SKU \"{sku}\": {e}", nivel='error')
+                    registrar_en_log(f"Error procesando la imagen principal para SKU \"{sku}\": {e}", nivel='error')
             else:
-                registrar_en_log(f"No se encontró imagen secundaria {i} para SKU \"{sku}\" en la URL: {url_imagen_secundaria}", nivel='warning')
+                registrar_en_log(f"No se encontró imagen principal para SKU \"{sku}\" en la URL: {url_imagen_principal}", nivel='error')
         
-        # Actualizar registro en Cantidad_Imagenes_Procesadas con los datos finales obtenidos
-        update_query = """
-            UPDATE Cantidad_Imagenes_Procesadas
-            SET Cantidad_Imagenes_Procesadas = %s,
-                Imagen_Principal_Foto = %s,
-                Imagen_Por_Defecto = %s,
-                Imagen_Logotipo = %s
-            WHERE ID_Proceso = %s
-        """
-        logo_flag = 0  # Por defecto, no se usó el logo
-        update_values = (product_image_count, main_processed, default_used, logo_flag, process_id)
-        cursor.execute(update_query, update_values)
-        db_conn.commit()
+            # Procesar imágenes secundarias
+            for i in range(1, 20):
+                url_imagen_secundaria = f'https://static.ctonline.mx/imagenes/{sku}/{sku}_{i}_full.jpg'
+                imagen_secundaria = descargar_imagen(url_imagen_secundaria, descargas_sku)
+                if imagen_secundaria:
+                    ruta_imagen_secundaria_procesada = ruta_salida_imagen(carpeta_procesada, f'{sku}_secundaria_{i}_procesada')
+                    try:
+                        secundaria_img, secundaria_peso, secundaria_analisis = process_and_save_image(imagen_secundaria, ruta_imagen_secundaria_procesada)
+                        registrar_en_log(f"Imagen secundaria {i} para SKU \"{sku}\" procesada.")
+                        product_image_count += 1
+                        total_imagenes += 1
+                        insert_imagen_procesada_record(ruta_imagen_secundaria_procesada, sku, fecha_actual, image_seq, buffer_bd,
+                                                       img=secundaria_img, peso_bytes=secundaria_peso, analisis=secundaria_analisis)
+                        image_seq += 1
+                    except Exception as e:
+                        registrar_en_log(f"Error procesando imagen secundaria {i} para SKU \"{sku}\": {e}", nivel='error')
+                else:
+                    registrar_en_log(f"No se encontró imagen secundaria {i} para SKU \"{sku}\" en la URL: {url_imagen_secundaria}", nivel='warning')
         
-        # Si al finalizar no se descargó ninguna imagen, usar la imagen del logotipo.
-        # En este caso se debe registrar:
-        #   Cantidad_Imagenes_Procesadas = 1, Imagen_Principal_Foto = 0, Imagen_Por_Defecto = 0, y Imagen_Logotipo = 1.
-        if product_image_count == 0:
-            registrar_en_log(f"No se encontraron imágenes para SKU \"{sku}\". Se usará la imagen de logotipo.", nivel='warning')
-            fallback_image_path        = DIRECTORIOS['IconoBitAndByte']
-            fallback_image_destination = Path(carpeta_procesada) / f"{sku}_BitAndByte.png"
-            try:
-                with open(fallback_image_path, 'rb') as f:
-                    fallback_image_bytes = f.read()
-                process_and_save_image(fallback_image_bytes, fallback_image_destination)
-                # Se asigna 1 imagen (la del logotipo)
-                product_image_count = 1
-                total_imagenes += 1
-                insert_imagen_procesada_record(fallback_image_destination, sku, fecha_actual, process_id, image_seq, cursor, db_conn)
-                image_seq += 1
-                # En este fallback, se dejan en 0 las columnas Imagen_Principal_Foto y Imagen_Por_Defecto,
-                # y se marca Imagen_Logotipo = 1.
-                logo_flag = 1
-                update_values = (product_image_count, 0, 0, logo_flag, process_id)
-                cursor.execute(update_query, update_values)
-                db_conn.commit()
-                registrar_en_log(f"Se utilizó la imagen de logotipo para SKU \"{sku}\".", nivel='info')
-            except Exception as e:
-                registrar_en_log(f"Error al procesar la imagen de logotipo para SKU \"{sku}\": {e}", nivel='error')
+            logo_flag = 0  # Por defecto, no se usó el logo
+        
+            # Si al finalizar no se descargó ninguna imagen, usar la imagen del logotipo.
+            # En este caso se debe registrar:
+            #   Cantidad_Imagenes_Procesadas = 1, Imagen_Principal_Foto = 0, Imagen_Por_Defecto = 0, y Imagen_Logotipo = 1.
+            if product_image_count == 0:
+                registrar_en_log(f"No se encontraron imágenes para SKU \"{sku}\". Se usará la imagen de logotipo.", nivel='warning')
+                fallback_image_path        = DIRECTORIOS['IconoBitAndByte']
+                fallback_image_destination = ruta_salida_imagen(carpeta_procesada, f"{sku}_BitAndByte")
+                try:
+                    with open(fallback_image_path, 'rb') as f:
+                        fallback_image_bytes = f.read()
+                    fallback_img, fallback_peso, fallback_analisis = process_and_save_image(fallback_image_bytes, fallback_image_destination)
+                    # Se asigna 1 imagen (la del logotipo)
+                    product_image_count = 1
+                    total_imagenes += 1
+                    insert_imagen_procesada_record(fallback_image_destination, sku, fecha_actual, image_seq, buffer_bd,
+                                                   img=fallback_img, peso_bytes=fallback_peso, analisis=fallback_analisis)
+                    image_seq += 1
+                    # En este fallback, se dejan en 0 las columnas Imagen_Principal_Foto y Imagen_Por_Defecto,
+                    # y se marca Imagen_Logotipo = 1.
+                    main_processed = 0
+                    default_used = 0
+                    logo_flag = 1
+                    registrar_en_log(f"Se utilizó la imagen de logotipo para SKU \"{sku}\".", nivel='info')
+                except Exception as e:
+                    registrar_en_log(f"Error al procesar la imagen de logotipo para SKU \"{sku}\": {e}", nivel='error')
         
-        registrar_en_log(f"Registro actualizado en Cantidad_Imagenes_Procesadas para SKU \"{sku}\" con {product_image_count} imágenes procesadas.")
+            # Registrar en Cantidad_Imagenes_Procesadas los datos finales obtenidos (se escribe con el lote)
+            buffer_bd.agregar_cantidad(sku, fecha_actual, (product_image_count, main_processed, default_used, logo_flag))
+            registrar_en_log(f"Registro preparado en Cantidad_Imagenes_Procesadas para SKU \"{sku}\" con {product_image_count} imágenes procesadas.")
+    finally:
+        # Escribir lo que quede pendiente del último lote, aun si el ciclo se interrumpe; sólo los SKUs
+        # terminados: el que quedó a medias se reprocesa en la siguiente ejecución
+        buffer_bd.vaciar()
     
     registrar_en_log(f"\nTotal de imágenes procesadas: {total_imagenes}\n")
     cursor.close()
@@ -511,6 +880,10 @@ def procesar_imagenes_programada():
         eliminar_json_antiguos()
     except Exception as e:
         registrar_en_log(f"Error inesperado durante el procesamiento: {e}", nivel='error')
+    try:
+        metricas.exportar(ruta_logs)
+    except Exception as e:
+        registrar_en_log(f"Error al exportar las métricas de imágenes: {e}", nivel='error')
     fin = datetime.datetime.now()
     registrar_en_log(f"---- Fin del proceso: {fin.strftime('%Y-%m-%d %H:%M:%S')} ----")
 
@@ -519,6 +892,10 @@ def procesar_imagenes_programada():
 #############################################
 
 if __name__ == "__main__":
+    # Uso: python ShopifyImagenesFinalCompleto_2.3.4.py --benchmark-analisis <carpeta_con_imagenes>
+    if len(sys.argv) > 2 and sys.argv[1] == '--benchmark-analisis':
+        benchmark_analisis(sys.argv[2])
+        sys.exit(0)
     registrar_en_log("Servicio de procesamiento de imágenes iniciado.")
     create_database_and_tables()
     procesar_imagenes_programada()
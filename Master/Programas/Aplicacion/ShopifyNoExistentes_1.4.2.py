@@ -4,14 +4,16 @@ import json
 import requests
 import time
 from datetime import datetime, timezone
-from jinja2 import Template
+from concurrent.futures import ThreadPoolExecutor
+from jinja2 import TemplateNotFound
 import logging
-import base64
 from dotenv import load_dotenv
 from tenacity import retry, wait_exponential, stop_after_attempt, retry_if_exception_type
 import re  # Importar regex para sanitización
 from pathlib import Path
 from Aplicacion.config import DIRECTORIOS
+from Aplicacion.plantillas import obtener_plantilla
+from Aplicacion.shopify_medios import SubidorMediosShopify, listar_imagenes_producto, resolver_subidas_pendientes, SUBIDAS_EN_PARALELO
 
 # Cargar variables de entorno desde .env
 load_dotenv()
@@ -30,6 +32,10 @@ headers = {
     "X-Shopify-Access-Token": access_token
 }
 
+# Las imágenes se suben en segundo plano (varios productos a la vez) mientras se crean los siguientes productos;
+# el pool de hilos de las subidas se abre y se cierra en main()
+subidor_medios = SubidorMediosShopify(f'{base_url}/graphql.json', access_token)
+
 # Configuración de cálculos
 IVA = 0.16
 UTILIDAD_BRUTA = 0.45
@@ -301,21 +307,20 @@ def crear_metafield(product_id, metafield):
         return False
 
 def cargar_plantilla(ruta_ficha):
+    """Devuelve la plantilla compilada; se lee y compila una sola vez por ejecución."""
     try:
-        with open(ruta_ficha, 'r', encoding='utf-8') as file:
-            plantilla = file.read()
-            print_message(f"Plantilla cargada desde {ruta_ficha}", 'info')
-            return plantilla
-    except FileNotFoundError:
+        plantilla = obtener_plantilla(ruta_ficha)
+        print_message(f"Plantilla cargada desde {ruta_ficha}", 'info')
+        return plantilla
+    except (FileNotFoundError, TemplateNotFound):
         print_message(f"Archivo de plantilla no encontrado en {ruta_ficha}", 'error')
         raise
     except Exception as e:
         print_message(f"Error al cargar la plantilla: {str(e)}", 'error')
         raise
 
-def generar_html(template_str, product_data, pdf_url=None):
+def generar_html(template, product_data, pdf_url=None):
     try:
-        template = Template(template_str)
         especificaciones = product_data.get("especificaciones", [])
         if especificaciones is None:
             especificaciones = []
@@ -389,91 +394,21 @@ def obtener_id_producto_por_sku(sku, sku_to_id):
     print_message(f"Buscando ID de producto para SKU: {sku}", 'debug')
     return sku_to_id.get(sku)
 
-def subir_imagenes_al_producto(product_id, sku):
+def subir_imagenes_al_producto(executor, product_id, sku, nombre=''):
+    """
+    Programa en el executor la subida de las imágenes procesadas del SKU (staged upload + productCreateMedia).
+    Devuelve un Future con la cantidad de imágenes adjuntadas, o None si no hay imágenes.
+    """
     print_message(f"Subiendo imágenes para producto ID: {product_id} | SKU: {sku}", 'info')
     # Ruta de las imágenes según el SKU
     ruta_imagenes = os.path.join(ruta_imagenes_procesadas, sku)
-
-    if not os.path.exists(ruta_imagenes):
-        print_message(f"No se encontraron imágenes para el SKU '{sku}' en la ruta '{ruta_imagenes}'.", 'warning')
-        return 0
-
-    imagenes = [os.path.join(ruta_imagenes, img) for img in os.listdir(ruta_imagenes) if img.lower().endswith(('.png', '.jpg', '.jpeg', '.gif'))]
+    imagenes = listar_imagenes_producto(ruta_imagenes)
 
     if not imagenes:
-        print_message(f"No se encontraron imágenes en la carpeta {ruta_imagenes}.", 'warning')
-        return 0
-
-    imagen_principal = None
-    imagenes_restantes = []
-
-    # Determinar la imagen principal y ordenar el resto
-    for imagen in imagenes:
-        if "_full" in os.path.basename(imagen).lower() or not imagen_principal:
-            imagen_principal = imagen
-        else:
-            imagenes_restantes.append(imagen)
-
-    imagenes_subidas = 0
-    total_imagenes = len(imagenes)
-
-    # Subir la imagen principal primero
-    if imagen_principal:
-        try:
-            with open(imagen_principal, 'rb') as img_file:
-                encoded_image = base64.b64encode(img_file.read()).decode('utf-8')
-                image_data = {
-                    "image": {
-                        "attachment": encoded_image,
-                        "position": 1
-                    }
-                }
-
-            response = requests.post(f'{base_url}/products/{product_id}/images.json', json=image_data, headers=headers, timeout=30)
-            if response.status_code in [200, 201]:
-                print_message(f"Imagen principal '{os.path.basename(imagen_principal)}' subida con éxito", 'info')
-                imagenes_subidas += 1
-            elif response.status_code == 429:
-                print_message("Límite de tasa alcanzado durante la subida de la imagen principal. Esperando antes de reintentar...", 'warning')
-                time.sleep(10)
-                return subir_imagenes_al_producto(product_id, sku)  # Reintentar
-            else:
-                print_message(f"Fallo al subir la imagen principal '{os.path.basename(imagen_principal)}': {response.status_code}, {response.text}", 'error')
-        except Exception as e:
-            print_message(f"Error al subir la imagen principal '{os.path.basename(imagen_principal)}': {str(e)}", 'error')
-
-    # Subir las imágenes restantes
-    for idx, imagen in enumerate(imagenes_restantes, start=2):
-        try:
-            with open(imagen, 'rb') as img_file:
-                encoded_image = base64.b64encode(img_file.read()).decode('utf-8')
-                image_data = {
-                    "image": {
-                        "attachment": encoded_image,
-                        "position": idx
-                    }
-                }
-
-            response = requests.post(f'{base_url}/products/{product_id}/images.json', json=image_data, headers=headers, timeout=30)
-            if response.status_code in [200, 201]:
-                print_message(f"Imagen {idx}: '{os.path.basename(imagen)}' subida con éxito", 'info')
-                imagenes_subidas += 1
-            elif response.status_code == 429:
-                print_message("Límite de tasa alcanzado durante la subida de imágenes restantes. Esperando antes de reintentar...", 'warning')
-                time.sleep(10)
-                return subir_imagenes_al_producto(product_id, sku)  # Reintentar
-            else:
-                print_message(f"Fallo al subir la imagen '{os.path.basename(imagen)}': {response.status_code}, {response.text}", 'error')
-        except Exception as e:
-            print_message(f"Error al subir la imagen '{os.path.basename(imagen)}': {str(e)}", 'error')
-
-    # Verificar que el número de imágenes subidas coincida con el número de imágenes en la carpeta
-    if imagenes_subidas == total_imagenes:
-        print_message(f"--- Se subieron correctamente todas las {imagenes_subidas} imágenes ---", 'info')
-    else:
-        print_message(f"--- Se esperaba subir {total_imagenes} imágenes, pero solo se subieron {imagenes_subidas}. ---", 'warning')
+        print_message(f"No se encontraron imágenes para el SKU '{sku}' en la ruta '{ruta_imagenes}'.", 'warning')
+        return None
 
-    return imagenes_subidas  # Retornamos la cantidad de imágenes subidas exitosamente
+    return executor.submit(subidor_medios.subir_imagenes, product_id, imagenes, nombre)
 
 def read_products_from_coincidencias(coincidencias):
     """
@@ -520,7 +455,7 @@ def guardar_en_archivo(productos, nombre_archivo):
         print_message(f"Error al guardar el archivo CSV {nombre_archivo}: {str(e)}", 'error')
 
 @retry(wait=wait_exponential(multiplier=1, min=4, max=10), stop=stop_after_attempt(5), retry=retry_if_exception_type(requests.exceptions.RequestException))
-def crear_producto_sin_variantes(product_data, index, productos_creados, productos_fallidos, location_id, skus_existentes, sku_to_id):
+def crear_producto_sin_variantes(product_data, index, productos_creados, productos_fallidos, location_id, skus_existentes, sku_to_id, executor, subidas):
     print_message(f"Iniciando creación del producto {index}: SKU {product_data.get('sku', 'Sin SKU')}", 'debug')
     sku = product_data.get('sku', 'Sin SKU')
     nombre = product_data.get('nombre', 'Sin nombre')
@@ -627,13 +562,13 @@ def crear_producto_sin_variantes(product_data, index, productos_creados, product
 
         # Cargar la plantilla adecuada
         if tiene_pdf:
-            plantilla_str = cargar_plantilla(ruta_ficha_con_boton)
+            plantilla = cargar_plantilla(ruta_ficha_con_boton)
             print_message("Plantilla con botón cargada correctamente.", 'info')
-            html_description = generar_html(template_str=plantilla_str, product_data=product_data, pdf_url=pdf_url)
+            html_description = generar_html(template=plantilla, product_data=product_data, pdf_url=pdf_url)
         else:
-            plantilla_str = cargar_plantilla(ruta_ficha_sin_boton)
+            plantilla = cargar_plantilla(ruta_ficha_sin_boton)
             print_message("Plantilla sin botón cargada correctamente.", 'info')
-            html_description = generar_html(template_str=plantilla_str, product_data=product_data)
+            html_description = generar_html(template=plantilla, product_data=product_data)
 
         # Generación de etiquetas
         tags = list(filter(None, [
@@ -762,18 +697,19 @@ def crear_producto_sin_variantes(product_data, index, productos_creados, product
             return False
 
         ruta_imagenes_producto = os.path.join(ruta_imagenes_procesadas, sku)
-        cantidad_imagenes_subidas = 0
 
         # **Imprimir el índice y la información del producto antes de procesar imágenes**
         print_message(f"{index}.- Producto '{sku}' en subcategoría '{subcategoria}' - ¡Creado Exitosamente!", 'info')
         print_message(f"Nombre: {nombre.strip()} | Stock Total: {existencia_total} | Precio en Venta: {precio_venta:.2f} MXN | Promoción: {'Sí' if promocion_activa else 'No'}", 'info')
 
         if os.path.exists(ruta_imagenes_producto):
-            imagenes_encontradas = len([img for img in os.listdir(ruta_imagenes_producto) if img.lower().endswith(('.png', '.jpg', '.jpeg', '.gif'))])
+            imagenes_encontradas = len([img for img in os.listdir(ruta_imagenes_producto) if img.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.webp'))])
             print_message(f"--- Se encontraron {imagenes_encontradas} imágenes en la carpeta {ruta_imagenes_producto} ---", 'info')
 
             # Subir imágenes para el producto creado y obtener la cantidad de imágenes subidas
-            cantidad_imagenes_subidas = subir_imagenes_al_producto(product_id, sku)
+            futuro = subir_imagenes_al_producto(executor, product_id, sku, nombre.strip())
+            if futuro:
+                subidas[sku] = futuro
         else:
             print_message(f"No se encontraron imágenes para el SKU '{sku}' en la ruta '{ruta_imagenes_producto}'. Se creará el producto sin imágenes.", 'warning')
 
@@ -838,7 +774,7 @@ def crear_producto_sin_variantes(product_data, index, productos_creados, product
             'Promoción': 'Sí' if promocion_activa else 'No',
             'Vigencia': fecha_fin_promocion.date().isoformat() if promocion_activa else 'Sin Vigencia',
             'Status': 'Creado',
-            'Cantidad de Imágenes Subidas': cantidad_imagenes_subidas,
+            'Cantidad de Imágenes Subidas': 0,  # Se completa al resolver las subidas pendientes
             'Enlace': enlace_producto  # Agregamos el enlace
         })
     except Exception as e:
@@ -917,22 +853,26 @@ def probar_autenticacion():
         print_message(f"Error al realizar la solicitud de prueba: {str(e)}", 'error')
         return False
 
-def crear_producto_sin_variantes_wrapper(product_data, index, productos_creados, productos_fallidos, location_id, skus_existentes, sku_to_id):
+def crear_producto_sin_variantes_wrapper(product_data, index, productos_creados, productos_fallidos, location_id, skus_existentes, sku_to_id, executor, subidas):
     try:
-        crear_producto_sin_variantes(product_data, index, productos_creados, productos_fallidos, location_id, skus_existentes, sku_to_id)
+        crear_producto_sin_variantes(product_data, index, productos_creados, productos_fallidos, location_id, skus_existentes, sku_to_id, executor, subidas)
     except Exception as e:
         print_message(f"Se produjo un error al intentar crear el producto {product_data.get('sku', 'Sin SKU')}: {str(e)}", 'error')
 
-def procesar_coincidencias(coincidencias, skus_existentes, sku_to_id, location_id):
+def procesar_coincidencias(coincidencias, skus_existentes, sku_to_id, location_id, executor):
     print_message("\n ---- Procesando productos en 'CoincidenciasSinExistencias' para creación... ----\n", 'info')
     productos_para_crear = read_products_from_coincidencias(coincidencias)
     print_message(f"Total de productos a crear: {len(productos_para_crear)}", 'info')
 
     productos_creados = []
     productos_fallidos = []
+    subidas = {}
     for index, product in enumerate(productos_para_crear, start=1):
         print_message(f"Procesando producto {index}/{len(productos_para_crear)}: SKU {product.get('sku', 'Sin SKU')}", 'debug')
-        crear_producto_sin_variantes_wrapper(product, index, productos_creados, productos_fallidos, location_id, skus_existentes, sku_to_id)
+        crear_producto_sin_variantes_wrapper(product, index, productos_creados, productos_fallidos, location_id, skus_existentes, sku_to_id, executor, subidas)
+
+    # Esperar las subidas de imágenes pendientes antes de escribir los reportes
+    resolver_subidas_pendientes(subidas, productos_creados)
 
     # Guardar en archivos CSV
     guardar_en_archivo(productos_creados, nombre_archivo_csv_creados)
@@ -1001,7 +941,9 @@ def main():
             return
 
         # Procesar las coincidencias para crear productos en Shopify
-        productos_creados, productos_fallidos, total_processed = procesar_coincidencias(coincidencias, skus_existentes, sku_to_id, location_id)
+        # Al salir del bloque se esperan las subidas que sigan en curso, aunque el proceso falle
+        with ThreadPoolExecutor(max_workers=SUBIDAS_EN_PARALELO) as executor:
+            productos_creados, productos_fallidos, total_processed = procesar_coincidencias(coincidencias, skus_existentes, sku_to_id, location_id, executor)
 
         # Calcular tiempos de ejecución
         end_time = time.time()
@@ -0,0 +1,44 @@
+# Aplicacion/conversion_paralela.py
+
+"""
+Ejecución en varios procesos de la conversión de HTML de los scripts de Conversion.
+
+El análisis con BeautifulSoup es trabajo de CPU en Python puro, así que los hilos no ayudan: los SKUs
+se reparten entre procesos y cada uno devuelve el HTML renderizado y su tamaño. El proceso principal
+escribe los archivos y la base de datos a medida que llegan los resultados.
+"""
+
+import os
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+# ============================================================
+# Constantes
+# ============================================================
+PROCESOS_CONVERSION = int(os.getenv("CONVERSION_PROCESOS", "0")) or os.cpu_count() or 1
+# Con menos tareas no compensa arrancar los procesos
+MINIMO_PARALELO = 8
+# Tareas enviadas a cada proceso por viaje, para no pagar un ida y vuelta por SKU
+MAXIMO_POR_ENVIO = 16
+
+# ============================================================
+# Ejecutor
+# ============================================================
+def convertir_en_paralelo(funcion, tareas, procesos=PROCESOS_CONVERSION):
+    """
+    Ejecuta funcion(*tarea) para cada tarea y devuelve los resultados en el mismo orden.
+    funcion debe estar definida a nivel de módulo en un módulo importable sin efectos secundarios
+    (se envía a los procesos por pickle) y no debe lanzar excepciones: los errores van en el resultado.
+    """
+    tareas = list(tareas)
+    if procesos <= 1 or len(tareas) < MINIMO_PARALELO:
+        for tarea in tareas:
+            yield funcion(*tarea)
+        return
+
+    procesos = min(procesos, len(tareas))
+    por_envio = max(1, min(MAXIMO_POR_ENVIO, len(tareas) // (procesos * 4)))
+    logging.info(f"Convirtiendo {len(tareas)} SKUs en {procesos} procesos.")
+    print(f"Convirtiendo {len(tareas)} SKUs en {procesos} procesos.")
+    with ProcessPoolExecutor(max_workers=procesos) as executor:
+        yield from executor.map(funcion, *zip(*tareas), chunksize=por_envio)
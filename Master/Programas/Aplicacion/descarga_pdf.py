@@ -0,0 +1,157 @@
+# Aplicacion/descarga_pdf.py
+
+"""
+Descarga de fichas técnicas PDF en segundo plano para los scripts de Centinela.
+
+Los navegadores sólo encolan la URL y siguen con el siguiente SKU. Un pool de hilos acotado
+descarga cada PDF con una sesión keep-alive (con las cookies de CT) y lo escribe por bloques con
+iter_content en un archivo temporal que se renombra al terminar. El ETag y Last-Modified de cada
+ficha se guardan junto al PDF, con el tamaño escrito, para pedirla de forma condicional: si no cambió
+(304) se conserva el archivo existente y su tamaño sale de esos metadatos.
+"""
+
+import os
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from mensajes import print_message
+
+# ============================================================
+# Constantes
+# ============================================================
+TAMANO_BLOQUE = 64 * 1024
+TIMEOUT_PDF = 60
+MAX_DESCARGAS = int(os.getenv("CENTINELA_DESCARGAS_PDF", "4"))
+# Descargas encoladas como máximo por hilo antes de que encolar bloquee al navegador
+PENDIENTES_POR_HILO = 8
+
+# Clave interna del status con la descarga en curso; nunca se escribe en la base de datos
+CLAVE_DESCARGA = "_descarga_pdf"
+
+# ============================================================
+# Metadatos para la descarga condicional
+# ============================================================
+def _ruta_metadatos(ruta_pdf):
+    return f"{ruta_pdf}.meta.json"
+
+def _leer_metadatos(ruta_pdf):
+    try:
+        with open(_ruta_metadatos(ruta_pdf), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _guardar_metadatos(ruta_pdf, respuesta, bytes_escritos):
+    metadatos = {
+        "etag": respuesta.headers.get("ETag"),
+        "last_modified": respuesta.headers.get("Last-Modified"),
+    }
+    if not any(metadatos.values()):
+        return
+    metadatos["tamano_bytes"] = bytes_escritos
+    with open(_ruta_metadatos(ruta_pdf), "w", encoding="utf-8") as f:
+        json.dump(metadatos, f)
+
+# ============================================================
+# Descargador
+# ============================================================
+class DescargadorPDF:
+    """Pool de descargas de PDF con sesión keep-alive por hilo y cola acotada."""
+
+    def __init__(self, sesion_base=None, max_workers=MAX_DESCARGAS):
+        self.sesion_base = sesion_base
+        self.max_workers = max_workers
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pdf")
+        self._cupos = threading.BoundedSemaphore(max_workers * PENDIENTES_POR_HILO)
+        self._local = threading.local()
+
+    def _sesion(self):
+        # requests.Session no es seguro entre hilos; cada hilo del pool mantiene la suya con las mismas cookies
+        if not hasattr(self._local, "sesion"):
+            sesion = requests.Session()
+            sesion.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+            if self.sesion_base is not None:
+                sesion.headers.update(self.sesion_base.headers)
+                sesion.cookies.update(self.sesion_base.cookies)
+            self._local.sesion = sesion
+        return self._local.sesion
+
+    def descargar(self, sku, pdf_url, ruta_pdf):
+        """
+        Descarga la ficha en ruta_pdf. Devuelve un dict con PDF_Encontrado, PDF_Archivo_Descargado y
+        PDF_Archivo_Tamano_KB (el tamaño sale de los bytes escritos, sin volver a leer el archivo).
+        """
+        resultado = {"PDF_Encontrado": True, "PDF_Archivo_Descargado": False, "PDF_Archivo_Tamano_KB": 0}
+        encabezados = {}
+        # Sólo se pide de forma condicional si los metadatos traen el tamaño del archivo guardado
+        metadatos = _leer_metadatos(ruta_pdf) if os.path.exists(ruta_pdf) else {}
+        if "tamano_bytes" in metadatos:
+            if metadatos.get("etag"):
+                encabezados["If-None-Match"] = metadatos["etag"]
+            if metadatos.get("last_modified"):
+                encabezados["If-Modified-Since"] = metadatos["last_modified"]
+
+        temporal = f"{ruta_pdf}.part"
+        try:
+            with self._sesion().get(pdf_url, headers=encabezados, stream=True, timeout=TIMEOUT_PDF) as respuesta:
+                if respuesta.status_code == 304:
+                    resultado["PDF_Archivo_Descargado"] = True
+                    resultado["PDF_Archivo_Tamano_KB"] = round(metadatos["tamano_bytes"] / 1024, 2)
+                    print_message(f"PDF sin cambios para SKU {sku}; se conserva el archivo existente.", 'debug')
+                    return resultado
+                if respuesta.status_code != 200:
+                    print_message(f"Error al descargar PDF para SKU {sku}: Código {respuesta.status_code}", 'warning')
+                    return resultado
+                bytes_escritos = 0
+                with open(temporal, "wb") as archivo:
+                    for bloque in respuesta.iter_content(chunk_size=TAMANO_BLOQUE):
+                        archivo.write(bloque)
+                        bytes_escritos += len(bloque)
+                os.replace(temporal, ruta_pdf)
+                _guardar_metadatos(ruta_pdf, respuesta, bytes_escritos)
+            resultado["PDF_Archivo_Descargado"] = True
+            resultado["PDF_Archivo_Tamano_KB"] = round(bytes_escritos / 1024, 2)
+            print_message(f"PDF descargado para SKU {sku} (Tamaño: {resultado['PDF_Archivo_Tamano_KB']} KB)", 'info')
+        except (requests.exceptions.RequestException, OSError) as e:
+            print_message(f"Error al descargar PDF para SKU {sku}: {e}", 'warning')
+            if os.path.exists(temporal):
+                os.remove(temporal)
+        return resultado
+
+    def descargar_async(self, sku, pdf_url, ruta_pdf):
+        """Encola la descarga y devuelve un Future con el resultado. Bloquea sólo si la cola está llena."""
+        self._cupos.acquire()
+        try:
+            futuro = self.executor.submit(self.descargar, sku, pdf_url, ruta_pdf)
+        except Exception:
+            self._cupos.release()
+            raise
+        futuro.add_done_callback(lambda _: self._cupos.release())
+        return futuro
+
+    def cerrar(self):
+        self.executor.shutdown(wait=True)
+
+# ============================================================
+# Integración con el status de Centinela
+# ============================================================
+def encolar_pdf(descargador, sku, sku_path, pdf_url, status):
+    """Encola la ficha del SKU y deja la descarga pendiente en el status."""
+    print_message(f"Encolando PDF desde: {pdf_url}", 'debug')
+    status["PDF_Encontrado"] = True
+    status[CLAVE_DESCARGA] = descargador.descargar_async(sku, pdf_url, os.path.join(sku_path, 'PDF', f"{sku}.pdf"))
+
+def completar_pdf(status):
+    """Espera la descarga pendiente del status (si la hay) y copia su resultado a los campos PDF_*."""
+    futuro = status.pop(CLAVE_DESCARGA, None)
+    if futuro is None:
+        return status
+    try:
+        status.update(futuro.result())
+    except Exception as e:
+        print_message(f"Error al descargar PDF para SKU {status.get('SKU')}: {e}", 'error')
+    return status
@@ -0,0 +1,159 @@
+# Aplicacion/escritor_lotes.py
+
+"""
+Escritura por lotes en MySQL desde un hilo en segundo plano.
+
+Los productores sólo agregan filas a una cola; el hilo escritor, con su propia conexión, las
+escribe con executemany y un solo commit cada N filas o cada T segundos, lo que ocurra primero.
+Al cerrar se escribe lo que quede pendiente.
+
+Si un lote falla se reintenta con la conexión renovada; si sigue fallando se escribe fila por fila
+para aislar las que MySQL rechaza. Las filas que no se pudieron escribir se guardan (una por línea,
+en JSON) en 'ruta_fallidas', y cerrar() informa cuántas fueron y dónde quedaron.
+"""
+
+import json
+import time
+import queue
+import logging
+import threading
+
+# ============================================================
+# Constantes
+# ============================================================
+TAMANO_LOTE = 50
+INTERVALO_SEGUNDOS = 5.0
+REINTENTOS_LOTE = 3
+
+_FIN = object()
+
+# ============================================================
+# Escritor
+# ============================================================
+class EscritorPorLotes:
+    """
+    crear_conexion: función sin argumentos que devuelve una conexión MySQL (se llama desde el hilo escritor).
+    consulta: sentencia con marcadores %s para executemany.
+    a_tupla: convierte cada elemento agregado en la tupla de parámetros de la consulta.
+    ruta_fallidas: archivo donde se agregan las filas que no se pudieron escribir (None: sólo se registran en el log).
+    """
+
+    def __init__(self, crear_conexion, consulta, a_tupla, tamano_lote=TAMANO_LOTE,
+                 intervalo=INTERVALO_SEGUNDOS, nombre="lotes", ruta_fallidas=None):
+        self.consulta = consulta
+        self.a_tupla = a_tupla
+        self.tamano_lote = max(1, tamano_lote)
+        self.intervalo = intervalo
+        self.nombre = nombre
+        self.ruta_fallidas = ruta_fallidas
+        self.filas_escritas = 0
+        self.filas_fallidas = 0
+        self._crear_conexion = crear_conexion
+        self._conexion = None
+        self._cola = queue.Queue()
+        self._hilo = threading.Thread(target=self._ejecutar, name=f"escritor-{nombre}", daemon=True)
+        self._hilo.start()
+
+    def agregar(self, elemento):
+        """Encola un elemento. La conversión a tupla se hace aquí para que los errores de datos salgan en el productor."""
+        self._cola.put(self.a_tupla(elemento))
+
+    def cerrar(self):
+        """Escribe lo pendiente, termina el hilo escritor e informa las filas que no se pudieron escribir."""
+        self._cola.put(_FIN)
+        self._hilo.join()
+        logging.info(f"Escritor '{self.nombre}': {self.filas_escritas} filas escritas, {self.filas_fallidas} fallidas.")
+        if self.filas_fallidas:
+            destino = f"guardadas en {self.ruta_fallidas}" if self.ruta_fallidas else "sin archivo de respaldo"
+            logging.error(f"Escritor '{self.nombre}': {self.filas_fallidas} filas no se escribieron en MySQL ({destino}).")
+            print(f"Escritor '{self.nombre}': {self.filas_fallidas} filas no se escribieron en MySQL ({destino}).")
+
+    def _ejecutar(self):
+        self._conexion = self._crear_conexion()
+        lote = []
+        limite = time.monotonic() + self.intervalo
+        while True:
+            try:
+                fila = self._cola.get(timeout=max(0.0, limite - time.monotonic()))
+            except queue.Empty:
+                fila = None
+            if fila is _FIN:
+                self._vaciar(lote)
+                break
+            if fila is not None:
+                lote.append(fila)
+            if len(lote) >= self.tamano_lote or time.monotonic() >= limite:
+                self._vaciar(lote)
+                lote = []
+                limite = time.monotonic() + self.intervalo
+        try:
+            if self._conexion is not None and self._conexion.is_connected():
+                self._conexion.close()
+        except Exception:
+            pass
+
+    def _escribir(self, filas):
+        """Un executemany y un commit. Renueva la conexión si no hay o si se perdió; propaga el error."""
+        if self._conexion is None:
+            self._conexion = self._crear_conexion()
+            if self._conexion is None:
+                raise ConnectionError("no se pudo conectar a MySQL")
+        cursor = None
+        try:
+            self._conexion.ping(reconnect=True, attempts=3, delay=1)
+            cursor = self._conexion.cursor()
+            cursor.executemany(self.consulta, filas)
+            self._conexion.commit()
+        except Exception:
+            try:
+                self._conexion.rollback()
+            except Exception:
+                pass
+            raise
+        finally:
+            if cursor is not None:
+                cursor.close()
+
+    def _vaciar(self, lote):
+        if not lote:
+            return
+        for intento in range(1, REINTENTOS_LOTE + 1):
+            try:
+                self._escribir(lote)
+                self.filas_escritas += len(lote)
+                logging.debug(f"Escritor '{self.nombre}': lote de {len(lote)} filas escrito.")
+                return
+            except Exception as e:
+                logging.warning(f"Escritor '{self.nombre}': error al escribir un lote de {len(lote)} filas (intento {intento}/{REINTENTOS_LOTE}): {e}")
+                time.sleep(intento)
+        # El lote sigue fallando. Con la conexión viva se escribe fila por fila, para no perder las filas
+        # válidas por una que MySQL rechaza; sin conexión se guardan todas
+        fallidas = [] if self._conectado() else list(lote)
+        for fila in ([] if fallidas else lote):
+            try:
+                self._escribir([fila])
+                self.filas_escritas += 1
+            except Exception as e:
+                logging.error(f"Escritor '{self.nombre}': no se pudo escribir la fila {fila[:1]}: {e}")
+                fallidas.append(fila)
+        if fallidas:
+            print(f"Error al escribir {len(fallidas)} de {len(lote)} filas en MySQL.")
+            self.filas_fallidas += len(fallidas)
+            self._guardar_fallidas(fallidas)
+
+    def _conectado(self):
+        try:
+            return self._conexion is not None and self._conexion.is_connected()
+        except Exception:
+            return False
+
+    def _guardar_fallidas(self, filas):
+        """Agrega las filas no escritas a ruta_fallidas (JSON por línea) para poder reintentarlas después."""
+        if not self.ruta_fallidas:
+            return
+        try:
+            with open(self.ruta_fallidas, "a", encoding="utf-8") as archivo:
+                for fila in filas:
+                    archivo.write(json.dumps(list(fila), ensure_ascii=False, default=str) + "\n")
+        except OSError as e:
+            logging.error(f"Escritor '{self.nombre}': no se pudieron guardar {len(filas)} filas en {self.ruta_fallidas}: {e}")
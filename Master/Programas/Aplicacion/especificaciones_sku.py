@@ -0,0 +1,86 @@
+# Aplicacion/especificaciones_sku.py
+
+"""
+Especificaciones estructuradas de cada SKU, generadas en la etapa de Conversion.
+
+Junto a los HTML de Conversion/{sku} se guarda Especificaciones_{sku}.json con una entrada por
+sección ("caracteristicas", "info_adicional"). Cada entrada tiene:
+
+    html_sha256  sha256 del HTML convertido con el que se generó
+    secciones    [{"titulo": ..., "filas": [[etiqueta, valor], ...]}, ...]
+    fragmento    encabezado y contenido del acordeón, listos para el metafield de Shopify
+
+Centinela_Subir_Tabla y ShopifyCrearProductos leen este archivo en lugar de volver a analizar el HTML.
+Si el HTML convertido cambió sin que se actualizara el JSON, el sha256 no coincide y la entrada se ignora.
+"""
+
+import json
+import hashlib
+import logging
+from pathlib import Path
+
+# ============================================================
+# Rutas
+# ============================================================
+def ruta_especificaciones(directorio_conversion, sku):
+    """Ruta de Especificaciones_{sku}.json dentro de Conversion/{sku}."""
+    return Path(directorio_conversion) / sku / f"Especificaciones_{sku}.json"
+
+# ============================================================
+# Lectura y escritura
+# ============================================================
+def cargar_especificaciones(directorio_conversion, sku):
+    """Devuelve el contenido del JSON del SKU, o {} si no existe o no se puede leer."""
+    ruta = ruta_especificaciones(directorio_conversion, sku)
+    try:
+        with open(ruta, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logging.warning(f"No se pudo leer {ruta}: {e}")
+        return {}
+
+def actualizar_especificaciones(directorio_conversion, sku, seccion, datos):
+    """Reemplaza la entrada 'seccion' del JSON del SKU (escritura atómica). Devuelve True si se guardó."""
+    ruta = ruta_especificaciones(directorio_conversion, sku)
+    especificaciones = cargar_especificaciones(directorio_conversion, sku)
+    especificaciones["sku"] = sku
+    especificaciones[seccion] = datos
+    try:
+        ruta.parent.mkdir(parents=True, exist_ok=True)
+        temporal = ruta.with_suffix(".tmp")
+        with open(temporal, "w", encoding="utf-8") as f:
+            json.dump(especificaciones, f, ensure_ascii=False)
+        temporal.replace(ruta)
+        return True
+    except OSError as e:
+        logging.error(f"Error al guardar {ruta}: {e}")
+        return False
+
+# ============================================================
+# Consultas
+# ============================================================
+def fragmento_vigente(directorio_conversion, sku, seccion, ruta_html):
+    """
+    Fragmento del metafield guardado para 'seccion', o None si no hay entrada o si ya no corresponde
+    al HTML convertido de ruta_html.
+    """
+    entrada = cargar_especificaciones(directorio_conversion, sku).get(seccion)
+    if not entrada or "fragmento" not in entrada:
+        return None
+    try:
+        with open(ruta_html, "rb") as f:
+            vigente = hashlib.sha256(f.read()).hexdigest() == entrada.get("html_sha256")
+    except OSError:
+        return None
+    return entrada["fragmento"] if vigente else None
+
+def filas_especificaciones(especificaciones, seccion="caracteristicas"):
+    """Pares etiqueta/valor de 'seccion' con la forma de 'especificaciones' del JSON de CT: [{"tipo", "valor"}]."""
+    entrada = especificaciones.get(seccion) or {}
+    return [
+        {"tipo": etiqueta, "valor": valor}
+        for bloque in entrada.get("secciones", [])
+        for etiqueta, valor in bloque.get("filas", [])
+    ]
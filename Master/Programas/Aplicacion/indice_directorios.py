@@ -0,0 +1,108 @@
+# Aplicacion/indice_directorios.py
+
+"""
+Índice de carpetas por SKU y escritura de archivos sin llamadas de metadatos previas.
+
+IndiceDirectorios lista la carpeta base (ArchivosOrganizados, Conversion) una sola vez con os.scandir
+y lista la carpeta de cada SKU sólo la primera vez que se consulta. Con eso create_directories ya no
+hace un os.makedirs por subcarpeta y por SKU, y la conversión omite sin más llamadas los SKUs que no
+tienen carpeta. En Windows las entradas de os.scandir traen el tamaño y la fecha, así que
+DirEntry.stat() no vuelve a consultar el disco.
+
+escribir_archivo/escribir_texto abren el archivo directamente (la carpeta se crea sólo si falta) y
+devuelven los bytes escritos, de donde sale el tamaño en KB sin os.path.getsize.
+"""
+
+import os
+import logging
+import threading
+
+# ============================================================
+# Índice
+# ============================================================
+def _listar(ruta):
+    """{nombre: DirEntry} de la carpeta, o {} si no existe."""
+    try:
+        with os.scandir(ruta) as entradas:
+            return {entrada.name: entrada for entrada in entradas}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+class IndiceDirectorios:
+    """Contenido de base/{sku} construido con os.scandir y reutilizado durante toda la ejecución."""
+
+    def __init__(self, base):
+        self.base = str(base)
+        self._skus = {nombre for nombre, entrada in _listar(self.base).items() if entrada.is_dir()}
+        self._contenido = {}  # sku -> {nombre: DirEntry}
+        self._lock = threading.Lock()
+        logging.info(f"Índice de directorios de {self.base}: {len(self._skus)} carpetas de SKU.")
+
+    def tiene_sku(self, sku):
+        """True si existe la carpeta base/{sku}."""
+        return sku in self._skus
+
+    def contenido_sku(self, sku):
+        """Entradas de base/{sku} ({nombre: DirEntry}); la carpeta se lista una sola vez."""
+        if sku not in self._skus:
+            return {}
+        with self._lock:
+            if sku not in self._contenido:
+                self._contenido[sku] = _listar(os.path.join(self.base, sku))
+            return self._contenido[sku]
+
+    def entradas(self, sku, subcarpeta):
+        """DirEntry de los archivos de base/{sku}/{subcarpeta}, o [] si la subcarpeta no existe."""
+        if subcarpeta not in self.contenido_sku(sku):
+            return []
+        return [entrada for entrada in _listar(os.path.join(self.base, sku, subcarpeta)).values() if entrada.is_file()]
+
+    def asegurar_carpetas(self, sku, subcarpetas):
+        """
+        Crea las subcarpetas de base/{sku} que falten. Devuelve (ruta del SKU, subcarpetas creadas).
+        Para un SKU ya existente sólo se lista su carpeta; para uno nuevo se crean todas sin comprobar.
+        """
+        sku_path = os.path.join(self.base, sku)
+        existentes = self.contenido_sku(sku)
+        creadas = []
+        for subcarpeta in subcarpetas:
+            if subcarpeta in existentes:
+                continue
+            os.makedirs(os.path.join(sku_path, subcarpeta), exist_ok=True)
+            creadas.append(subcarpeta)
+        if creadas:
+            with self._lock:
+                self._skus.add(sku)
+                self._contenido.pop(sku, None)  # Se vuelve a listar si se consulta de nuevo
+        return sku_path, creadas
+
+def estado_archivo(ruta):
+    """os.stat de la ruta, o None si no existe (una llamada en lugar de exists + stat)."""
+    try:
+        return os.stat(ruta)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+# ============================================================
+# Escritura
+# ============================================================
+def escribir_archivo(ruta, contenido):
+    """Escribe bytes en ruta, creando su carpeta sólo si no existe. Devuelve los bytes escritos."""
+    try:
+        archivo = open(ruta, "wb")
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        archivo = open(ruta, "wb")
+    with archivo:
+        return archivo.write(contenido)
+
+def escribir_texto(ruta, texto):
+    """
+    Escribe texto en UTF-8 con los saltos de línea del sistema (igual que el modo texto) y devuelve
+    los bytes escritos.
+    """
+    return escribir_archivo(ruta, texto.replace("\n", os.linesep).encode("utf-8"))
+
+def tamano_kb(bytes_escritos):
+    """Tamaño en KB redondeado como en los reportes."""
+    return round(bytes_escritos / 1024, 2)
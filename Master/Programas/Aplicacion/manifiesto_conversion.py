@@ -0,0 +1,123 @@
+# Aplicacion/manifiesto_conversion.py
+
+"""
+Manifiesto de conversión incremental para los scripts de Conversion.
+
+Por cada SKU se guarda la huella del HTML de origen (mtime, tamaño y sha256) y la versión de la
+plantilla con la que se generó la salida. En la siguiente ejecución sólo se vuelve a convertir un SKU
+si es nuevo, si su HTML de origen cambió, si cambió la plantilla o si falta el archivo convertido.
+La comparación de mtime y tamaño no lee el archivo; el sha256 sólo se calcula cuando alguno de los
+dos cambió (p. ej. Centinela reescribió el archivo con el mismo contenido).
+"""
+
+import os
+import json
+import hashlib
+import logging
+from pathlib import Path
+
+from config import DIRECTORIOS
+
+# ============================================================
+# Constantes
+# ============================================================
+DIRECTORIO_MANIFIESTOS = Path(DIRECTORIOS["Configuracion"])
+TAMANO_BLOQUE = 64 * 1024
+
+# ============================================================
+# Huellas
+# ============================================================
+def hash_archivo(ruta):
+    """sha256 del contenido del archivo, leído por bloques."""
+    digest = hashlib.sha256()
+    with open(ruta, "rb") as archivo:
+        for bloque in iter(lambda: archivo.read(TAMANO_BLOQUE), b""):
+            digest.update(bloque)
+    return digest.hexdigest()
+
+def version_plantilla(ruta_plantilla, version_conversor=""):
+    """
+    Versión de la plantilla: hash de su contenido más la versión del conversor, para que un cambio
+    en cualquiera de los dos invalide todas las salidas generadas.
+    """
+    try:
+        return f"{hash_archivo(ruta_plantilla)[:16]}-{version_conversor}"
+    except OSError as e:
+        logging.warning(f"No se pudo leer la plantilla {ruta_plantilla}: {e}")
+        return f"sin-plantilla-{version_conversor}"
+
+# ============================================================
+# Manifiesto
+# ============================================================
+class ManifiestoConversion:
+    """Huellas por SKU de una etapa de conversión, guardadas en Configuracion/manifiesto_<etapa>.json."""
+
+    def __init__(self, etapa, version):
+        self.ruta = DIRECTORIO_MANIFIESTOS / f"manifiesto_{etapa}.json"
+        self.version = version
+        self.cambios = 0
+        self.entradas = self._cargar()
+
+    def _cargar(self):
+        try:
+            with open(self.ruta, "r", encoding="utf-8") as f:
+                datos = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if datos.get("version") != self.version:
+            logging.info(f"La plantilla o el conversor cambiaron ({self.ruta.name}); se reconvertirán todos los SKUs.")
+            print("La plantilla o el conversor cambiaron; se reconvertirán todos los SKUs.")
+            return {}
+        return datos.get("skus", {})
+
+    def requiere_conversion(self, sku, ruta_fuente, ruta_salida, estado=None):
+        """
+        True si el SKU es nuevo, su HTML de origen cambió o falta el archivo convertido.
+        estado es el os.stat del HTML de origen si quien llama ya lo tiene (p. ej. de os.scandir).
+        """
+        entrada = self.entradas.get(sku)
+        if not entrada or not os.path.exists(ruta_salida):
+            return True
+        if estado is None:
+            try:
+                estado = os.stat(ruta_fuente)
+            except OSError:
+                return True
+        if estado.st_mtime_ns == entrada.get("mtime_ns") and estado.st_size == entrada.get("tamano"):
+            return False
+        if estado.st_size != entrada.get("tamano") or hash_archivo(ruta_fuente) != entrada.get("sha256"):
+            return True
+        # Mismo contenido con otra fecha: se actualiza la huella para no volver a calcular el hash
+        entrada["mtime_ns"] = estado.st_mtime_ns
+        self.cambios += 1
+        return False
+
+    def registrar(self, sku, ruta_fuente):
+        """Guarda la huella actual del HTML de origen tras una conversión correcta."""
+        try:
+            estado = os.stat(ruta_fuente)
+            self.entradas[sku] = {
+                "mtime_ns": estado.st_mtime_ns,
+                "tamano": estado.st_size,
+                "sha256": hash_archivo(ruta_fuente),
+            }
+            self.cambios += 1
+        except OSError as e:
+            logging.warning(f"No se pudo registrar en el manifiesto el SKU {sku}: {e}")
+
+    def olvidar(self, sku):
+        """Quita el SKU del manifiesto para forzar su conversión en la siguiente ejecución."""
+        if self.entradas.pop(sku, None) is not None:
+            self.cambios += 1
+
+    def guardar(self):
+        """Escribe el manifiesto de forma atómica si hubo cambios."""
+        if not self.cambios:
+            return
+        self.ruta.parent.mkdir(parents=True, exist_ok=True)
+        temporal = self.ruta.with_suffix(".tmp")
+        with open(temporal, "w", encoding="utf-8") as f:
+            json.dump({"version": self.version, "skus": self.entradas}, f, ensure_ascii=False)
+        temporal.replace(self.ruta)
+        logging.info(f"Manifiesto de conversión guardado en {self.ruta} ({len(self.entradas)} SKUs).")
+        self.cambios = 0
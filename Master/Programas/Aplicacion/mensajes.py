@@ -0,0 +1,20 @@
+# Aplicacion/mensajes.py
+
+"""
+Mensajes al log y a la consola para los módulos compartidos (descarga_pdf, shopify_medios).
+
+Es el mismo print_message de los scripts de Shopify: info, warning y error se registran y se
+imprimen; debug sólo se registra.
+"""
+
+import logging
+
+def print_message(message, level='info'):
+    if level == 'info':
+        logging.info(message);    print(message)
+    elif level == 'error':
+        logging.error(message);   print(message)
+    elif level == 'warning':
+        logging.warning(message); print(message)
+    elif level == 'debug':
+        logging.debug(message)
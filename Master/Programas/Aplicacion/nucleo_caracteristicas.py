@@ -0,0 +1,310 @@
+# Aplicacion/nucleo_caracteristicas.py
+
+"""
+Núcleo de conversión de Características: analiza el HTML descargado de CT y lo convierte en
+subacordeones con la plantilla PlantillaCaracteristicas.html.
+
+No abre conexiones ni configura logging al importarse, para poder usarse desde los procesos de
+conversion_paralela.
+"""
+
+import os
+import hashlib
+import logging
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+from plantillas import obtener_plantilla
+from parser_html import leer_html, extraer_fragmento, PARSER_COMPATIBLE
+
+# Elementos de PlantillaCaracteristicas.html que se suben al metafield 'caracteristicas'
+SELECTORES_METAFIELD = ("div.caracter-main", "div.caracter-main-content")
+
+# ============================================================
+# Análisis del HTML
+# ============================================================
+def to_sentence_case(text):
+    """
+    Convierte un texto a formato oración: la primera letra en mayúscula y el resto en minúsculas.
+    :param text: Texto original.
+    :return: Texto en formato oración.
+    """
+    if not text:
+        return text
+    return text[0].upper() + text[1:].lower()
+
+def replace_icons_with_text(value_div):
+    """
+    Reemplaza los íconos de FontAwesome con los textos "Sí" y "No".
+    :param value_div: Objeto BeautifulSoup que contiene el valor.
+    :return: Texto reemplazado.
+    """
+    icon = value_div.find('i')
+    if icon:
+        icon_classes = icon.get('class', [])
+        if 'fa-check-circle' in icon_classes and 'text-green' in icon_classes:
+            return 'Sí'
+        elif 'fa-times-circle' in icon_classes and 'text-red' in icon_classes:
+            return 'No'
+    return value_div.get_text(strip=True)
+
+def fila_dl(label, value):
+    """Par <dt>/<dd> de una fila del subacordeón."""
+    return f"                    <dt>{label}:</dt>\n                    <dd>{value}</dd>\n"
+
+def build_subaccordion(title, dl_content):
+    """
+    Construye el bloque HTML de un subacordeón dado un título y contenido.
+    :param title: Título del subacordeón.
+    :param dl_content: Contenido en formato <dl>.
+    :return: HTML string del subacordeón.
+    """
+    subaccordion_html = f"""
+        <div class="caracter-main-subaccordion">
+            <div class="caracter-main-subaccordion-header">
+                {title}
+                <!-- Flecha para indicar subacordeón -->
+                <svg aria-hidden="true" focusable="false" viewBox="0 0 10 6">
+                    <path fill-rule="evenodd" clip-rule="evenodd" d="M9.354.646a.5.5 0 00-.708 0L5 4.293 1.354.646a.5.5 0 00-.708.708l4 4a.5.5 0 00.708 0l4-4a.5.5 0 000-.708z" fill="currentColor"></path>
+                </svg>
+            </div>
+            <div class="caracter-main-subaccordion-content">
+                <dl>
+{dl_content}                </dl>
+            </div>
+        </div>
+    """
+    return subaccordion_html
+
+def parse_paragraph_section(col):
+    """
+    Procesa una sección que contiene párrafos con etiquetas <strong>.
+    También maneja párrafos sin etiquetas <strong>.
+    :param col: Objeto BeautifulSoup que representa la columna.
+    :return: Lista de secciones {"titulo", "filas": [[etiqueta, valor], ...]}.
+    """
+    # Obtener todos los elementos dentro de la columna
+    elements = col.find_all(['h5', 'p'], recursive=False)
+    secciones = []
+
+    current_title = None
+    filas = []
+
+    for elem in elements:
+        if elem.name == 'h5':
+            # Si ya hay un subacordeón en progreso, cerrarlo
+            if current_title and filas:
+                secciones.append({"titulo": current_title, "filas": filas})
+                filas = []
+            # Obtener el nuevo título y convertir a formato oración
+            strong = elem.find('strong')
+            if strong:
+                title_original = strong.get_text(strip=True)
+                title = to_sentence_case(title_original)
+                current_title = title
+        elif elem.name == 'p':
+            if current_title:
+                # Procesar el párrafo para extraer etiquetas y valores
+                for strong in elem.find_all('strong'):
+                    label = strong.get_text(strip=True).rstrip(':')
+                    # El siguiente sibling puede ser <br> o NavigableString
+                    partes = []
+                    next_sibling = strong.next_sibling
+                    while next_sibling and (isinstance(next_sibling, NavigableString) or (isinstance(next_sibling, Tag) and next_sibling.name == 'br')):
+                        if isinstance(next_sibling, NavigableString):
+                            partes.append(next_sibling.strip())
+                        elif isinstance(next_sibling, Tag) and next_sibling.name == 'br':
+                            partes.append(' ')
+                        next_sibling = next_sibling.next_sibling
+                    value = "".join(partes)
+                    # Reemplazar íconos si es necesario. El valor casi siempre es texto plano: sólo se
+                    # vuelve a analizar si trae marcado o entidades, que es lo único que cambia el resultado
+                    if '<' in value or '&' in value:
+                        value = replace_icons_with_text(BeautifulSoup(value, PARSER_COMPATIBLE))
+                    else:
+                        value = value.strip()
+                    # Añadir al contenido
+                    filas.append([label, value])
+            else:
+                # Párrafo sin título, tratar todo el contenido como una respuesta
+                content = elem.get_text(separator=' ', strip=True)
+                if content:
+                    # Asignar el título específico "Características"
+                    current_title = "Características"
+                    filas.append(["Acerca de", content])
+
+    # Añadir el último subacordeón si existe
+    if current_title and filas:
+        secciones.append({"titulo": current_title, "filas": filas})
+
+    return secciones
+
+def parse_table_section(col):
+    """
+    Procesa una sección que contiene una tabla estructurada.
+    :param col: Objeto BeautifulSoup que representa la columna.
+    :return: Sección {"titulo", "filas"} o None si no tiene título.
+    """
+    # Obtener el título del subacordeón
+    h5 = col.find('h5')
+    if not h5:
+        return None
+    title_original = h5.get_text(strip=True)
+    title = to_sentence_case(title_original)  # Convertir a formato oración
+
+    # Obtener todas las filas dentro de esta columna
+    rows = col.find_all('div', class_='row')
+    filas = []
+    for row in rows:
+        cols = row.find_all('div', recursive=False)
+        if len(cols) < 2:
+            continue  # Omitir si no hay al menos dos columnas
+        # Etiqueta
+        label_div = cols[0]
+        label_strong = label_div.find('strong')
+        if not label_strong:
+            continue
+        label = label_strong.get_text(strip=True).rstrip(':')
+        # Valor
+        value_div = cols[1]
+        value = replace_icons_with_text(value_div)
+        # Añadir al contenido
+        filas.append([label, value])
+
+    return {"titulo": title, "filas": filas}
+
+def parse_section(section):
+    """
+    Determina si una sección contiene tablas o párrafos y las procesa en consecuencia.
+    :param section: Objeto BeautifulSoup que representa la sección.
+    :return: Lista de secciones {"titulo", "filas"}.
+    """
+    # Verificar si la sección contiene tablas estructuradas
+    ficha_tecnica_sections = section.find_all('div', id='ficha_tecnica', class_='ct-section')
+    if ficha_tecnica_sections:
+        secciones = (parse_table_section(ficha) for ficha in ficha_tecnica_sections)
+        return [seccion for seccion in secciones if seccion]
+    else:
+        # Procesar como párrafos
+        return parse_paragraph_section(section)
+
+def tiene_parrafos(soup):
+    """
+    True si algún 'panel-body' se procesa como párrafos (no tiene 'ficha_tecnica'). Esos párrafos
+    pueden traer <p> anidados, que sólo html.parser conserva como en el HTML de CT.
+    """
+    return any(
+        not panel.find('div', id='ficha_tecnica', class_='ct-section') and panel.find('p')
+        for panel in soup.find_all('div', class_='panel-body')
+    )
+
+def extraer_secciones(file_path, parser=None):
+    """
+    Extrae las secciones de características (título y pares etiqueta/valor) de un archivo HTML.
+    :param file_path: Ruta al archivo HTML.
+    :param parser: Analizador de BeautifulSoup; por defecto el de parser_html.
+    :return: Lista de secciones {"titulo", "filas"}; vacía si hubo un error.
+    """
+    try:
+        soup = leer_html(file_path, parser, requiere_compatible=tiene_parrafos)
+
+        # Encontrar todas las secciones con clase 'panel-body'
+        panel_body_sections = soup.find_all('div', class_='panel-body')
+
+        return [seccion for section in panel_body_sections for seccion in parse_section(section)]
+    except Exception as e:
+        logging.error(f"Error al procesar el archivo HTML {file_path}: {e}")
+        print(f"Error al procesar el archivo HTML {file_path}: {e}")
+        return []
+
+def secciones_a_html(secciones):
+    """Construye los subacordeones de una lista de secciones."""
+    return "".join(
+        build_subaccordion(seccion["titulo"], "".join(fila_dl(label, value) for label, value in seccion["filas"]))
+        for seccion in secciones
+    )
+
+def process_html_file(file_path, parser=None):
+    """
+    Procesa un archivo HTML para convertir sus tablas o párrafos en subacordeones.
+    :param file_path: Ruta al archivo HTML.
+    :param parser: Analizador de BeautifulSoup; por defecto el de parser_html.
+    :return: HTML string con los subacordeones.
+    """
+    return secciones_a_html(extraer_secciones(file_path, parser))
+
+# ============================================================
+# Conversión de un SKU
+# ============================================================
+def convertir_caracteristicas(sku, ruta_entrada, ruta_plantilla):
+    """
+    Convierte el HTML de características de un SKU.
+    Se ejecuta en los procesos del pool: no toca la base de datos ni escribe archivos. Devuelve
+    el contenido a escribir (bytes, con los saltos de línea del sistema como al escribir en modo texto)
+    y su tamaño en KB; contenido queda en None si no se generaron subacordeones. 'especificaciones'
+    trae las secciones extraídas y el fragmento del metafield para Especificaciones_{sku}.json.
+    """
+    resultado = {"sku": sku, "ruta_entrada": ruta_entrada, "contenido": None, "tamano_kb": 0, "error": None,
+                 "especificaciones": None}
+    secciones = extraer_secciones(ruta_entrada)
+    subaccordions = secciones_a_html(secciones)
+    if not subaccordions.strip():
+        return resultado
+    try:
+        rendered_html = obtener_plantilla(ruta_plantilla).render(subaccordions=subaccordions)
+    except Exception as e:
+        resultado["error"] = f"Error al renderizar la plantilla para SKU {sku}: {e}"
+        return resultado
+    resultado["contenido"] = rendered_html.replace("\n", os.linesep).encode("utf-8")
+    resultado["tamano_kb"] = round(len(resultado["contenido"]) / 1024, 2)
+    resultado["especificaciones"] = {
+        "html_sha256": hashlib.sha256(resultado["contenido"]).hexdigest(),
+        "secciones": secciones,
+        "fragmento": extraer_fragmento(rendered_html, *SELECTORES_METAFIELD),
+    }
+    return resultado
+
+# ============================================================
+# Micro-benchmark
+# ============================================================
+def _ficha_sintetica(filas):
+    """HTML con un bloque de párrafos y una tabla de 'filas' pares etiqueta/valor cada uno."""
+    parrafo = "".join(f"<strong>Dato {i}:</strong> Valor {i}<br>" for i in range(filas))
+    tabla = "".join(f'<div class="row"><div><strong>Campo {i}:</strong></div><div>Valor {i}</div></div>' for i in range(filas))
+    return (f'<div class="panel-body"><h5><strong>ESPECIFICACIONES</strong></h5><p>{parrafo}</p></div>'
+            f'<div class="panel-body"><div id="ficha_tecnica" class="ct-section"><h5>Tabla</h5>{tabla}</div></div>')
+
+def _medir(ruta, repeticiones=5):
+    """Mejor tiempo (s) de process_html_file sobre la ruta."""
+    import time
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        process_html_file(ruta)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+if __name__ == "__main__":
+    # Uso: python nucleo_caracteristicas.py [directorio_ArchivosOrganizados] [cantidad]
+    import sys
+    import tempfile
+    from pathlib import Path
+
+    print("Fichas sintéticas (el tiempo por fila debe mantenerse constante):")
+    with tempfile.TemporaryDirectory() as temporal:
+        for filas in (250, 1000, 4000):
+            ruta = Path(temporal) / f"ficha_{filas}.html"
+            ruta.write_text(_ficha_sintetica(filas), encoding="utf-8")
+            segundos = _medir(ruta)
+            print(f"  {filas:>5} filas: {segundos * 1000:8.1f} ms  ({segundos * 1e6 / (2 * filas):.1f} µs/fila)")
+
+    if len(sys.argv) > 1:
+        directorio = Path(sys.argv[1])
+    else:
+        from config import DIRECTORIOS
+        directorio = Path(DIRECTORIOS["ArchivosOrganizados"])
+    cantidad = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    fichas = sorted(directorio.glob("*/Caracteristicas/*.html"), key=lambda r: r.stat().st_size, reverse=True)[:cantidad]
+    print(f"Las {len(fichas)} fichas de CT más grandes en {directorio}:")
+    for ruta in fichas:
+        print(f"  {ruta.stat().st_size / 1024:8.1f} KB  {_medir(ruta) * 1000:8.1f} ms  {ruta.name}")
@@ -0,0 +1,24 @@
+# Aplicacion/nucleo_conversion.py
+
+"""
+Conversión de un SKU completo (Características e Información Adicional) en una sola tarea, para
+que cada proceso del pool visite la carpeta del SKU una vez y genere ambas salidas.
+"""
+
+from nucleo_caracteristicas import convertir_caracteristicas
+from nucleo_info_adicional import convertir_info_adicional
+
+# ============================================================
+# Conversión de un SKU
+# ============================================================
+def convertir_sku(sku, ruta_caracteristicas, ruta_info_adicional, plantilla_caracteristicas, plantilla_info_adicional):
+    """
+    Convierte las secciones indicadas del SKU; una ruta en None significa que esa sección no requiere
+    conversión. Devuelve {"sku", "caracteristicas", "info_adicional"} con el resultado de cada núcleo
+    (o None).
+    """
+    return {
+        "sku": sku,
+        "caracteristicas": convertir_caracteristicas(sku, ruta_caracteristicas, plantilla_caracteristicas) if ruta_caracteristicas else None,
+        "info_adicional": convertir_info_adicional(sku, ruta_info_adicional, plantilla_info_adicional) if ruta_info_adicional else None,
+    }
@@ -0,0 +1,203 @@
+# Aplicacion/nucleo_info_adicional.py
+
+"""
+Núcleo de conversión de Información Adicional: analiza las secciones 'ficha_tecnica' del HTML
+descargado de CT y las convierte en subacordeones con la plantilla PlantillaInfoAdicional.html.
+
+No abre conexiones ni configura logging al importarse, para poder usarse desde los procesos de
+conversion_paralela.
+"""
+
+import os
+import hashlib
+import logging
+
+from plantillas import obtener_plantilla
+from parser_html import leer_html, extraer_fragmento
+
+# Elementos de PlantillaInfoAdicional.html que se suben al metafield 'infoadicional'
+SELECTORES_METAFIELD = ("div.info-adicional-main", "div.info-adicional-main-content")
+
+# ============================================================
+# Análisis del HTML
+# ============================================================
+def replace_icons_with_text(value_div):
+    """
+    Reemplaza los íconos de FontAwesome con los textos "Si" y "No".
+    :param value_div: Objeto BeautifulSoup que contiene el valor.
+    :return: Texto reemplazado.
+    """
+    if not value_div:
+        return ""
+    
+    # Encontrar todos los íconos dentro de value_div
+    icons = value_div.find_all('i')
+    for icon in icons:
+        icon_classes = icon.get('class', [])
+        if 'fa-check-circle' in icon_classes and 'text-green' in icon_classes:
+            icon.replace_with('Si')  # Reemplazar el ícono con 'Si'
+        elif 'fa-times-circle' in icon_classes and 'text-red' in icon_classes:
+            icon.replace_with('No')  # Reemplazar el ícono con 'No'
+    
+    # Obtener el texto limpio después de reemplazar los íconos
+    return value_div.get_text(separator=' ', strip=True)
+
+def fila_dl(label, value):
+    """Par <dt>/<dd> de una fila del subacordeón."""
+    return f"                    <dt>{label}:</dt>\n                    <dd>{value}</dd>\n"
+
+def build_subaccordion(title, dl_content):
+    """
+    Construye el bloque HTML de un subacordeón dado un título y contenido.
+    :param title: Título del subacordeón.
+    :param dl_content: Contenido en formato <dl>.
+    :return: HTML string del subacordeón.
+    """
+    subaccordion_html = f"""
+        <div class="info-adicional-main-subaccordion">
+            <div class="info-adicional-main-subaccordion-header">
+                {title}
+                <!-- Flecha para indicar subacordeón -->
+                <svg aria-hidden="true" focusable="false" viewBox="0 0 10 6" style="width: 10px; height: 6px;">
+                    <path fill-rule="evenodd" clip-rule="evenodd" d="M9.354.646a.5.5 0 00-.708 0L5 4.293 1.354.646a.5.5 0 00-.708.708l4 4a.5.5 0 00.708 0l4-4a.5.5 0 000-.708z" fill="currentColor"></path>
+                </svg>
+            </div>
+            <div class="info-adicional-main-subaccordion-content">
+                <dl>
+{dl_content}                </dl>
+            </div>
+        </div>
+    """
+    return subaccordion_html
+
+def parse_section_to_subaccordion(section):
+    """
+    Extrae los subacordeones de una sección HTML.
+    :param section: Objeto BeautifulSoup que representa la sección.
+    :return: Lista de secciones {"titulo", "filas": [[etiqueta, valor], ...]}.
+    """
+    secciones = []
+
+    # Cada 'ct-section' puede contener varias 'col-sm-6', cada una con un h5 y varias filas
+    col_sm_6_divs = section.find_all('div', class_='col-sm-6')
+    for col in col_sm_6_divs:
+        # Obtener el título del subacordeón
+        h5 = col.find('h5')
+        if not h5:
+            logging.warning(f"No se encontró un <h5> en una 'col-sm-6' dentro de la sección {section}")
+            continue  # Si no hay título, omitir
+
+        title = h5.get_text(strip=True)
+        if not title:
+            logging.warning(f"El título en <h5> está vacío en la sección {section}")
+            continue
+
+        # Obtener todas las filas dentro de esta columna
+        rows = col.find_all('div', class_='row')
+        if not rows:
+            logging.warning(f"No se encontraron filas en la columna '{title}' dentro de la sección {section}")
+            continue
+
+        filas = []
+        for row in rows:
+            # Cada fila tiene dos 'div's: uno para la etiqueta y otro para el valor
+            cols = row.find_all('div', recursive=False)
+            if len(cols) < 2:
+                logging.warning(f"Fila con menos de dos columnas en la columna '{title}' dentro de la sección {section}")
+                continue  # Si no hay al menos dos columnas, omitir
+
+            # Extraer la etiqueta (dt)
+            label_div = cols[0]
+            label_strong = label_div.find('strong')
+            if not label_strong:
+                logging.warning(f"No se encontró un <strong> en la etiqueta de la fila en la columna '{title}'")
+                continue  # Si no hay <strong>, omitir
+
+            label = label_strong.get_text(strip=True).rstrip(':')
+            if not label:
+                logging.warning(f"Etiqueta vacía en la fila de la columna '{title}'")
+                continue
+
+            # Extraer el valor (dd)
+            value_div = cols[1]
+            value = replace_icons_with_text(value_div)
+            if not value:
+                logging.warning(f"Valor vacío en la fila de la columna '{title}'")
+                value = "N/A"  # Asignar un valor predeterminado si está vacío
+
+            filas.append([label, value])
+
+        if filas:
+            secciones.append({"titulo": title, "filas": filas})
+        else:
+            logging.warning(f"No se generó contenido dl para la columna '{title}' en la sección {section}")
+
+    return secciones
+
+def extraer_secciones(file_path, parser=None):
+    """
+    Extrae las secciones de información adicional (título y pares etiqueta/valor) de un archivo HTML.
+    :param file_path: Ruta al archivo HTML.
+    :param parser: Analizador de BeautifulSoup; por defecto el de parser_html.
+    :return: Lista de secciones {"titulo", "filas"}; vacía si no hay fichas o hubo un error.
+    """
+    try:
+        soup = leer_html(file_path, parser)
+
+        # Encontrar todas las secciones con id 'ficha_tecnica' y clase 'ct-section'
+        ficha_tecnica_sections = soup.find_all('div', id='ficha_tecnica', class_='ct-section')
+        if not ficha_tecnica_sections:
+            logging.warning(f"No se encontraron secciones con id 'ficha_tecnica' en {file_path}")
+            return []
+
+        return [seccion for section in ficha_tecnica_sections for seccion in parse_section_to_subaccordion(section)]
+    except Exception as e:
+        logging.error(f"Error al procesar el archivo HTML {file_path}: {e}")
+        return []
+
+def secciones_a_html(secciones):
+    """Construye los subacordeones de una lista de secciones."""
+    return "".join(
+        build_subaccordion(seccion["titulo"], "".join(fila_dl(label, value) for label, value in seccion["filas"]))
+        for seccion in secciones
+    )
+
+def process_html_file(file_path, parser=None):
+    """
+    Procesa un archivo HTML para convertir sus tablas en subacordeones.
+    :param file_path: Ruta al archivo HTML.
+    :param parser: Analizador de BeautifulSoup; por defecto el de parser_html.
+    :return: HTML string con los subacordeones.
+    """
+    return secciones_a_html(extraer_secciones(file_path, parser))
+
+# ============================================================
+# Conversión de un SKU
+# ============================================================
+def convertir_info_adicional(sku, ruta_entrada, ruta_plantilla):
+    """
+    Convierte el HTML de información adicional de un SKU.
+    Se ejecuta en los procesos del pool: no toca la base de datos ni escribe archivos. Devuelve
+    el contenido a escribir (bytes, con los saltos de línea del sistema como al escribir en modo texto)
+    y su tamaño en KB; contenido queda en None si no se generaron subacordeones. 'especificaciones'
+    trae las secciones extraídas y el fragmento del metafield para Especificaciones_{sku}.json.
+    """
+    resultado = {"sku": sku, "ruta_entrada": ruta_entrada, "contenido": None, "tamano_kb": 0, "error": None,
+                 "especificaciones": None}
+    secciones = extraer_secciones(ruta_entrada)
+    subaccordions = secciones_a_html(secciones)
+    if not subaccordions.strip():
+        return resultado
+    try:
+        rendered_html = obtener_plantilla(ruta_plantilla).render(subaccordions=subaccordions)
+    except Exception as e:
+        resultado["error"] = f"Error al renderizar la plantilla para SKU {sku}: {e}"
+        return resultado
+    resultado["contenido"] = rendered_html.replace("\n", os.linesep).encode("utf-8")
+    resultado["tamano_kb"] = round(len(resultado["contenido"]) / 1024, 2)
+    resultado["especificaciones"] = {
+        "html_sha256": hashlib.sha256(resultado["contenido"]).hexdigest(),
+        "secciones": secciones,
+        "fragmento": extraer_fragmento(rendered_html, *SELECTORES_METAFIELD),
+    }
+    return resultado
@@ -0,0 +1,90 @@
+# Aplicacion/pagina_ct.py
+
+"""
+Detección de página de producto lista en ctonline.mx.
+
+Selenium se usa para las páginas cuyas secciones no vienen en el HTML del servidor, así que hay que
+esperar a que el JavaScript las genere. Se espera una sola vez a que la página termine de cargar
+(document.readyState 'complete') y a que la cantidad de elementos de todas las secciones deje de
+cambiar: ESTABILIDAD_SECCIONES segundos si ya están 'panel-body' y 'ct-section', o
+ESPERA_SECCION_FALTANTE si falta alguna, por si el JavaScript la agrega después. Luego se leen las
+secciones con find_elements, que no espera. Así un 'ct-section' que aparece después del 'panel-body'
+no se pierde, y una página sin secciones termina poco después de cargar en lugar de agotar el tiempo.
+"""
+
+import time
+import logging
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+
+# ============================================================
+# Constantes
+# ============================================================
+TIMEOUT_PAGINA = 15
+# Segundos sin cambios en las secciones para dar la página por lista, con ambas secciones o con alguna faltante
+ESTABILIDAD_SECCIONES   = 0.5
+ESPERA_SECCION_FALTANTE = 2.5
+
+SELECTORES_SECCIONES = {
+    "caracteristicas":       (By.CLASS_NAME, "panel-body"),
+    "informacion_adicional": (By.CLASS_NAME, "ct-section"),
+    "pdf":                   (By.XPATH, "//a[contains(@href, 'fichaTecnicaPDFDescargar')]"),
+}
+
+# Estado de carga y cantidad de elementos de cada sección, en una sola llamada al navegador
+SCRIPT_ESTADO = """
+return [document.readyState,
+        document.getElementsByClassName('panel-body').length,
+        document.getElementsByClassName('ct-section').length,
+        document.querySelectorAll("a[href*='fichaTecnicaPDFDescargar']").length];
+"""
+
+# ============================================================
+# Funciones
+# ============================================================
+class SeccionesEstables:
+    """
+    Condición para WebDriverWait: la página terminó de cargar y la cantidad de elementos de todas las
+    secciones no cambió durante 'estabilidad' segundos ('espera_faltante' si falta alguna sección).
+    """
+
+    def __init__(self, estabilidad=ESTABILIDAD_SECCIONES, espera_faltante=ESPERA_SECCION_FALTANTE):
+        self.estabilidad = estabilidad
+        self.espera_faltante = espera_faltante
+        self._ultimo = None
+        self._desde = None
+
+    def __call__(self, driver):
+        estado = driver.execute_script(SCRIPT_ESTADO)
+        ahora = time.monotonic()
+        if estado != self._ultimo:
+            self._ultimo = estado
+            self._desde = ahora
+            return False
+        listo, paneles, secciones = estado[0] == "complete", estado[1], estado[2]
+        espera = self.estabilidad if paneles and secciones else self.espera_faltante
+        return listo and ahora - self._desde >= espera
+
+def esperar_pagina_lista(driver, timeout=TIMEOUT_PAGINA):
+    """Espera una sola vez a que la página cargue y sus secciones dejen de cambiar. Devuelve False si se agotó el tiempo."""
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.2).until(SeccionesEstables())
+        return True
+    except TimeoutException:
+        return False
+
+def leer_secciones_producto(driver, sku="", timeout=TIMEOUT_PAGINA):
+    """
+    Espera a que la página del producto esté lista y devuelve {seccion: [elementos]} para cada
+    selector de SELECTORES_SECCIONES. Una sección ausente queda como lista vacía.
+    """
+    inicio = time.perf_counter()
+    if not esperar_pagina_lista(driver, timeout):
+        logging.warning(f"La página del SKU {sku} no terminó de cargar sus secciones en {timeout} s. Se revisan las secciones disponibles.")
+    secciones = {nombre: driver.find_elements(*selector) for nombre, selector in SELECTORES_SECCIONES.items()}
+    faltantes = [nombre for nombre, elementos in secciones.items() if not elementos]
+    logging.debug(f"Página del SKU {sku} lista en {time.perf_counter() - inicio:.2f} s"
+                  + (f" (sin: {', '.join(faltantes)})" if faltantes else ""))
+    return secciones
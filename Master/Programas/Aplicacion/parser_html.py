@@ -0,0 +1,131 @@
+# Aplicacion/parser_html.py
+
+"""
+Analizador HTML común para los scripts de Conversion y Centinela_Subir_Tabla.
+
+Usa el constructor 'lxml' de BeautifulSoup (en C, varias veces más rápido que 'html.parser') y
+regresa a 'html.parser' si lxml no está instalado. La variable de entorno PARSER_HTML permite forzar
+uno u otro. Los árboles resultantes se recorren con la misma API de BeautifulSoup, así que el resto
+del código no cambia.
+
+lxml y html.parser no construyen siempre el mismo árbol: un <p> dentro de otro <p> queda anidado con
+html.parser, mientras que lxml cierra el primero y los deja como hermanos. La conversión de párrafos
+depende de ese anidamiento, así que leer_html acepta una condición 'requiere_compatible' y vuelve a
+analizar con html.parser los documentos que la cumplen (las fichas sólo con párrafos, que son
+pequeñas); las fichas con tablas, que son la mayoría, se quedan con lxml. Las páginas de muestra de
+muestras_ct/ y sus salidas esperadas (generadas con html.parser, el analizador anterior) lo comprueban:
+
+    python parser_html.py              compara la salida actual con muestras_ct/esperado
+    python parser_html.py --regenerar  vuelve a generar muestras_ct/esperado con html.parser
+"""
+
+import os
+import sys
+import logging
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+# ============================================================
+# Selección del analizador
+# ============================================================
+PARSER_COMPATIBLE = "html.parser"
+
+def _parser_disponible(nombre):
+    if nombre == "lxml":
+        try:
+            import lxml  # noqa: F401
+        except ImportError:
+            return False
+    return True
+
+_preferido = os.getenv("PARSER_HTML", "lxml")
+PARSER = _preferido if _parser_disponible(_preferido) else PARSER_COMPATIBLE
+
+# ============================================================
+# Funciones
+# ============================================================
+def crear_soup(contenido, parser=None):
+    """Analiza una cadena o archivo abierto con el analizador configurado."""
+    return BeautifulSoup(contenido, parser or PARSER)
+
+def leer_html(ruta, parser=None, requiere_compatible=None):
+    """
+    Lee y analiza un archivo HTML en UTF-8. Si se da 'requiere_compatible' (función que recibe el árbol)
+    y devuelve True, el archivo se vuelve a analizar con html.parser.
+    """
+    with open(ruta, "r", encoding="utf-8") as archivo:
+        contenido = archivo.read()
+    soup = crear_soup(contenido, parser)
+    if requiere_compatible and (parser or PARSER) != PARSER_COMPATIBLE and requiere_compatible(soup):
+        soup = crear_soup(contenido, PARSER_COMPATIBLE)
+    return soup
+
+def extraer_fragmento(html, main_selector, content_selector):
+    """
+    Encabezado principal y contenido del acordeón de un HTML convertido, tal como se suben al
+    metafield de Shopify. Devuelve "" si no se encuentra alguno de los dos selectores.
+    """
+    soup = crear_soup(html)
+    main_element = soup.select_one(main_selector)
+    content_element = soup.select_one(content_selector)
+    if main_element and content_element:
+        return str(main_element) + "\n" + str(content_element)
+    return ""
+
+# ============================================================
+# Comparación con las muestras de CT
+# ============================================================
+DIRECTORIO_MUESTRAS = Path(__file__).resolve().parent / "muestras_ct"
+DIRECTORIO_ESPERADO = DIRECTORIO_MUESTRAS / "esperado"
+
+def _convertidores():
+    """Función de conversión de cada subcarpeta de muestras_ct."""
+    from nucleo_caracteristicas import process_html_file as convertir_caracteristicas
+    from nucleo_info_adicional import process_html_file as convertir_info_adicional
+    return {"Caracteristicas": convertir_caracteristicas, "InformacionAdicional": convertir_info_adicional}
+
+def _muestras():
+    """(ruta relativa, ruta de la muestra, función de conversión) de cada página de muestra."""
+    for grupo, convertir in _convertidores().items():
+        for ruta in sorted((DIRECTORIO_MUESTRAS / grupo).glob("*.html")):
+            yield f"{grupo}/{ruta.name}", ruta, convertir
+
+def regenerar_esperados():
+    """Genera muestras_ct/esperado con html.parser, el analizador que usaban los scripts antes de lxml."""
+    for relativa, ruta, convertir in _muestras():
+        destino = DIRECTORIO_ESPERADO / relativa
+        destino.parent.mkdir(parents=True, exist_ok=True)
+        with open(destino, "w", encoding="utf-8") as archivo:
+            archivo.write(convertir(str(ruta), parser=PARSER_COMPATIBLE))
+        print(f"Generado: {destino}")
+
+def comparar_muestras(parser=None):
+    """
+    Convierte las muestras con el analizador indicado (por defecto el configurado) y compara con
+    muestras_ct/esperado. Devuelve True si todas las salidas son idénticas.
+    """
+    parser = parser or PARSER
+    todo_igual = True
+    for relativa, ruta, convertir in _muestras():
+        try:
+            with open(DIRECTORIO_ESPERADO / relativa, "r", encoding="utf-8") as archivo:
+                esperado = archivo.read()
+        except FileNotFoundError:
+            print(f"Sin salida esperada: {relativa} (ejecute con --regenerar)")
+            todo_igual = False
+            continue
+        if convertir(str(ruta), parser=parser) == esperado:
+            print(f"Igual: {relativa}")
+        else:
+            print(f"Diferente: {relativa}")
+            todo_igual = False
+    return todo_igual
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.ERROR, format='%(asctime)s - %(levelname)s - %(message)s')
+    if "--regenerar" in sys.argv[1:]:
+        regenerar_esperados()
+        sys.exit(0)
+    print(f"Analizador: {PARSER}")
+    sys.exit(0 if comparar_muestras() else 1)
@@ -0,0 +1,38 @@
+# Aplicacion/plantillas.py
+
+"""
+Registro de plantillas Jinja compartido por los scripts de Conversion y de Shopify.
+
+Cada directorio de plantillas tiene un solo Environment por proceso, así que cada plantilla se
+analiza y compila una vez y las siguientes llamadas la toman de la caché del Environment. El código
+compilado se guarda además en disco (FileSystemBytecodeCache), de modo que los procesos del pool de
+conversión y las siguientes ejecuciones no vuelven a compilarla. El directorio de esa caché se puede
+indicar con CACHE_PLANTILLAS; por defecto es el temporal del sistema.
+"""
+
+import os
+from pathlib import Path
+from functools import lru_cache
+
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
+
+# ============================================================
+# Registro
+# ============================================================
+@lru_cache(maxsize=None)
+def obtener_entorno(directorio):
+    """Environment único por directorio de plantillas."""
+    directorio_cache = os.getenv("CACHE_PLANTILLAS")
+    if directorio_cache:
+        Path(directorio_cache).mkdir(parents=True, exist_ok=True)
+    # Las plantillas no cambian durante una ejecución: auto_reload=False evita un stat por cada uso
+    return Environment(
+        loader=FileSystemLoader(directorio),
+        bytecode_cache=FileSystemBytecodeCache(directorio_cache),
+        auto_reload=False,
+    )
+
+def obtener_plantilla(ruta_plantilla):
+    """Devuelve la plantilla compilada de ruta_plantilla (compilada una sola vez por proceso)."""
+    ruta = Path(ruta_plantilla)
+    return obtener_entorno(str(ruta.parent)).get_template(ruta.name)
@@ -0,0 +1,187 @@
+# Aplicacion/sesion_ct.py
+
+"""
+Sesión autenticada de ctonline.mx compartida por los scripts de descarga de Centinela.
+
+Después de cada login las cookies y el User-Agent del navegador se guardan en
+Configuracion/sesion_ct.json. Las siguientes ejecuciones reutilizan esas cookies (en requests
+y en Selenium) y sólo vuelven a iniciar sesión cuando expiran. La ruta de chromedriver también
+se guarda, para no llamar a chromedriver_autoinstaller en cada arranque.
+"""
+
+import json
+import time
+import logging
+import threading
+from pathlib import Path
+
+import requests
+import chromedriver_autoinstaller
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from config import CT_EMAIL_CENTINELA, CT_PASSWORD_CENTINELA, DIRECTORIOS
+
+# ============================================================
+# Constantes
+# ============================================================
+URL_INICIO = "https://ctonline.mx/"
+URL_LOGIN  = "https://ctonline.mx/iniciar/correo"
+RUTA_SESION = Path(DIRECTORIOS["Configuracion"]) / "sesion_ct.json"
+
+# Segundos de margen antes de la expiración de una cookie para considerarla vencida
+MARGEN_EXPIRACION = 300
+TIMEOUT_LOGIN = 20
+
+_lock_estado = threading.Lock()
+
+# ============================================================
+# Persistencia del estado
+# ============================================================
+def cargar_estado():
+    """Lee el estado guardado (cookies, user_agent, chromedriver). Devuelve {} si no existe o está dañado."""
+    try:
+        with open(RUTA_SESION, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def guardar_estado(**cambios):
+    """Actualiza las claves indicadas del estado guardado."""
+    with _lock_estado:
+        estado = cargar_estado()
+        estado.update(cambios)
+        temporal = RUTA_SESION.with_suffix(".tmp")
+        with open(temporal, "w", encoding="utf-8") as f:
+            json.dump(estado, f, ensure_ascii=False, indent=4)
+        temporal.replace(RUTA_SESION)
+
+# ============================================================
+# chromedriver
+# ============================================================
+def obtener_chromedriver(forzar=False):
+    """
+    Devuelve la ruta de chromedriver. Usa la guardada si el archivo sigue existiendo; con forzar=True
+    (p. ej. si Chrome se actualizó y el driver ya no coincide) vuelve a instalarlo.
+    """
+    ruta_guardada = cargar_estado().get("chromedriver")
+    if not forzar and ruta_guardada and Path(ruta_guardada).is_file():
+        return ruta_guardada
+    ruta = chromedriver_autoinstaller.install(path=str(DIRECTORIOS["Configuracion"]))
+    guardar_estado(chromedriver=ruta)
+    return ruta
+
+# ============================================================
+# Cookies
+# ============================================================
+def cookies_vigentes(cookies, margen=MARGEN_EXPIRACION):
+    """Comprobación local (sin red): hay cookies y ninguna con fecha de expiración vence dentro del margen."""
+    if not cookies:
+        return False
+    limite = time.time() + margen
+    return all(cookie.get("expiry") is None or cookie["expiry"] > limite for cookie in cookies)
+
+def crear_sesion_http(cookies, user_agent=None):
+    """Crea una sesión de requests (keep-alive) con las cookies indicadas."""
+    sesion = requests.Session()
+    if user_agent:
+        sesion.headers["User-Agent"] = user_agent
+    for cookie in cookies:
+        sesion.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain"), path=cookie.get("path", "/"))
+    return sesion
+
+def sesion_desde_driver(driver, guardar=True):
+    """Crea una sesión de requests con las cookies y el User-Agent del navegador (y opcionalmente las guarda)."""
+    cookies = driver.get_cookies()
+    user_agent = driver.execute_script("return navigator.userAgent;")
+    if guardar:
+        guardar_estado(cookies=cookies, user_agent=user_agent, fecha_login=time.strftime("%Y-%m-%d %H:%M:%S"))
+    return crear_sesion_http(cookies, user_agent)
+
+def sesion_http_valida(sesion):
+    """
+    Validación barata con una sola petición: con la sesión iniciada, el sitio no deja permanecer
+    en la página de login y redirige fuera de /iniciar.
+    """
+    try:
+        respuesta = sesion.get(URL_LOGIN, timeout=15)
+        return respuesta.status_code == 200 and "/iniciar" not in respuesta.url
+    except requests.exceptions.RequestException as e:
+        logging.warning(f"No se pudo validar la sesión guardada de CT: {e}")
+        return False
+
+# ============================================================
+# Login en Selenium
+# ============================================================
+def login(driver):
+    """Inicia sesión en CT con esperas explícitas y guarda las cookies resultantes. Devuelve True si tuvo éxito."""
+    try:
+        driver.get(URL_LOGIN)
+        campo_correo = WebDriverWait(driver, TIMEOUT_LOGIN).until(EC.presence_of_element_located((By.NAME, "correo")))
+        campo_correo.send_keys(CT_EMAIL_CENTINELA)
+        driver.find_element(By.NAME, "password").send_keys(CT_PASSWORD_CENTINELA + Keys.RETURN)
+        WebDriverWait(driver, TIMEOUT_LOGIN).until(lambda d: "/iniciar" not in d.current_url)
+        sesion_desde_driver(driver)
+        logging.info("Sesión iniciada correctamente.")
+        print("Sesión iniciada correctamente.")
+        return True
+    except Exception as e:
+        logging.error(f"Error al iniciar sesión: {e}")
+        print(f"Error al iniciar sesión: {e}")
+        return False
+
+def aplicar_cookies_guardadas(driver):
+    """Carga en el navegador las cookies guardadas si siguen vigentes. Devuelve True si se aplicaron."""
+    cookies = cargar_estado().get("cookies")
+    if not cookies_vigentes(cookies):
+        return False
+    # Selenium sólo acepta cookies del dominio que está abierto
+    driver.get(URL_INICIO)
+    for cookie in cookies:
+        try:
+            driver.add_cookie(cookie)
+        except Exception as e:
+            logging.debug(f"Cookie '{cookie.get('name')}' no aplicada: {e}")
+    return True
+
+def iniciar_sesion_navegador(driver):
+    """Deja el navegador con sesión iniciada: reutiliza las cookies guardadas y sólo hace login si ya no sirven."""
+    if aplicar_cookies_guardadas(driver):
+        driver.get(URL_LOGIN)
+        if "/iniciar" not in driver.current_url:
+            logging.info("Sesión de CT reutilizada desde las cookies guardadas.")
+            return True
+        logging.info("Las cookies guardadas de CT ya no son válidas. Se iniciará sesión.")
+    return login(driver)
+
+# ============================================================
+# Sesión HTTP
+# ============================================================
+def obtener_sesion_http(crear_driver):
+    """
+    Devuelve una sesión de requests autenticada. Si las cookies guardadas siguen vigentes y válidas no se
+    abre ningún navegador; si no, se usa crear_driver() (que debe dejar el navegador con sesión iniciada)
+    para obtener cookies nuevas y el navegador se cierra. Devuelve None si no se pudo iniciar sesión.
+    """
+    estado = cargar_estado()
+    cookies = estado.get("cookies")
+    if cookies_vigentes(cookies):
+        sesion = crear_sesion_http(cookies, estado.get("user_agent"))
+        if sesion_http_valida(sesion):
+            logging.info("Sesión HTTP de CT reutilizada desde las cookies guardadas.")
+            return sesion
+
+    driver = crear_driver()
+    if not driver:
+        return None
+    try:
+        if "/iniciar" in driver.current_url:
+            return None
+        return sesion_desde_driver(driver)
+    finally:
+        try:
+            driver.quit()
+        except Exception:
+            pass
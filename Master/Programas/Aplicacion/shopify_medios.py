@@ -0,0 +1,206 @@
+# Aplicacion/shopify_medios.py
+
+"""
+Subida de imágenes procesadas a Shopify mediante staged uploads.
+
+En lugar de enviar cada imagen en base64 a products/{id}/images.json, se reservan destinos con
+stagedUploadsCreate, cada archivo se envía por streaming desde disco (PUT) y todas las imágenes
+del producto se adjuntan con una sola mutación productCreateMedia. Cada script programa las subidas
+de distintos productos en un ThreadPoolExecutor que abre y cierra en su main(); los Future quedan en
+un diccionario por SKU y se resuelven antes de escribir los reportes.
+"""
+
+import os
+import time
+import mimetypes
+import threading
+
+import requests
+
+from Aplicacion.mensajes import print_message
+
+# ============================================================
+# Constantes
+# ============================================================
+EXTENSIONES_IMAGEN = ('.png', '.jpg', '.jpeg', '.gif', '.webp')
+MIME_POR_EXTENSION = {
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+}
+MAX_REINTENTOS = 5
+# Productos cuyas imágenes se suben a la vez mientras se crean los siguientes
+SUBIDAS_EN_PARALELO = 4
+
+STAGED_UPLOADS_CREATE = """
+mutation stagedUploadsCreate($input: [StagedUploadInput!]!) {
+  stagedUploadsCreate(input: $input) {
+    stagedTargets {
+      url
+      resourceUrl
+      parameters { name value }
+    }
+    userErrors { field message }
+  }
+}
+"""
+
+PRODUCT_CREATE_MEDIA = """
+mutation productCreateMedia($productId: ID!, $media: [CreateMediaInput!]!) {
+  productCreateMedia(productId: $productId, media: $media) {
+    media { alt mediaContentType status }
+    mediaUserErrors { field message }
+  }
+}
+"""
+
+# En los destinos PUT, Shopify devuelve los parámetros que deben viajar como encabezados
+ENCABEZADOS_PUT = {
+    'content_type': 'Content-Type',
+    'acl': 'x-goog-acl',
+}
+
+# ============================================================
+# Selección de imágenes
+# ============================================================
+def listar_imagenes_producto(ruta_imagenes):
+    """
+    Devuelve las imágenes de la carpeta del SKU en el orden de subida: primero la principal
+    (la que contiene '_full' o, en su defecto, la primera por nombre) y después el resto.
+    """
+    if not os.path.isdir(ruta_imagenes):
+        return []
+    imagenes = sorted(os.path.join(ruta_imagenes, img) for img in os.listdir(ruta_imagenes)
+                      if img.lower().endswith(EXTENSIONES_IMAGEN))
+    if not imagenes:
+        return []
+    principal = next((img for img in imagenes if "_full" in os.path.basename(img).lower()), imagenes[0])
+    return [principal] + [img for img in imagenes if img != principal]
+
+def resolver_subidas_pendientes(subidas, registros, clave='Cantidad de Imágenes Subidas'):
+    """
+    Espera todas las subidas programadas (SKU -> Future) y anota en el registro de cada SKU la
+    cantidad de imágenes adjuntadas. Las subidas de productos que no llegaron al reporte también
+    se esperan y se informan.
+    """
+    cantidades = {}
+    for sku, futuro in subidas.items():
+        try:
+            cantidades[sku] = futuro.result()
+        except Exception as e:
+            print_message(f"Error al subir imágenes del SKU '{sku}': {str(e)}", 'error')
+            cantidades[sku] = 0
+    subidas.clear()
+
+    for registro in registros:
+        if registro.get('SKU') in cantidades:
+            registro[clave] = cantidades.pop(registro['SKU'])
+    for sku, cantidad in cantidades.items():
+        print_message(f"Se adjuntaron {cantidad} imágenes al SKU '{sku}', pero el producto no quedó registrado como creado.", 'warning')
+
+# ============================================================
+# Subidor de medios
+# ============================================================
+class SubidorMediosShopify:
+    """Sube y adjunta imágenes a productos de Shopify; seguro para llamarse desde varios hilos."""
+
+    def __init__(self, graphql_url, access_token):
+        self.graphql_url = graphql_url
+        self.headers = {
+            "X-Shopify-Access-Token": access_token,
+            "Content-Type": "application/json"
+        }
+        self._local = threading.local()
+
+    def _sesion(self):
+        # requests.Session no es seguro entre hilos; cada hilo del pool mantiene la suya
+        if not hasattr(self._local, 'sesion'):
+            self._local.sesion = requests.Session()
+        return self._local.sesion
+
+    def _graphql(self, query, variables):
+        for intento in range(MAX_REINTENTOS):
+            response = self._sesion().post(self.graphql_url, json={"query": query, "variables": variables},
+                                           headers=self.headers, timeout=30)
+            if response.status_code == 429:
+                espera = float(response.headers.get('Retry-After', 2 ** intento))
+                print_message(f"Límite de tasa en GraphQL. Reintentando en {espera:.0f} s...", 'warning')
+                time.sleep(espera)
+                continue
+            response.raise_for_status()
+            data = response.json()
+            errores = data.get('errors') or []
+            if any(error.get('extensions', {}).get('code') == 'THROTTLED' for error in errores):
+                time.sleep(2 ** intento)
+                continue
+            if errores:
+                raise RuntimeError(f"Error de GraphQL: {errores}")
+            return data['data']
+        raise RuntimeError("Se agotaron los reintentos por límite de tasa en GraphQL.")
+
+    def _enviar_archivo(self, destino, ruta_imagen, mime_type):
+        headers = {"Content-Type": mime_type}
+        for parametro in destino.get('parameters', []):
+            headers[ENCABEZADOS_PUT.get(parametro['name'], parametro['name'])] = parametro['value']
+        # Pasar el archivo abierto hace que requests lo envíe por bloques, sin cargarlo completo en memoria
+        with open(ruta_imagen, 'rb') as archivo:
+            response = self._sesion().put(destino['url'], data=archivo, headers=headers, timeout=120)
+        response.raise_for_status()
+
+    def subir_imagenes(self, product_id, rutas_imagenes, alt=''):
+        """
+        Sube las imágenes indicadas y las adjunta al producto en una sola mutación.
+        La primera ruta queda como imagen principal. Devuelve la cantidad de imágenes adjuntadas.
+        """
+        if not rutas_imagenes:
+            return 0
+
+        inicio = time.perf_counter()
+        entradas = []
+        for ruta in rutas_imagenes:
+            extension = os.path.splitext(ruta)[1].lower()
+            entradas.append({
+                "resource": "IMAGE",
+                "filename": os.path.basename(ruta),
+                "mimeType": MIME_POR_EXTENSION.get(extension) or mimetypes.guess_type(ruta)[0] or 'application/octet-stream',
+                "fileSize": str(os.path.getsize(ruta)),
+                "httpMethod": "PUT"
+            })
+
+        resultado = self._graphql(STAGED_UPLOADS_CREATE, {"input": entradas})['stagedUploadsCreate']
+        if resultado['userErrors']:
+            print_message(f"Error al reservar la subida de imágenes del producto {product_id}: {resultado['userErrors']}", 'error')
+            return 0
+
+        medios = []
+        for ruta, entrada, destino in zip(rutas_imagenes, entradas, resultado['stagedTargets']):
+            try:
+                self._enviar_archivo(destino, ruta, entrada['mimeType'])
+                medios.append({
+                    "originalSource": destino['resourceUrl'],
+                    "mediaContentType": "IMAGE",
+                    "alt": alt
+                })
+            except (requests.exceptions.RequestException, OSError) as e:
+                print_message(f"Error al enviar la imagen '{os.path.basename(ruta)}': {str(e)}", 'error')
+
+        if not medios:
+            return 0
+
+        resultado = self._graphql(PRODUCT_CREATE_MEDIA, {
+            "productId": f"gid://shopify/Product/{product_id}",
+            "media": medios
+        })['productCreateMedia']
+        if resultado['mediaUserErrors']:
+            print_message(f"Errores al adjuntar imágenes al producto {product_id}: {resultado['mediaUserErrors']}", 'error')
+
+        imagenes_subidas = len(resultado.get('media') or [])
+        bytes_enviados = sum(int(entrada['fileSize']) for entrada in entradas)
+        print_message(f"Subida del producto {product_id}: {time.perf_counter() - inicio:.2f} s, {round(bytes_enviados / 1024)} KB enviados", 'debug')
+        if imagenes_subidas == len(rutas_imagenes):
+            print_message(f"--- Se subieron correctamente las {imagenes_subidas} imágenes del producto {product_id} ---", 'info')
+        else:
+            print_message(f"--- Se esperaba subir {len(rutas_imagenes)} imágenes al producto {product_id}, pero se subieron {imagenes_subidas}. ---", 'warning')
+        return imagenes_subidas